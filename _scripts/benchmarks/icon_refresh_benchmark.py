@@ -0,0 +1,118 @@
+"""_scripts/benchmarks/icon_refresh_benchmark.py
+
+Measures the shared icon refresh scheduler against per-icon debounce timers.
+
+ThemedIcon used to allocate its own QTimer for a 50ms debounce; IconLoader now
+coalesces theme changes with one debounce timer and refreshes icons in batches,
+on-screen icons first. The benchmark reports:
+    memory   - resident memory per icon, and what the old per-icon timer cost on top
+    refresh  - time to the first on-screen batch and until every icon is refreshed
+
+Usage:
+    python _scripts/benchmarks/icon_refresh_benchmark.py [--icons 3000]
+
+Run with QT_QPA_PLATFORM=offscreen on headless machines.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import argparse
+import gc
+import os
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication, QGridLayout, QScrollArea, QWidget
+
+from _dev_tools import DebugLogger
+from app.style.icon import AppIcon, IconLoader, Name
+from app.style.icon.loader import REFRESH_DEBOUNCE_MS
+from app.style.theme.config import Mode
+from app.style.theme_controller import Theme
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────────────────────────────────────────
+def resident_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource  # POSIX only
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def legacy_timers(count: int) -> list:
+    """Allocate timers configured the way each ThemedIcon used to."""
+    timers = []
+    for _ in range(count):
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: None)
+        timers.append(timer)
+    return timers
+
+
+# ── Main ────────────────────────────────────────────────────────────────────────────────────────────────────
+def main():
+    parser = argparse.ArgumentParser(description="Icon refresh scheduler benchmark")
+    parser.add_argument("--icons", type=int, default=3000, help="Number of AppIcons to create")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    DebugLogger.set_log_level("warning")
+    Theme.setCustomColorMap(str(project_root / "app/style/theme/material-theme.json"), Mode.DARK)
+    icon_names = list(Name)
+
+    # ── Memory ──
+    gc.collect()
+    before = resident_bytes()
+    container = QWidget()
+    grid = QGridLayout(container)
+    icons = [AppIcon(icon_names[i % len(icon_names)]) for i in range(args.icons)]
+    for i, icon in enumerate(icons):
+        grid.addWidget(icon, i // 40, i % 40)
+    gc.collect()
+    per_icon = (resident_bytes() - before) / args.icons
+
+    before = resident_bytes()
+    timers = legacy_timers(args.icons)
+    gc.collect()
+    per_timer = (resident_bytes() - before) / args.icons
+    del timers
+
+    print(f"{args.icons} icons: {per_icon:,.0f} B/icon resident; "
+          f"per-icon debounce timer cost {per_timer:,.0f} B/icon "
+          f"({per_timer * args.icons / 1024:,.0f} KiB saved in total)")
+
+    # ── Refresh ──
+    scroll = QScrollArea()
+    scroll.setWidgetResizable(True)
+    scroll.setWidget(container)
+    scroll.resize(1200, 800)
+    scroll.show()
+    app.processEvents()
+
+    loader = IconLoader._get_instance()
+    start = time.perf_counter()
+    Theme.toggleThemeMode()
+    first_batch_ms = None
+    while loader.is_refreshing():
+        app.processEvents()
+        if first_batch_ms is None and loader.get_refresh_stats().get("batches"):
+            first_batch_ms = (time.perf_counter() - start) * 1000
+    total_ms = (time.perf_counter() - start) * 1000
+
+    stats = loader.get_refresh_stats()
+    print(f"refresh: {stats['icons']} icons ({stats['on_screen']} on screen) in {stats['batches']} batches; "
+          f"first batch after {first_batch_ms or 0:.1f}ms, all done after {total_ms:.1f}ms "
+          f"(includes the {REFRESH_DEBOUNCE_MS}ms debounce)")
+
+    scroll.close()
+
+
+if __name__ == "__main__":
+    main()
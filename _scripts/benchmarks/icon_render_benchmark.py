@@ -0,0 +1,96 @@
+"""_scripts/benchmarks/icon_render_benchmark.py
+
+Measures icon render time with and without the prerendered icon atlas.
+
+For each theme mode the benchmark requests every sprite the atlas holds (every
+icon x common size x palette role) from a cold SVGLoader cache, first rendering
+from SVG and then serving from the memory-mapped atlas, and reports:
+    render   - total time with SVG rendering
+    atlas    - total time with the atlas attached
+    swap     - time to activate an already-built atlas (what a theme toggle pays)
+It also checks the atlas sprites are pixel-identical to the rendered icons.
+
+Usage:
+    python _scripts/benchmarks/icon_render_benchmark.py [--rounds 3] [--rebuild]
+
+Run with QT_QPA_PLATFORM=offscreen on headless machines.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from PySide6.QtWidgets import QApplication
+
+from _dev_tools import DebugLogger
+from app.style.icon.atlas import IconAtlas, atlas_sprites
+from app.style.icon.svg_loader import SVGLoader
+from app.style.theme.config import Mode
+from app.style.theme.custom_color_loader import CustomColorLoader
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────────────────────────────────────────
+def render_all(sprites) -> tuple[float, list]:
+    """Request every sprite from a cold SVGLoader cache; return (ms, pixmaps)."""
+    SVGLoader.clear_cache()
+    SVGLoader.set_cache_limits(len(sprites) + 1)
+    start = time.perf_counter()
+    pixmaps = [SVGLoader.load(path, color, size) for path, color, size in sprites]
+    return (time.perf_counter() - start) * 1000, pixmaps
+
+
+# ── Main ────────────────────────────────────────────────────────────────────────────────────────────────────
+def main():
+    parser = argparse.ArgumentParser(description="Icon atlas render benchmark")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds per mode")
+    parser.add_argument("--rebuild", action="store_true", help="Delete persisted atlases first")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    DebugLogger.set_log_level("warning")
+    atlas = IconAtlas._get_instance()
+    if args.rebuild:
+        atlas.clear_cache()
+
+    theme_file = str(project_root / "app/style/theme/material-theme.json")
+    palettes = {mode: CustomColorLoader.load_from_file(theme_file, mode) for mode in (Mode.LIGHT, Mode.DARK)}
+
+    for mode, palette in palettes.items():
+        start = time.perf_counter()
+        atlas.build(palette)
+        print(f"{mode.value:>5}: atlas built in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    for mode, palette in palettes.items():
+        sprites = atlas_sprites(palette)
+
+        render_ms, atlas_ms, swap_ms = [], [], []
+        for _ in range(args.rounds):
+            atlas.detach()
+            elapsed, rendered = render_all(sprites)
+            render_ms.append(elapsed)
+
+            start = time.perf_counter()
+            atlas.activate(palette)
+            swap_ms.append((time.perf_counter() - start) * 1000)
+            elapsed, served = render_all(sprites)
+            atlas_ms.append(elapsed)
+
+        mismatches = sum(a.toImage() != b.toImage() for a, b in zip(rendered, served))
+        print(f"{mode.value:>5}: {len(sprites)} icons, {mismatches} pixel mismatches")
+        print(f"       render median {statistics.median(render_ms):8.1f}ms "
+              f"({statistics.median(render_ms) * 1000 / len(sprites):6.1f}us/icon)")
+        print(f"       atlas  median {statistics.median(atlas_ms):8.1f}ms "
+              f"({statistics.median(atlas_ms) * 1000 / len(sprites):6.1f}us/icon)")
+        print(f"       swap   median {statistics.median(swap_ms):8.1f}ms")
+
+    print(f"Atlas stats: {atlas.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
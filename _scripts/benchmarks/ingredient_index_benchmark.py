@@ -0,0 +1,106 @@
+"""_scripts/benchmarks/ingredient_index_benchmark.py
+
+Measures ingredient autocomplete cost per keystroke at several name counts.
+
+Synthetic ingredient names (one to three words) with random usage counts are loaded
+into an IngredientIndex, then sampled names are "typed" one character at a time.
+The benchmark reports, per size:
+    build    - time to build the index from (name, uses) rows
+    search   - median / p99 / max time of one top-k lookup per keystroke
+    scan     - median time of the previous approach (lowercase and split every
+               name per keystroke, as IngredientProxyModel.filterAcceptsRow did)
+    add      - time to add one new name incrementally
+
+Like timeit, the garbage collector is paused while timing, so a collection that
+happens to land on a keystroke does not show up as lookup cost.
+
+Usage:
+    python _scripts/benchmarks/ingredient_index_benchmark.py [--sizes 1000 10000 50000] [--typed 200] [--limit 20]
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import argparse
+import gc
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from _dev_tools import DebugLogger
+from app.core.services.ingredient_index import IngredientIndex
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────────────────────────────────────────
+def build_rows(count: int, rng: random.Random) -> list[tuple[str, int]]:
+    """Return `count` synthetic (name, uses) rows drawn from a shared vocabulary."""
+    vocabulary = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+        for _ in range(max(count // 5, 50))
+    ]
+    return [
+        (" ".join(rng.sample(vocabulary, rng.randint(1, 3))).title(), rng.randint(0, 50))
+        for _ in range(count)
+    ]
+
+
+def scan(names: list[str], text: str) -> list[str]:
+    """The per-keystroke scan the proxy model used to do."""
+    needle = text.strip().lower()
+    return [name for name in names if any(word.startswith(needle) for word in name.lower().split())]
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+# ── Main ────────────────────────────────────────────────────────────────────────────────────────────────────
+def main():
+    parser = argparse.ArgumentParser(description="Ingredient autocomplete benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000], help="Name counts")
+    parser.add_argument("--typed", type=int, default=200, help="Names typed per size")
+    parser.add_argument("--limit", type=int, default=20, help="Suggestions per keystroke")
+    args = parser.parse_args()
+
+    DebugLogger.set_log_level("warning")
+    rng = random.Random(42)
+
+    for size in args.sizes:
+        rows = build_rows(size, rng)
+        names = [name for name, _ in rows]
+        index = IngredientIndex()
+
+        start = time.perf_counter()
+        index.load(rows)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        search_us = []
+        scan_us = []
+        gc.collect()
+        gc.disable()
+        for name in rng.sample(names, min(args.typed, len(names))):
+            for i in range(1, len(name) + 1):
+                start = time.perf_counter()
+                index.search(name[:i], args.limit)
+                search_us.append((time.perf_counter() - start) * 1_000_000)
+            start = time.perf_counter()
+            scan(names, name[:2])
+            scan_us.append((time.perf_counter() - start) * 1_000_000)
+
+        start = time.perf_counter()
+        index.add([f"{names[0]} Extra"])
+        add_us = (time.perf_counter() - start) * 1_000_000
+        gc.enable()
+
+        print(f"{size:6d} names: build {build_ms:7.1f}ms   search median {statistics.median(search_us):6.1f}us "
+              f"p99 {percentile(search_us, 0.99):6.1f}us max {max(search_us):7.1f}us   "
+              f"scan median {statistics.median(scan_us):8.1f}us   add {add_us:6.1f}us")
+
+
+if __name__ == "__main__":
+    main()
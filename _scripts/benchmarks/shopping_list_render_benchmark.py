@@ -0,0 +1,117 @@
+"""_scripts/benchmarks/shopping_list_render_benchmark.py
+
+Measures shopping list render and toggle cost at several list sizes.
+
+The list is a ShoppingListModel shown by one ShoppingListView whose delegate paints
+every row, so no widgets are created per item and tooltips are only built when the
+view asks for ToolTipRole. The benchmark reports, per list size:
+    load     - time to reset the model and repaint the view
+    toggle   - time for one item toggle (model update + dataChanged + repaint)
+    tooltip  - cost of the first ToolTipRole request for one item
+
+Toggles are queued on the ShoppingWriteQueue; the queue is never flushed here, so
+no database is touched.
+
+Usage:
+    python _scripts/benchmarks/shopping_list_render_benchmark.py [--sizes 100 300 1000 3000] [--toggles 50]
+
+Run with QT_QPA_PLATFORM=offscreen on headless machines.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QScrollArea
+
+import app.ui.components  # noqa: F401 - must load before app.ui.utils, the two import each other
+from _dev_tools import DebugLogger
+from app.core.models import ShoppingItem
+from app.ui.services.shopping_write_queue import ShoppingWriteQueue
+from app.ui.views.shopping_list._shopping_model import ShoppingListModel
+from app.ui.views.shopping_list._shopping_view import ShoppingListView
+
+CATEGORIES = ["produce", "meat", "dairy", "pantry", "spices", "frozen", "bakery", "other"]
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────────────────────────────────────────
+def build_sections(count: int) -> tuple[list, dict]:
+    """Return (category, items) sections holding `count` transient recipe items, plus a breakdown map."""
+    grouped = {category: [] for category in CATEGORIES}
+    breakdown_map = {}
+    for i in range(count):
+        item = ShoppingItem(
+            id=i + 1,
+            ingredient_name=f"Ingredient {i + 1}",
+            quantity=1 + i % 4,
+            unit="cup",
+            category=CATEGORIES[i % len(CATEGORIES)],
+            source="recipe",
+            have=False,
+            state_key=f"ingredient {i + 1}::cup",
+        )
+        grouped[item.category].append(item)
+        breakdown_map[item.key()] = [(f"Recipe {r}", 1.0, "cup") for r in range(3)]
+    return list(grouped.items()), breakdown_map
+
+
+# ── Main ────────────────────────────────────────────────────────────────────────────────────────────────────
+def main():
+    parser = argparse.ArgumentParser(description="Shopping list render benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 1000, 3000], help="List sizes")
+    parser.add_argument("--toggles", type=int, default=50, help="Timed toggles per size")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    DebugLogger.set_log_level("warning")
+
+    model = ShoppingListModel()
+    view = ShoppingListView(model)
+    scroll = QScrollArea()
+    scroll.setWidgetResizable(True)
+    scroll.setWidget(view)
+    scroll.resize(1200, 900)
+    scroll.show()
+    app.processEvents()
+
+    for size in args.sizes:
+        sections, breakdown_map = build_sections(size)
+
+        start = time.perf_counter()
+        model.load(sections, breakdown_map)
+        app.processEvents()
+        load_ms = (time.perf_counter() - start) * 1000
+
+        category_index = model.index(0, 0)
+        toggle_ms = []
+        for i in range(args.toggles):
+            index = model.index(i % model.rowCount(category_index), 0, category_index)
+            checked = index.data(Qt.CheckStateRole) == Qt.Checked
+            start = time.perf_counter()
+            model.setData(index, not checked, Qt.CheckStateRole)
+            app.processEvents()
+            toggle_ms.append((time.perf_counter() - start) * 1000)
+
+        index = model.index(model.rowCount(category_index) - 1, 0, category_index)
+        start = time.perf_counter()
+        index.data(Qt.ToolTipRole)
+        tooltip_us = (time.perf_counter() - start) * 1_000_000
+
+        print(f"{size:5d} items: load {load_ms:7.1f}ms   toggle median {statistics.median(toggle_ms):6.2f}ms "
+              f"max {max(toggle_ms):6.2f}ms   first tooltip {tooltip_us:6.1f}us")
+
+    queue = ShoppingWriteQueue._get_instance()
+    queue._take_pending()  # drop the benchmark's toggles instead of writing them
+    queue.shutdown()
+    scroll.close()
+
+
+if __name__ == "__main__":
+    main()
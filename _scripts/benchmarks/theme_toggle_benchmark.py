@@ -0,0 +1,174 @@
+"""_scripts/benchmarks/theme_toggle_benchmark.py
+
+Measures theme-toggle latency with the recipe browser's card grid showing 1k cards.
+
+Each toggle reports two numbers:
+    apply    - time spent inside Theme.toggleThemeMode() (stylesheet swap + re-polish)
+    settled  - time until the debounced, batched icon refresh has drained and the window repainted
+
+Usage:
+    python _scripts/benchmarks/theme_toggle_benchmark.py [--cards 1000] [--toggles 6] [--full]
+    python _scripts/benchmarks/theme_toggle_benchmark.py --check
+
+A light/dark toggle changes the QWidget-level colors, so it always takes the full
+stylesheet swap; --full additionally disables the scoped path for narrower changes.
+--check instead verifies that a narrow (scoped) switch keeps QSS specificity intact.
+Run with QT_QPA_PLATFORM=offscreen on headless machines.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from PySide6.QtCore import QEvent
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QApplication, QPushButton, QScrollArea
+
+from _dev_tools import DebugLogger
+from app.core.models import Recipe
+from app.style.icon.loader import IconLoader
+from app.style.theme.config import Mode
+from app.style.theme.style_sheet import StylesheetTemplate
+from app.style.theme.switch_engine import ThemeSwitchEngine
+from app.style.theme_controller import Theme
+from app.ui.components.composite.recipe_card import LayoutSize, create_recipe_card
+from app.ui.components.layout.flow_layout import FlowLayoutContainer
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────────────────────────────────────────
+def build_card_grid(count: int) -> QScrollArea:
+    """Build the browser's scroll area + flow layout populated with `count` transient recipes."""
+    container = FlowLayoutContainer()
+    for i in range(count):
+        card = create_recipe_card(LayoutSize.MEDIUM)
+        card.set_recipe(Recipe(
+            id=i + 1,
+            recipe_name=f"Benchmark Recipe {i + 1}",
+            recipe_category="Dinner",
+            meal_type="Dinner",
+            total_time=30 + i % 60,
+            servings=2 + i % 6,
+            is_favorite=bool(i % 3 == 0),
+        ))
+        container.addWidget(card)
+
+    scroll = QScrollArea()
+    scroll.setObjectName("RecipeBrowser")
+    scroll.setWidgetResizable(True)
+    scroll.setWidget(container)
+    scroll.resize(1600, 1000)
+    return scroll
+
+def wait_until_settled(app: QApplication, timeout_s: float = 30.0):
+    """Pump the event loop until queued icon refreshes have drained."""
+    loader = IconLoader._get_instance()
+    deadline = time.perf_counter() + timeout_s
+    app.processEvents()
+    while loader.is_refreshing() and time.perf_counter() < deadline:
+        app.processEvents()
+    app.processEvents()  # repaint
+
+def check_specificity(app: QApplication) -> bool:
+    """Switch a variable used by a type rule and confirm a more specific rule still wins.
+
+    `#Special` must stay red after `{accent}` changes, whether the button existed
+    before the switch (full swap) or is created after a scoped one (deferred full swap).
+
+    Returns:
+        bool: True if every widget ended up with the color the cascade gives it.
+    """
+    template = StylesheetTemplate("QPushButton { color: {accent}; }\n#Special { color: #ff0000; }")
+    failures = []
+
+    def expect(label: str, widget: QPushButton, expected: str, engine: ThemeSwitchEngine, strategy: str):
+        widget.ensurePolished()
+        actual = (widget.palette().color(QPalette.ButtonText).name(), engine.last_switch_stats.get("strategy"))
+        passed = actual == (expected, strategy)
+        print(f"{'ok  ' if passed else 'FAIL'} {label}: {actual[0]} after {actual[1]} switch "
+              f"(expected {expected} after {strategy})")
+        if not passed:
+            failures.append(label)
+
+    def switch(engine: ThemeSwitchEngine, accent: str):
+        variables = {"accent": accent}
+        engine.apply(template, variables, template.render(variables))
+        app.processEvents()
+
+    # existing #Special button: the override would beat it, so the switch must be full
+    engine = ThemeSwitchEngine()
+    plain, special = QPushButton("plain"), QPushButton("special")
+    special.setObjectName("Special")
+    switch(engine, "#00ff00")
+    switch(engine, "#0000ff")
+    expect("plain button", plain, "#0000ff", engine, "full")
+    expect("existing #Special", special, "#ff0000", engine, "full")
+
+    # no #Special yet: scoped switch, then a new #Special button forces a full swap
+    for widget in (plain, special):
+        widget.deleteLater()
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    engine = ThemeSwitchEngine()
+    plain = QPushButton("plain")
+    switch(engine, "#00ff00")
+    switch(engine, "#0000ff")
+    expect("plain button", plain, "#0000ff", engine, "scoped")
+    late = QPushButton("late")
+    late.setObjectName("Special")
+    late.ensurePolished()
+    app.processEvents()
+    expect("plain button after new #Special", plain, "#0000ff", engine, "full")
+    expect("new #Special", late, "#ff0000", engine, "full")
+
+    app.setStyleSheet("")
+    return not failures
+
+
+# ── Main ────────────────────────────────────────────────────────────────────────────────────────────────────
+def main():
+    parser = argparse.ArgumentParser(description="Theme toggle latency benchmark")
+    parser.add_argument("--cards", type=int, default=1000, help="Number of recipe cards to show")
+    parser.add_argument("--toggles", type=int, default=6, help="Number of light/dark toggles to time")
+    parser.add_argument("--full", action="store_true", help="Force full app-wide stylesheet swaps")
+    parser.add_argument("--check", action="store_true", help="Only check that scoped switches keep specificity")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    DebugLogger.set_log_level("warning")
+
+    if args.check:
+        sys.exit(0 if check_specificity(app) else 1)
+
+    Theme.setCustomColorMap(str(project_root / "app/style/theme/material-theme.json"), Mode.DARK)
+    Theme._get_instance()._switch_engine.force_full = args.full
+
+    start = time.perf_counter()
+    window = build_card_grid(args.cards)
+    window.show()
+    wait_until_settled(app)
+    print(f"Built {args.cards} cards in {(time.perf_counter() - start) * 1000:.0f}ms "
+          f"({len(app.allWidgets())} widgets)")
+
+    apply_ms, settled_ms = [], []
+    for _ in range(args.toggles):
+        start = time.perf_counter()
+        Theme.toggleThemeMode()
+        apply_ms.append((time.perf_counter() - start) * 1000)
+        wait_until_settled(app)
+        settled_ms.append((time.perf_counter() - start) * 1000)
+
+    stats = Theme._get_instance()._switch_engine.last_switch_stats
+    print(f"Strategy: {stats.get('strategy')} ({stats.get('changed')} variables changed)")
+    print(f"apply   median {statistics.median(apply_ms):8.1f}ms   max {max(apply_ms):8.1f}ms")
+    print(f"settled median {statistics.median(settled_ms):8.1f}ms   max {max(settled_ms):8.1f}ms")
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
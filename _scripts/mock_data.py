@@ -224,8 +224,7 @@ def add_random_images_to_recipe(recipe_data: dict, reference_images: list[str],
 def get_or_create_ingredient(session, name: str, category: str) -> Ingredient:
     """Get existing ingredient or create new one."""
     ingredient = session.query(Ingredient).filter_by(
-        ingredient_name=name,
-        ingredient_category=category
+        normalized_key=Ingredient.create_key(name, category)
     ).first()
 
     if not ingredient:
@@ -0,0 +1,142 @@
+"""Query plan report for repository queries.
+
+Runs a catalogue of repository calls inside a transaction that is rolled back,
+records the SQL each one emits and asks the database how it would execute it
+(`EXPLAIN QUERY PLAN` on SQLite, `EXPLAIN` elsewhere). Used by `manage.py db analyze`
+so that a dropped or unusable index shows up as a full table scan.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.database.db import DatabaseSession
+from app.core.dtos.recipe_dtos import RecipeFilterDTO
+from app.core.repositories.ingredient_repo import IngredientRepo
+from app.core.repositories.planner_repo import PlannerRepo
+from app.core.repositories.recipe_repo import RecipeRepo
+from app.core.repositories.shopping_repo import ShoppingRepo
+
+# ── Query Catalogue ──────────────────────────────────────────────────────────
+
+# sample arguments only shape the SQL; the rows they match do not need to exist
+SAMPLE_IDS = [1, 2, 3]
+SAMPLE_KEY = "onion::"
+
+REPOSITORY_QUERIES: List[Tuple[str, Callable[[Session], Any]]] = [
+    # shopping items
+    ("ShoppingRepo.aggregate_with_breakdown", lambda s: ShoppingRepo(s).aggregate_with_breakdown(SAMPLE_IDS)),
+    ("ShoppingRepo.get_shopping_item_by_id", lambda s: ShoppingRepo(s).get_shopping_item_by_id(1)),
+    ("ShoppingRepo.get_state_fields", lambda s: ShoppingRepo(s).get_state_fields(SAMPLE_IDS)),
+    ("ShoppingRepo.get_all_shopping_items", lambda s: ShoppingRepo(s).get_all_shopping_items(source="manual")),
+    ("ShoppingRepo.search_shopping_items", lambda s: ShoppingRepo(s).search_shopping_items(
+        source="recipe", category="produce", have=True)),
+    ("ShoppingRepo.write_have_status", lambda s: ShoppingRepo(s).write_have_status([(1, True), (2, False)])),
+    ("ShoppingRepo.clear_shopping_items", lambda s: ShoppingRepo(s).clear_shopping_items(source="recipe")),
+    ("ShoppingRepo.clear_completed_items", lambda s: ShoppingRepo(s).clear_completed_items()),
+    # shopping states
+    ("ShoppingRepo.get_shopping_state", lambda s: ShoppingRepo(s).get_shopping_state(SAMPLE_KEY)),
+    ("ShoppingRepo.get_checked_states", lambda s: ShoppingRepo(s).get_checked_states([SAMPLE_KEY, "salt::tsp"])),
+    ("ShoppingRepo.write_shopping_states", lambda s: ShoppingRepo(s).write_shopping_states(
+        [(SAMPLE_KEY, 1.0, "", True)])),
+    ("ShoppingRepo.bulk_update_states", lambda s: ShoppingRepo(s).bulk_update_states({SAMPLE_KEY: True})),
+    # recipes
+    ("RecipeRepo.get_by_id", lambda s: RecipeRepo(s).get_by_id(1)),
+    ("RecipeRepo.get_last_cooked_date", lambda s: RecipeRepo(s).get_last_cooked_date(1)),
+    ("RecipeRepo.recipe_exists", lambda s: RecipeRepo(s).recipe_exists("Pancakes", "Other")),
+    ("RecipeRepo.filter_recipes", lambda s: RecipeRepo(s).filter_recipes(
+        RecipeFilterDTO(recipe_category="Chicken", favorites_only=True))),
+    ("RecipeRepo.get_stats", lambda s: RecipeRepo(s).get_stats(datetime.now() - timedelta(days=30))),
+    # ingredients
+    ("IngredientRepo.find_by_name_category", lambda s: IngredientRepo(s).find_by_name_category("Onion", "produce")),
+    ("IngredientRepo.find_by_keys", lambda s: IngredientRepo(s).find_by_keys(["onion::produce", "salt::spices"])),
+    ("IngredientRepo.search_by_name", lambda s: IngredientRepo(s).search_by_name("oni")),
+    ("IngredientRepo.get_usage_by_id", lambda s: IngredientRepo(s).get_usage_by_id()),
+    ("IngredientRepo.merge_into", lambda s: IngredientRepo(s).merge_into({2: 1})),
+    # planner
+    ("PlannerRepo.get_saved_meal_plan_rows", lambda s: PlannerRepo(s).get_saved_meal_plan_rows()),
+    ("PlannerRepo.get_recipes_for_cards", lambda s: PlannerRepo(s).get_recipes_for_cards(SAMPLE_IDS)),
+    ("PlannerRepo.get_meals_by_recipe_id", lambda s: PlannerRepo(s).get_meals_by_recipe_id(1)),
+]
+
+
+@dataclass
+class QueryPlan:
+    """The statements one repository call emitted and the plan of each."""
+    label: str
+    statements: List[Tuple[str, List[str]]] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def scans(self) -> List[str]:
+        """Plan lines that read a whole table (SQLite `SCAN <table>` without an index)."""
+        return [
+            line for _, plan in self.statements for line in plan
+            if line.lstrip().startswith("SCAN") and " INDEX " not in line
+        ]
+
+
+# ── Analysis ─────────────────────────────────────────────────────────────────
+
+def run_analyze() -> None:
+    """Refresh the planner statistics (ANALYZE) and commit them."""
+    with DatabaseSession() as session:
+        session.execute(text("ANALYZE"))
+        session.commit()
+
+
+def explain_repository_queries() -> List[QueryPlan]:
+    """
+    Run every catalogued repository call and explain the SQL it emitted.
+
+    All calls share one transaction that is rolled back afterwards, so write
+    queries are explained against real tables without changing any data.
+
+    Returns:
+        List[QueryPlan]: One entry per catalogued call, in catalogue order.
+    """
+    plans = []
+    with DatabaseSession() as session:
+        connection = session.connection()
+        explain_prefix = "EXPLAIN QUERY PLAN " if connection.dialect.name == "sqlite" else "EXPLAIN "
+        captured: List[Tuple[str, Any]] = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if not statement.lstrip().upper().startswith(("EXPLAIN", "SAVEPOINT", "RELEASE", "ROLLBACK")):
+                # an executemany is planned once; its first parameter set is representative
+                captured.append((statement, parameters[0] if executemany else parameters))
+
+        event.listen(connection, "before_cursor_execute", capture)
+        try:
+            for label, call in REPOSITORY_QUERIES:
+                plan = QueryPlan(label)
+                captured.clear()
+                savepoint = session.begin_nested()
+                try:
+                    call(session)
+                    session.flush()
+                except Exception as e:
+                    plan.error = str(e).splitlines()[0]
+                finally:
+                    savepoint.rollback()
+
+                for statement, parameters in list(captured):
+                    try:
+                        rows = connection.exec_driver_sql(explain_prefix + statement, parameters).all()
+                    except Exception as e:
+                        plan.error = plan.error or str(e).splitlines()[0]
+                        continue
+                    plan.statements.append((statement, [_format_plan_row(row) for row in rows]))
+                plans.append(plan)
+        finally:
+            event.remove(connection, "before_cursor_execute", capture)
+            session.rollback()
+    return plans
+
+
+def _format_plan_row(row) -> str:
+    """Format an EXPLAIN row: SQLite rows are (id, parent, notused, detail), others one text column."""
+    return str(row[-1]) if len(row) >= 4 else str(row[0])
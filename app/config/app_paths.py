@@ -52,6 +52,9 @@ class AppPaths:
     TEMP_CROP_DIR = DATA_DIR / "temp_crops"
     RECIPE_IMAGES_DIR = DATA_DIR / "recipe_images"
     CUSTOM_THEMES_DIR = DATA_DIR / "custom_themes"
+    CACHE_DIR = DATA_DIR / "cache"
+    STYLESHEET_CACHE_DIR = CACHE_DIR / "stylesheets"
+    ICON_ATLAS_DIR = CACHE_DIR / "icon_atlas"
 
     # ── Database & Settings ─────────────────────────────────────────────────────
     DATABASE_PATH = DATABASE_DIR / "app_data.db"
@@ -92,6 +95,7 @@ class AppPaths:
             AppPaths.TEMP_CROP_DIR,
             AppPaths.RECIPE_IMAGES_DIR,
             AppPaths.CUSTOM_THEMES_DIR,
+            AppPaths.CACHE_DIR,
         ]
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
@@ -1,7 +1,7 @@
 # app/core/database/__init__.py
 
 from .base import Base
-from .db import SessionLocal, create_session, engine, get_session
+from .db import SessionLocal, create_session, engine, get_session, session_registry
 
 __all__ = [
     "Base",
@@ -9,4 +9,5 @@ __all__ = [
     "engine",
     "get_session",
     "create_session",
+    "session_registry",
 ]   
\ No newline at end of file
@@ -1,34 +1,188 @@
 """app/core/database/db.py
 
 Database connection and session management.
+
+Sessions made by `create_session()` are tracked by a registry so that sessions
+left open (typically by services constructed without one and never closed) can
+be reported, e.g. at shutdown.
 """
 
 import os
+import sys
+import threading
+import time
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
 
-# ── Imports ─────────────────────────────────────────────────────────────────────────────
+# ── Imports ─────────────────────────────────────────────────────────────────────
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
 DB_PATH = Path(__file__).parent / "app_data.db"
 SQLALCHEMY_DATABASE_URL = os.environ.get(
     "SQLALCHEMY_DATABASE_URL", f"sqlite:///{DB_PATH}"
 )
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
+# ── Constants ──
+DB_POOL_SIZE = 5          # persistent connections (UI thread, startup worker, background jobs)
+DB_MAX_OVERFLOW = 10      # temporary connections allowed beyond the pool under bursts
+DB_POOL_TIMEOUT_S = 30
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+# frames from these packages are skipped when recording where a session was created
+_INTERNAL_PATHS = (
+    str(Path(__file__).resolve().parent),
+    str(_PROJECT_ROOT / "app" / "core" / "services"),
 )
 
+
+def engine_options(url: str) -> dict:
+    """
+    Return create_engine() keyword arguments with a pool suited to the backend.
+
+    In-memory SQLite lives inside a single connection, so every session must share
+    it (StaticPool). File-based SQLite and server databases use a bounded QueuePool;
+    server connections are also pinged before use to survive restarts.
+
+    Args:
+        url (str): Database URL.
+
+    Returns:
+        dict: Engine options.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        options = {"connect_args": {"check_same_thread": False}}
+        in_memory = parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+        if in_memory:
+            options["poolclass"] = StaticPool
+        else:
+            options.update(
+                poolclass=QueuePool,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT_S,
+            )
+        return options
+
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT_S,
+        "pool_pre_ping": True,
+    }
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
+
 # Enable foreign key support for SQLite
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
+    if engine.dialect.name != "sqlite":
+        return
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
 
+
+# ── Session Registry ────────────────────────────────────────────────────────────
+@dataclass
+class SessionInfo:
+    """Bookkeeping for one open session."""
+    origin: str                   # "file:line in function" of the code that created it
+    created_at: float             # time.monotonic()
+    owner: Optional[str] = None   # long-lived owner (e.g. a page), if declared
+
+
+def _caller_origin() -> str:
+    """Describe the first stack frame outside the database and service layers."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_INTERNAL_PATHS) and "sqlalchemy" not in filename \
+                and not filename.endswith("contextlib.py"):
+            try:
+                filename = str(Path(filename).resolve().relative_to(_PROJECT_ROOT))
+            except ValueError:
+                pass
+            return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+class SessionRegistry:
+    """Tracks open sessions so that leaks can be found and reported.
+
+    Sessions are held weakly; a session that is garbage collected without being
+    closed simply drops out (its connection goes back to the pool with it).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._open: "weakref.WeakKeyDictionary[Session, SessionInfo]" = weakref.WeakKeyDictionary()
+        self._created = 0
+        self._closed = 0
+        self._peak = 0
+
+    def register(self, session: Session) -> None:
+        """Record a newly created session."""
+        info = SessionInfo(origin=_caller_origin(), created_at=time.monotonic())
+        with self._lock:
+            self._open[session] = info
+            self._created += 1
+            self._peak = max(self._peak, len(self._open))
+
+    def unregister(self, session: Session) -> None:
+        """Forget a session that has been closed."""
+        with self._lock:
+            if self._open.pop(session, None) is not None:
+                self._closed += 1
+
+    def set_owner(self, session: Session, owner: str) -> None:
+        """Mark a session as intentionally long-lived, owned by `owner`."""
+        with self._lock:
+            info = self._open.get(session)
+            if info is not None:
+                info.owner = owner
+
+    def open_sessions(self) -> list[SessionInfo]:
+        """Return the sessions still open, oldest first."""
+        with self._lock:
+            infos = list(self._open.values())
+        return sorted(infos, key=lambda info: info.created_at)
+
+    def get_stats(self) -> dict:
+        """Return counters for created, closed, open and peak sessions."""
+        with self._lock:
+            return {
+                "created": self._created,
+                "closed": self._closed,
+                "open": len(self._open),
+                "peak": self._peak,
+            }
+
+session_registry = SessionRegistry()
+
+
+class TrackedSession(Session):
+    """Session that registers itself with the session registry until closed."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        session_registry.register(self)
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            session_registry.unregister(self)
+
+
 SessionLocal = sessionmaker(
+    class_=TrackedSession,
     autocommit=False,
     autoflush=False,
     expire_on_commit=False,
@@ -0,0 +1,43 @@
+"""add shopping and history indexes
+
+Revision ID: c41e7a9d2b6f
+Revises: 6bcddbb87700
+Create Date: 2026-10-18 10:12:44.318902
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7a9d2b6f'
+down_revision: Union[str, Sequence[str], None] = '6bcddbb87700'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # clear_shopping_items(source=...), get_all_shopping_items(source) and search filters
+    op.create_index(
+        'ix_shopping_items_source_category', 'shopping_items', ['source', 'category'], unique=False
+    )
+    # clear_completed_items only touches checked rows; the predicate matches the query's
+    op.create_index(
+        'ix_shopping_items_have', 'shopping_items', ['have'], unique=False,
+        sqlite_where=sa.text('have = 1'),
+        postgresql_where=sa.text('have'),
+    )
+    # get_last_cooked_date: seek on recipe_id, read the newest cooked_at from the index
+    op.create_index(
+        'ix_recipe_history_recipe_cooked', 'recipe_history', ['recipe_id', 'cooked_at'], unique=False
+    )
+    op.execute('ANALYZE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recipe_history_recipe_cooked', table_name='recipe_history')
+    op.drop_index('ix_shopping_items_have', table_name='shopping_items')
+    op.drop_index('ix_shopping_items_source_category', table_name='shopping_items')
@@ -0,0 +1,166 @@
+"""add ingredient normalized key
+
+Revision ID: d8a3f6b1e052
+Revises: c41e7a9d2b6f
+Create Date: 2026-10-18 11:03:27.540116
+
+"""
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+log = logging.getLogger("alembic.runtime.migration")
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a3f6b1e052'
+down_revision: Union[str, Sequence[str], None] = 'c41e7a9d2b6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_key(name: str, category: str) -> str:
+    # frozen copy of Ingredient.create_key() as of this revision
+    name = " ".join(name.casefold().split())
+    category = " ".join(category.casefold().split())
+    return f"{name}::{category}"
+
+
+# frozen unit table as of this revision: canonical unit -> (dimension, factor to ml | g)
+_UNITS = {
+    "tsp": ("volume", 4.92892), "tbsp": ("volume", 14.7868), "fl oz": ("volume", 29.5735),
+    "cup": ("volume", 236.588), "pint": ("volume", 473.176), "quart": ("volume", 946.353),
+    "gallon": ("volume", 3785.41), "ml": ("volume", 1.0), "l": ("volume", 1000.0),
+    "oz": ("mass", 28.3495), "lb": ("mass", 453.592), "g": ("mass", 1.0), "kg": ("mass", 1000.0),
+}
+_UNIT_ALIASES = {
+    "t": "tsp", "teaspoon": "tsp", "teaspoons": "tsp", "tsps": "tsp",
+    "T": "tbsp", "tbs": "tbsp", "tbl": "tbsp", "tablespoon": "tbsp", "tablespoons": "tbsp", "tbsps": "tbsp",
+    "floz": "fl oz", "fluid ounce": "fl oz", "fluid ounces": "fl oz",
+    "c": "cup", "cups": "cup", "pt": "pint", "pints": "pint", "qt": "quart", "quarts": "quart",
+    "gal": "gallon", "gallons": "gallon", "milliliter": "ml", "milliliters": "ml",
+    "liter": "l", "liters": "l", "litre": "l", "litres": "l", "ounce": "oz", "ounces": "oz",
+    "lbs": "lb", "pound": "lb", "pounds": "lb", "gram": "g", "grams": "g", "kilogram": "kg", "kilograms": "kg",
+    # count units never convert, but their plurals combine
+    "cans": "can", "cloves": "clove", "slices": "slice", "pieces": "piece", "pinches": "pinch",
+    "bunches": "bunch", "sprigs": "sprig", "stalks": "stalk", "heads": "head", "leaves": "leaf",
+}
+
+
+def _unit(unit: str) -> tuple[str, float]:
+    """(group, factor) of a unit; units outside the table only combine with themselves."""
+    cleaned = (unit or "").strip().rstrip(".").strip()
+    canonical = _UNIT_ALIASES.get(cleaned if cleaned in ("T", "t") else cleaned.lower(), cleaned.lower())
+    return _UNITS.get(canonical, (f"count:{canonical}", 1.0))
+
+
+def _combine_quantities(quantity: float, unit: str, other_quantity: float, other_unit: str):
+    # frozen copy of unit_utils.combine_quantities() without per-ingredient densities
+    group, factor = _unit(unit)
+    other_group, other_factor = _unit(other_unit)
+    if group != other_group:
+        return None
+    return round(quantity + other_quantity * other_factor / factor, 4)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('ingredients') as batch_op:
+        batch_op.add_column(sa.Column('normalized_key', sa.String(), nullable=True))
+
+    conn = op.get_bind()
+    ingredients = sa.table(
+        'ingredients',
+        sa.column('id', sa.Integer),
+        sa.column('ingredient_name', sa.String),
+        sa.column('ingredient_category', sa.String),
+        sa.column('normalized_key', sa.String),
+    )
+    links = sa.table(
+        'recipe_ingredients',
+        sa.column('recipe_id', sa.Integer),
+        sa.column('ingredient_id', sa.Integer),
+        sa.column('quantity', sa.Float),
+        sa.column('unit', sa.String),
+    )
+
+    kept = links.alias('kept')
+
+    # group rows by key; the lowest id of each group is kept
+    canonical: dict[str, int] = {}
+    duplicates: dict[int, int] = {}   # duplicate id -> canonical id
+    names: dict[int, str] = {}
+    rows = conn.execute(
+        sa.select(ingredients.c.id, ingredients.c.ingredient_name, ingredients.c.ingredient_category)
+        .order_by(ingredients.c.id)
+    )
+    for ingredient_id, name, category in rows:
+        names[ingredient_id] = name
+        key = _create_key(name, category)
+        if key in canonical:
+            duplicates[ingredient_id] = canonical[key]
+        else:
+            canonical[key] = ingredient_id
+
+    # case/whitespace variants that used to be separate rows merge into the canonical one
+    for duplicate_id, canonical_id in duplicates.items():
+        # a recipe linking both keeps its canonical link (the pair is its primary key);
+        # the duplicate's quantity is added into it when the units convert
+        colliding = conn.execute(
+            sa.select(
+                links.c.recipe_id, links.c.quantity, links.c.unit,
+                kept.c.quantity.label('kept_quantity'), kept.c.unit.label('kept_unit'),
+            )
+            .join(kept, sa.and_(kept.c.recipe_id == links.c.recipe_id, kept.c.ingredient_id == canonical_id))
+            .where(links.c.ingredient_id == duplicate_id)
+        ).all()
+        for row in colliding:
+            if row.quantity is None:
+                continue
+            total = None if row.kept_quantity is None else _combine_quantities(
+                row.kept_quantity, row.kept_unit, row.quantity, row.unit
+            )
+            if total is None:
+                log.warning(
+                    "Recipe %s: dropped %s %s of ingredient %s (%r), units do not add to the kept link (%s %s)",
+                    row.recipe_id, row.quantity, row.unit or '', duplicate_id, names[duplicate_id],
+                    row.kept_quantity, row.kept_unit or '',
+                )
+                continue
+            conn.execute(
+                sa.update(links)
+                .where(links.c.recipe_id == row.recipe_id, links.c.ingredient_id == canonical_id)
+                .values(quantity=total)
+            )
+        if colliding:
+            conn.execute(
+                sa.delete(links).where(
+                    links.c.ingredient_id == duplicate_id,
+                    links.c.recipe_id.in_([row.recipe_id for row in colliding]),
+                )
+            )
+        conn.execute(
+            sa.update(links).where(links.c.ingredient_id == duplicate_id).values(ingredient_id=canonical_id)
+        )
+    if duplicates:
+        conn.execute(sa.delete(ingredients).where(ingredients.c.id.in_(list(duplicates))))
+
+    if canonical:
+        conn.execute(
+            sa.update(ingredients)
+            .where(ingredients.c.id == sa.bindparam('b_id'))
+            .values(normalized_key=sa.bindparam('b_key')),
+            [{'b_id': ingredient_id, 'b_key': key} for key, ingredient_id in canonical.items()],
+        )
+
+    with op.batch_alter_table('ingredients') as batch_op:
+        batch_op.alter_column('normalized_key', existing_type=sa.String(), nullable=False)
+        batch_op.create_index('ix_ingredients_normalized_key', ['normalized_key'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('ingredients') as batch_op:
+        batch_op.drop_index('ix_ingredients_normalized_key')
+        batch_op.drop_column('normalized_key')
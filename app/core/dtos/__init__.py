@@ -4,6 +4,10 @@ from .ingredient_dtos import (
     IngredientBaseDTO,
     IngredientCreateDTO,
     IngredientDetailDTO,
+    IngredientMatchDTO,
+    IngredientMergeConflictDTO,
+    IngredientMergeGroupDTO,
+    IngredientMergeResultDTO,
     IngredientResponseDTO,
     IngredientSearchDTO,
     IngredientUpdateDTO)
@@ -15,13 +19,16 @@ from .planner_dtos import (
     MealSelectionCreateDTO,
     MealSelectionFilterDTO,
     MealSelectionResponseDTO,
-    MealSelectionUpdateDTO)
+    MealSelectionUpdateDTO,
+    SavedMealPlanDTO)
 from .recipe_dtos import (
     RecipeBaseDTO,
     RecipeCreateDTO,
     RecipeFilterDTO,
     RecipeIngredientDTO,
     RecipeResponseDTO,
+    RecipeSnapshotDTO,
+    RecipeStatsDTO,
     RecipeUpdateDTO)
 from .shopping_dtos import (
     BulkOperationResultDTO,
@@ -29,6 +36,7 @@ from .shopping_dtos import (
     IngredientAggregationDTO,
     IngredientBreakdownDTO,
     IngredientBreakdownItemDTO,
+    ItemStatusWriteDTO,
     ManualItemCreateDTO,
     ShoppingItemBaseDTO,
     ShoppingItemCreateDTO,
@@ -48,6 +56,8 @@ __all__ = [
     "RecipeCreateDTO",
     "RecipeUpdateDTO",
     "RecipeResponseDTO",
+    "RecipeSnapshotDTO",
+    "RecipeStatsDTO",
     "RecipeFilterDTO",
 
     # Ingredient DTOs
@@ -57,6 +67,10 @@ __all__ = [
     "IngredientResponseDTO",
     "IngredientSearchDTO",
     "IngredientDetailDTO",
+    "IngredientMatchDTO",
+    "IngredientMergeConflictDTO",
+    "IngredientMergeGroupDTO",
+    "IngredientMergeResultDTO",
 
     # Planner DTOs
     "MealSelectionBaseDTO",
@@ -67,6 +81,7 @@ __all__ = [
     "MealPlanSummaryDTO",
     "MealPlanValidationDTO",
     "MealPlanSaveResultDTO",
+    "SavedMealPlanDTO",
 
     # Shopping DTOs
     "ShoppingItemBaseDTO",
@@ -83,5 +98,6 @@ __all__ = [
     "IngredientBreakdownItemDTO",
     "ShoppingStateDTO",
     "BulkStateUpdateDTO",
+    "ItemStatusWriteDTO",
     "BulkOperationResultDTO",
 ]
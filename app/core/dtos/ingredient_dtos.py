@@ -7,7 +7,7 @@ Handles ingredient creation, updates, searching, and responses.
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -94,3 +94,42 @@ class IngredientDetailDTO(BaseModel):
 
         from ..utils.format_utils import abbreviate_unit
         return abbreviate_unit(self.unit)
+
+# ── Matching DTOs ───────────────────────────────────────────────────────────────────────────────────────────
+class IngredientMatchDTO(IngredientResponseDTO):
+    """DTO for a stored ingredient similar to a name being entered."""
+
+    score: float = Field(..., ge=0, le=1)
+
+class IngredientMergeGroupDTO(BaseModel):
+    """DTO for a group of near-duplicate ingredients and the one they merge into."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    canonical: IngredientResponseDTO
+    duplicates: List[IngredientResponseDTO]
+
+class IngredientMergeConflictDTO(BaseModel):
+    """DTO for a recipe link a merge drops because its unit does not add to the kept link's."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    recipe_id: int
+    recipe_name: str
+    ingredient_name: str
+    quantity: Optional[float] = None
+    unit: Optional[str] = None
+    kept_ingredient_name: str
+    kept_quantity: Optional[float] = None
+    kept_unit: Optional[str] = None
+
+class IngredientMergeResultDTO(BaseModel):
+    """DTO for ingredient merge results."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    merged: int
+    links_rewritten: int
+    links_combined: int = 0
+    links_dropped: int
+    mapping: Dict[int, int] = {}
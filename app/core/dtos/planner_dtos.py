@@ -6,7 +6,7 @@ Pydantic DTOs for meal planning and selection operations.
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -102,3 +102,13 @@ class MealPlanSaveResultDTO(BaseModel):
     saved_count: int
     invalid_ids: list[int]
     message: str
+
+# ── Saved Plan DTO ──────────────────────────────────────────────────────────────────────────────────────────
+class SavedMealPlanDTO(BaseModel):
+    """DTO for the saved meal plan loaded in bulk, with every referenced recipe prefetched."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    meals: list[MealSelectionResponseDTO] = []      # in saved (tab) order
+    recipes: dict[int, Any] = {}                    # recipe ID -> Recipe with ingredients loaded
+    missing_meal_ids: list[int] = []                # saved IDs whose meal selection no longer exists
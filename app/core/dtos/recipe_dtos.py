@@ -7,11 +7,12 @@ Handles recipe creation, updates, filtering, and responses with ingredient relat
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..models.recipe import Recipe
+from .ingredient_dtos import IngredientDetailDTO
 
 
 # ── Recipe Ingredient DTOs ──────────────────────────────────────────────────────────────────────────────────
@@ -84,6 +85,83 @@ class RecipeCardDTO(BaseModel):
             total_time=recipe.total_time,
         )
 
+# ── Recipe Snapshot DTO ─────────────────────────────────────────────────────────────────────────────────────
+class RecipeSnapshotDTO(BaseModel):
+    """Immutable copy of a recipe and its ingredient details, as held by the recipe cache.
+
+    Exposes the same read-only helpers as the Recipe model so views that display a
+    recipe (cards, full recipe view, edit form) can take either one.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    recipe_name: str
+    recipe_category: str
+    meal_type: str
+    diet_pref: Optional[str] = None
+    total_time: Optional[int] = None
+    servings: Optional[int] = None
+    directions: Optional[str] = None
+    notes: Optional[str] = None
+    reference_image_path: Optional[str] = None
+    banner_image_path: Optional[str] = None
+    is_favorite: bool = False
+    ingredient_details: Tuple[IngredientDetailDTO, ...] = ()
+    version: int = 0  # cache generation the snapshot was taken at
+
+    @classmethod
+    def from_recipe(cls, recipe: Recipe, version: int = 0) -> "RecipeSnapshotDTO":
+        """Snapshot a Recipe model whose ingredients are loaded."""
+        return cls(
+            id=recipe.id,
+            recipe_name=recipe.recipe_name,
+            recipe_category=recipe.recipe_category,
+            meal_type=recipe.meal_type,
+            diet_pref=recipe.diet_pref,
+            total_time=recipe.total_time,
+            servings=recipe.servings,
+            directions=recipe.directions,
+            notes=recipe.notes,
+            reference_image_path=recipe.reference_image_path,
+            banner_image_path=recipe.banner_image_path,
+            is_favorite=bool(recipe.is_favorite),
+            ingredient_details=tuple(recipe.get_ingredient_details()),
+            version=version,
+        )
+
+    def formatted_time(self) -> str:
+        """Return total_time formatted as "Xh Ym" or "Ym" if less than 1 hour."""
+        if not self.total_time:
+            return ""
+        hrs, mins = divmod(self.total_time, 60)
+        return f"{hrs}h {mins}m" if hrs else f"{mins}m"
+
+    def formatted_servings(self) -> str:
+        """Return servings with label."""
+        return f"{self.servings}" if self.servings else ""
+
+    def get_directions_list(self) -> list[str]:
+        """Return each non-empty line as a step."""
+        if not self.directions:
+            return []
+        return [line.strip() for line in self.directions.splitlines() if line.strip()]
+
+    def get_ingredient_details(self) -> list[IngredientDetailDTO]:
+        """Return the ingredient details captured with the snapshot."""
+        return list(self.ingredient_details)
+
+# ── Recipe Stats DTO ────────────────────────────────────────────────────────────────────────────────────────
+class RecipeStatsDTO(BaseModel):
+    """Library-wide recipe figures shown on the dashboard."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    total_recipes: int = 0
+    favorites: int = 0
+    this_week: int = 0      # recipes created in the last 7 days
+    avg_time: int = 0       # average total_time in minutes over recipes that have one
+
 # ── Create DTO ──────────────────────────────────────────────────────────────────────────────────────────────
 class RecipeCreateDTO(RecipeBaseDTO):
     """DTO used to create a new recipe with ingredients."""
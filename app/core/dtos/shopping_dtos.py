@@ -141,6 +141,17 @@ class BulkStateUpdateDTO(BaseModel):
 
     item_updates: Dict[int, bool]
 
+class ItemStatusWriteDTO(BaseModel):
+    """DTO for a queued 'have' write, carrying what the state upsert needs without a read."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    item_id: int
+    have: bool
+    state_key: Optional[str] = None   # set for recipe items only
+    quantity: float = 0.0
+    unit: str = ""
+
 # ── Breakdown DTOs ──────────────────────────────────────────────────────────────────────────────────────────
 class IngredientBreakdownItemDTO(BaseModel):
     """DTO for individual ingredient breakdown item."""
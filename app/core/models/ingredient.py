@@ -8,8 +8,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Index, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from ..database.base import Base
 
@@ -30,11 +30,15 @@ class Ingredient(Base):
             'ingredient_category',
             name='uq_ingredient_name_category'
         ),
+        # exact lookups go through the normalized key (equality / IN), never ilike
+        Index('ix_ingredients_normalized_key', 'normalized_key', unique=True),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     ingredient_name: Mapped[str] = mapped_column(String, nullable=False, index=True)
     ingredient_category: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # kept in sync with name + category by _sync_normalized_key; see create_key()
+    normalized_key: Mapped[str] = mapped_column(String, nullable=False)
 
 
     # ── Relationships ───────────────────────────────────────────────────────────────────────────────────────
@@ -46,6 +50,33 @@ class Ingredient(Base):
     )
 
     # ── Helper Methods ──────────────────────────────────────────────────────────────────────────────────────
+    @classmethod
+    def create_key(cls, ingredient_name: str, ingredient_category: str) -> str:
+        """
+        Create the normalized lookup key for a name + category pair.
+
+        Both parts are casefolded and their whitespace collapsed, so "Green  Onion"
+        and "green onion" in "Produce"/"produce" share one key.
+
+        Args:
+            ingredient_name (str): The name of the ingredient.
+            ingredient_category (str): The category of the ingredient.
+
+        Returns:
+            str: The key, formatted as "name::category".
+        """
+        name = " ".join(ingredient_name.casefold().split())
+        category = " ".join(ingredient_category.casefold().split())
+        return f"{name}::{category}"
+
+    @validates("ingredient_name", "ingredient_category")
+    def _sync_normalized_key(self, field: str, value: str) -> str:
+        name = value if field == "ingredient_name" else self.ingredient_name
+        category = value if field == "ingredient_category" else self.ingredient_category
+        if name is not None and category is not None:
+            self.normalized_key = self.create_key(name, category)
+        return value
+
     def display_label(self) -> str:
         """Return a human-friendly label for this ingredient."""
         return f"{self.ingredient_name} ({self.ingredient_category})"
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..utils import utcnow
@@ -19,6 +19,11 @@ from ..database.base import Base
 class RecipeHistory(Base):
     __tablename__ = "recipe_history"
 
+    # covers get_last_cooked_date: seek on recipe_id, newest cooked_at first
+    __table_args__ = (
+        Index("ix_recipe_history_recipe_cooked", "recipe_id", "cooked_at"),
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     recipe_id: Mapped[int] = mapped_column(ForeignKey("recipe.id"), nullable=False)
     cooked_at: Mapped[datetime] = mapped_column(default=utcnow)
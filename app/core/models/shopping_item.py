@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import Boolean, Enum, Float, String
+from sqlalchemy import Boolean, Enum, Float, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..database.base import Base
@@ -19,6 +19,18 @@ from ..database.base import Base
 class ShoppingItem(Base):
     __tablename__ = "shopping_items"
 
+    # clear/list by source (optionally by category); clear_completed_items deletes checked
+    # rows, a small subset, so that index is partial (its predicate must match the query's)
+    __table_args__ = (
+        Index("ix_shopping_items_source_category", "source", "category"),
+        Index(
+            "ix_shopping_items_have",
+            "have",
+            sqlite_where=text("have = 1"),
+            postgresql_where=text("have"),
+        ),
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     ingredient_name: Mapped[str] = mapped_column(String(255), nullable=False)
     quantity: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
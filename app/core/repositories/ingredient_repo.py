@@ -4,10 +4,15 @@ Provides database operations for Ingredient entities.
 """
 
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
-from sqlalchemy import select
+from typing import Iterable, Mapping, Sequence
+
+from sqlalchemy import Row, and_, bindparam, case, delete, func, select, update
 from sqlalchemy.orm import Session
 
 from ..models.ingredient import Ingredient
+from ..models.recipe import Recipe
+from ..models.recipe_ingredient import RecipeIngredient
+from ..utils.unit_utils import combine_quantities
 
 
 # ── Ingredient Repository ───────────────────────────────────────────────────────────────────────────────────
@@ -60,13 +65,25 @@ class IngredientRepo:
         Returns:
             Ingredient | None: The matching ingredient, or None if not found.
         """
-        stmt = (
-            select(Ingredient)
-            .where(Ingredient.ingredient_name.ilike(name.strip()))
-            .where(Ingredient.ingredient_category.ilike(category.strip()))
-        )
+        stmt = select(Ingredient).where(Ingredient.normalized_key == Ingredient.create_key(name, category))
         return self.session.execute(stmt).scalars().unique().first()
 
+    def find_by_keys(self, keys: Iterable[str]) -> dict[str, Ingredient]:
+        """
+        Return the ingredients matching a set of normalized keys in one query.
+
+        Args:
+            keys (Iterable[str]): Keys built with Ingredient.create_key().
+
+        Returns:
+            dict[str, Ingredient]: Matching ingredients by normalized key.
+        """
+        keys = set(keys)
+        if not keys:
+            return {}
+        stmt = select(Ingredient).where(Ingredient.normalized_key.in_(keys))
+        return {ing.normalized_key: ing for ing in self.session.execute(stmt).scalars().unique()}
+
     def search_by_name(self, term: str, category: str | None = None) -> list[Ingredient]:
         """
         Search for ingredients with name containing a term (optionally filtered by category).
@@ -94,6 +111,152 @@ class IngredientRepo:
         results = self.session.execute(stmt).scalars().all()
         return results
 
+    def get_name_usage(self) -> list[tuple[str, int]]:
+        """
+        Return every ingredient name with the number of recipe links using it.
+
+        Returns:
+            list[tuple[str, int]]: (ingredient name, recipe link count) pairs.
+        """
+        uses = func.count(RecipeIngredient.ingredient_id)
+        stmt = (
+            select(Ingredient.ingredient_name, uses)
+            .outerjoin(RecipeIngredient, RecipeIngredient.ingredient_id == Ingredient.id)
+            .group_by(Ingredient.ingredient_name)
+        )
+        return [(name, count) for name, count in self.session.execute(stmt)]
+
+    def get_usage_by_id(self) -> list[tuple[int, str, str, int]]:
+        """
+        Return every ingredient with the number of recipe links using it.
+
+        Returns:
+            list[tuple[int, str, str, int]]: (id, name, category, recipe link count) rows.
+        """
+        uses = func.count(RecipeIngredient.ingredient_id)
+        stmt = (
+            select(Ingredient.id, Ingredient.ingredient_name, Ingredient.ingredient_category, uses)
+            .outerjoin(RecipeIngredient, RecipeIngredient.ingredient_id == Ingredient.id)
+            .group_by(Ingredient.id)
+        )
+        return [tuple(row) for row in self.session.execute(stmt)]
+
+    def find_merge_conflicts(self, mapping: Mapping[int, int]) -> list[tuple[Row, Row]]:
+        """
+        Return the recipe links a merge would drop without keeping their quantity.
+
+        Args:
+            mapping (Mapping[int, int]): Duplicate ingredient id -> canonical ingredient id.
+
+        Returns:
+            list[tuple[Row, Row]]: (dropped link, kept link) pairs whose units do not add up;
+                rows carry recipe_id, recipe_name, ingredient_id, ingredient_name, quantity, unit.
+        """
+        return self._plan_merge(mapping)[3]
+
+    def merge_into(self, mapping: Mapping[int, int]) -> tuple[int, int, int]:
+        """
+        Repoint recipe links from duplicate ingredients to their canonical ones and delete the duplicates.
+
+        A recipe that already links the canonical ingredient (or another duplicate of
+        it) keeps that first link, since (recipe_id, ingredient_id) is the link's
+        primary key; the colliding link's quantity is added into it when the units
+        convert (unit_utils groups), otherwise it is dropped (see find_merge_conflicts).
+        Runs as bulk statements in the caller's transaction.
+
+        Args:
+            mapping (Mapping[int, int]): Duplicate ingredient id -> canonical ingredient id.
+
+        Returns:
+            tuple[int, int, int]: (links rewritten, links combined into another, links dropped).
+        """
+        mapping = {dup: canon for dup, canon in mapping.items() if dup != canon}
+        if not mapping:
+            return 0, 0, 0
+        rewritten, quantities, collisions, conflicts = self._plan_merge(mapping)
+        links = RecipeIngredient.__table__
+
+        if collisions:
+            self.session.execute(
+                delete(links).where(and_(
+                    links.c.recipe_id == bindparam("b_recipe"),
+                    links.c.ingredient_id == bindparam("b_ingredient"),
+                )),
+                [{"b_recipe": row.recipe_id, "b_ingredient": row.ingredient_id} for row, _ in collisions],
+            )
+        if quantities:
+            self.session.execute(
+                update(links)
+                .where(and_(
+                    links.c.recipe_id == bindparam("b_recipe"),
+                    links.c.ingredient_id == bindparam("b_ingredient"),
+                ))
+                .values(quantity=bindparam("b_quantity")),
+                [
+                    {"b_recipe": recipe_id, "b_ingredient": ingredient_id, "b_quantity": quantity}
+                    for (recipe_id, ingredient_id), quantity in quantities.items()
+                ],
+            )
+        self.session.execute(
+            update(links)
+            .where(links.c.ingredient_id.in_(list(mapping)))
+            .values(ingredient_id=case(mapping, value=links.c.ingredient_id))
+        )
+        self.session.execute(delete(Ingredient.__table__).where(Ingredient.__table__.c.id.in_(list(mapping))))
+        return rewritten, len(collisions) - len(conflicts), len(conflicts)
+
+    def _plan_merge(self, mapping: Mapping[int, int]):
+        """
+        Work out what a merge does to the links of the ingredients involved.
+
+        Returns:
+            (links rewritten, new quantity by kept (recipe_id, ingredient_id), colliding
+            (link, kept link) pairs, and the subset of those whose quantity is lost).
+        """
+        mapping = {dup: canon for dup, canon in mapping.items() if dup != canon}
+        if not mapping:
+            return 0, {}, [], []
+        links, ingredients, recipes = RecipeIngredient.__table__, Ingredient.__table__, Recipe.__table__
+
+        # canonical links first, so they win any collision
+        rows = self.session.execute(
+            select(
+                links.c.recipe_id, recipes.c.recipe_name, links.c.ingredient_id,
+                ingredients.c.ingredient_name, links.c.quantity, links.c.unit,
+            )
+            .join(ingredients, ingredients.c.id == links.c.ingredient_id)
+            .join(recipes, recipes.c.id == links.c.recipe_id)
+            .where(links.c.ingredient_id.in_(set(mapping) | set(mapping.values())))
+            .order_by(links.c.ingredient_id.in_(list(mapping)), links.c.ingredient_id)
+        )
+        kept: dict[tuple[int, int], Row] = {}
+        quantities: dict[tuple[int, int], float] = {}
+        collisions: list[tuple[Row, Row]] = []
+        conflicts: list[tuple[Row, Row]] = []
+        rewritten = 0
+        for row in rows:
+            target = (row.recipe_id, mapping.get(row.ingredient_id, row.ingredient_id))
+            keeper = kept.get(target)
+            if keeper is None:
+                kept[target] = row
+                rewritten += row.ingredient_id in mapping
+                continue
+
+            collisions.append((row, keeper))
+            if row.quantity is None:
+                continue  # nothing to carry over
+            key = (keeper.recipe_id, keeper.ingredient_id)
+            current = quantities.get(key, keeper.quantity)
+            total = None if current is None else combine_quantities(
+                keeper.ingredient_name, current, keeper.unit,
+                row.ingredient_name, row.quantity, row.unit,
+            )
+            if total is None:
+                conflicts.append((row, keeper))
+            else:
+                quantities[key] = total
+        return rewritten, quantities, collisions, conflicts
+
     def get_or_create(self, dto) -> Ingredient:
         """
         Get existing ingredient or create new one based on name and category.
@@ -104,15 +267,33 @@ class IngredientRepo:
         Returns:
             Ingredient: The existing ingredient if found, or a new Ingredient instance.
         """
-        existing = self.find_by_name_category(dto.ingredient_name, dto.ingredient_category)
-        if existing:
-            return existing
+        return self.get_or_create_many([dto])[0]
 
-        new_ingredient = Ingredient(
-            ingredient_name=dto.ingredient_name,
-            ingredient_category=dto.ingredient_category
-        )
-        self.add(new_ingredient)
-        # flush so SQLAlchemy assigns an ID and the new ingredient is queryable immediately
-        self.session.flush()
-        return new_ingredient
+    def get_or_create_many(self, dtos: Sequence) -> list[Ingredient]:
+        """
+        Get or create the ingredients for a batch of DTOs with one lookup and one flush.
+
+        DTOs that normalize to the same key resolve to the same ingredient.
+
+        Args:
+            dtos (Sequence): DTOs containing ingredient_name and ingredient_category.
+
+        Returns:
+            list[Ingredient]: One ingredient per DTO, in input order.
+        """
+        keys = [Ingredient.create_key(dto.ingredient_name, dto.ingredient_category) for dto in dtos]
+        found = self.find_by_keys(keys)
+
+        created = False
+        for key, dto in zip(keys, dtos):
+            if key not in found:
+                found[key] = Ingredient(
+                    ingredient_name=dto.ingredient_name.strip(),
+                    ingredient_category=dto.ingredient_category.strip()
+                )
+                self.add(found[key])
+                created = True
+        if created:
+            # flush so SQLAlchemy assigns IDs and the new ingredients are queryable immediately
+            self.session.flush()
+        return [found[key] for key in keys]
@@ -6,9 +6,9 @@ Repository for managing meal planner state and meal selections.
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
-from sqlalchemy import delete, select, func
+from sqlalchemy import delete, exists, insert, select, func, update
 from sqlalchemy.orm import Session, joinedload
 
 from ..models.meal_selection import MealSelection
@@ -32,33 +32,87 @@ class PlannerRepo:
         Returns:
             List[int]: List of saved meal IDs.
         """
-        stmt = select(SavedMealState.meal_id)
+        stmt = select(SavedMealState.meal_id).order_by(SavedMealState.id)
         result = self.session.execute(stmt)
         return result.scalars().all()
 
-    def save_active_meal_ids(self, meal_ids: List[int]) -> None:
+    def save_active_meal_ids(self, meal_ids: List[int]) -> int:
         """
-        Save the active meal IDs to the database atomically.
-        Clears existing saved states and saves new ones.
+        Save the active meal IDs to the database as a minimal diff.
+
+        Saved states keep their order by row ID, so position i of the plan is the
+        i-th row. Rows whose meal changed are updated in place, surplus rows are
+        deleted and new positions inserted, each as a single executemany statement.
 
         Args:
-            meal_ids (List[int]): List of meal IDs to save.
-        """
-        # clear existing saved states
-        self.clear_saved_meal_states()
+            meal_ids (List[int]): List of meal IDs to save, in tab order.
 
-        # save new meal IDs
-        for meal_id in meal_ids:
-            saved_state = SavedMealState(meal_id=meal_id)
-            self.session.add(saved_state)
-        # flush so new saved meal states can be read immediately in this session
-        self.session.flush()
+        Returns:
+            int: Number of rows written (updated + inserted + deleted).
+        """
+        rows = self.session.execute(
+            select(SavedMealState.id, SavedMealState.meal_id).order_by(SavedMealState.id)
+        ).all()
+
+        updates = [
+            {"id": row_id, "meal_id": meal_id}
+            for (row_id, saved_id), meal_id in zip(rows, meal_ids)
+            if saved_id != meal_id
+        ]
+        inserts = [{"meal_id": meal_id} for meal_id in meal_ids[len(rows):]]
+        deletes = [row_id for row_id, _ in rows[len(meal_ids):]]
+
+        if updates:
+            self.session.execute(update(SavedMealState), updates)
+        if deletes:
+            self.session.execute(
+                delete(SavedMealState)
+                .where(SavedMealState.id.in_(deletes))
+                .execution_options(synchronize_session=False)
+            )
+        if inserts:
+            self.session.execute(insert(SavedMealState), inserts)
+        return len(updates) + len(inserts) + len(deletes)
 
     def clear_saved_meal_states(self) -> None:
         """Clear all saved meal states from the database."""
         stmt = delete(SavedMealState)
         self.session.execute(stmt)
 
+    def get_saved_meal_plan_rows(self) -> List[Tuple[int, Optional[MealSelection]]]:
+        """
+        Load the saved meal plan in one query, in saved order.
+
+        Returns:
+            List[Tuple[int, Optional[MealSelection]]]: (saved meal ID, meal selection) pairs;
+                the selection is None when the saved ID no longer exists.
+        """
+        stmt = (
+            select(SavedMealState.meal_id, MealSelection)
+            .outerjoin(MealSelection, MealSelection.id == SavedMealState.meal_id)
+            .order_by(SavedMealState.id)
+        )
+        return [(meal_id, meal) for meal_id, meal in self.session.execute(stmt).all()]
+
+    def get_recipes_for_cards(self, recipe_ids: List[int]) -> Dict[int, Recipe]:
+        """
+        Load recipes with their ingredients in one query, keyed by ID.
+
+        Args:
+            recipe_ids (List[int]): IDs of the recipes to load.
+
+        Returns:
+            Dict[int, Recipe]: Loaded recipes by ID (missing IDs are absent).
+        """
+        if not recipe_ids:
+            return {}
+        stmt = (
+            select(Recipe)
+            .where(Recipe.id.in_(set(recipe_ids)))
+            .options(joinedload(Recipe.ingredients))
+        )
+        return {recipe.id: recipe for recipe in self.session.scalars(stmt).unique()}
+
     def get_saved_meal_states(self) -> List[SavedMealState]:
         """
         Get all saved meal states with their associated meal selections.
@@ -168,6 +222,32 @@ class PlannerRepo:
             return True
         return False
 
+    def delete_orphaned_saved_states(self) -> int:
+        """
+        Delete saved meal states whose meal selection is missing or has no main recipe.
+
+        Returns:
+            int: Number of saved meal states deleted.
+        """
+        valid_meal = (
+            select(MealSelection.id)
+            .join(Recipe, Recipe.id == MealSelection.main_recipe_id)
+            .where(MealSelection.id == SavedMealState.meal_id)
+        )
+        stmt = delete(SavedMealState).where(~exists(valid_meal)).execution_options(synchronize_session=False)
+        return self.session.execute(stmt).rowcount or 0
+
+    def delete_orphaned_meal_selections(self) -> int:
+        """
+        Delete meal selections whose main recipe is missing or null.
+
+        Returns:
+            int: Number of meal selections deleted.
+        """
+        main_recipe = select(Recipe.id).where(Recipe.id == MealSelection.main_recipe_id)
+        stmt = delete(MealSelection).where(~exists(main_recipe)).execution_options(synchronize_session=False)
+        return self.session.execute(stmt).rowcount or 0
+
     def remove_recipe_from_meal(self, meal_id: int, slot: Literal["side_1", "side_2", "side_3"]
         ) -> Optional[MealSelection]:
         """
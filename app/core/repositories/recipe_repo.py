@@ -8,7 +8,7 @@ related to recipes, including related ingredients and history.
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session, joinedload
 
 from ..dtos.recipe_dtos import (
@@ -50,10 +50,9 @@ class RecipeRepo:
         # flush so recipe gets its primary key before linking ingredients
         self.session.flush()
 
-        for ing in recipe_dto.ingredients:
-            ingredient = self.ingredient_repo.get_or_create(ing)
-            # flush to ensure ingredient has an ID before creating the link row
-            self.session.flush()
+        # one key lookup for the whole recipe; new ingredients are flushed so they have IDs
+        ingredients = self.ingredient_repo.get_or_create_many(recipe_dto.ingredients)
+        for ing, ingredient in zip(recipe_dto.ingredients, ingredients):
             link = RecipeIngredient(
                 recipe_id=recipe.id,
                 ingredient_id=ingredient.id,
@@ -143,15 +142,12 @@ class RecipeRepo:
             recipe.ingredients.clear()
             # flush to persist removal of old links before adding replacements
             self.session.flush()
-            for ing in update_data["ingredients"]:
-                ing_dto = (
-                    RecipeIngredientDTO(**ing)
-                    if isinstance(ing, dict)
-                    else ing
-                )
-                ingredient = self.ingredient_repo.get_or_create(ing_dto)
-                # flush so ingredient has an ID before we append the new link
-                self.session.flush()
+            ing_dtos = [
+                RecipeIngredientDTO(**ing) if isinstance(ing, dict) else ing
+                for ing in update_data["ingredients"]
+            ]
+            ingredients = self.ingredient_repo.get_or_create_many(ing_dtos)
+            for ing_dto, ingredient in zip(ing_dtos, ingredients):
                 recipe.ingredients.append(
                     RecipeIngredient(
                         recipe_id=recipe.id,
@@ -257,6 +253,26 @@ class RecipeRepo:
         result = self.session.scalars(stmt).unique().all()
         return result
 
+    def get_stats(self, since: datetime) -> tuple[int, int, int, Optional[float]]:
+        """
+        Aggregate library-wide recipe figures in a single query.
+
+        Args:
+            since (datetime): Recipes created at or after this time count as recent.
+
+        Returns:
+            tuple: (total recipes, favorites, recipes created since `since`,
+                average positive total_time or None if no recipe has one).
+        """
+        stmt = select(
+            func.count(Recipe.id),
+            func.count(case((Recipe.is_favorite.is_(True), 1))),
+            func.count(case((Recipe.created_at >= since, 1))),
+            func.avg(case((Recipe.total_time > 0, Recipe.total_time))),
+        )
+        total, favorites, recent, avg_time = self.session.execute(stmt).one()
+        return total, favorites, recent, avg_time
+
     def toggle_favorite(self, recipe_id: int) -> Recipe:
         """
         Toggle the favorite status of a recipe.
@@ -7,195 +7,129 @@ Handles ingredient aggregation, manual items, and state persistence.
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, delete, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, bindparam, case, delete, insert, select, update
+from sqlalchemy.orm import Session
 
-from ..models.recipe_ingredient import RecipeIngredient
 from ..models.ingredient import Ingredient
+from ..models.recipe import Recipe
+from ..models.recipe_ingredient import RecipeIngredient
 from ..models.shopping_item import ShoppingItem
 from ..models.shopping_state import ShoppingState
+from ..utils.unit_utils import best_display_unit, to_base_quantity
 
 
 # ── Shopping Repository ─────────────────────────────────────────────────────────────────────────────────────
 class ShoppingRepo:
     """Repository for shopping list operations."""
 
-    # unit conversion mappings
-    _CONVERSIONS: Dict[str, Dict[str, float]] = {
-        "butter": {"stick": 8.0, "tbsp": 1.0},
-        "flour": {"cup": 16.0, "tbsp": 1.0},
-        "sugar": {"cup": 16.0, "tbsp": 1.0},
-    }
-
     def __init__(self, session: Session):
         """Initialize the Shopping Repository with a database session."""
         self.session = session
 
-    # ── Unit Conversion ─────────────────────────────────────────────────────────────────────────────────────
-    def _convert_quantity(self, name: str, qty: float, unit: str) -> Tuple[float, str]:
-        """
-        Convert ingredient quantity to a standard unit if applicable.
-
-        Args:
-            name (str): Ingredient name.
-            qty (float): Quantity to convert.
-            unit (str): Current unit of the ingredient.
-
-        Returns:
-            Tuple[float, str]: Converted quantity and unit.
-        """
-        key = name.lower()
-        if key in self._CONVERSIONS:
-            group = self._CONVERSIONS[key]
-            factor = group.get(unit)
-            if factor is None:
-                return qty, unit
-
-            qty_base = qty * factor
-            # Find the best unit representation
-            for u, f in sorted(group.items(), key=lambda it: -it[1]):
-                if qty_base % f == 0:
-                    return qty_base // f, u
-            return qty_base / group.get(unit, 1.0), unit
-        return qty, unit
-
     # ── Recipe Ingredient Aggregation ───────────────────────────────────────────────────────────────────────
-    def get_recipe_ingredients(self, recipe_ids: List[int]) -> List[RecipeIngredient]:
+    def aggregate_with_breakdown(
+            self,
+            recipe_ids: List[int]
+        ) -> Tuple[List[ShoppingItem], Dict[str, List[Tuple[str, float, str]]]]:
         """
-        Fetch all recipe ingredients for given recipe IDs.
-        Handles duplicate recipe IDs by counting occurrences and scaling quantities.
+        Aggregate ingredients into shopping items and build their per-recipe breakdown
+        from a single row stream.
+
+        One column query (recipe ingredient + ingredient + recipe name) feeds both
+        results; duplicate recipe IDs scale quantities by their count instead of
+        repeating rows. Quantities are summed in base units per (ingredient, unit
+        group) via unit_utils, so "1 cup + 2 Tbs" adds up, and incompatible units
+        (cups vs. cans) become separate items.
 
         Args:
-            recipe_ids (List[int]): List of recipe IDs to fetch ingredients for.
+            recipe_ids (List[int]): Recipe IDs to aggregate; duplicates count multiple times.
 
         Returns:
-            List[RecipeIngredient]: List of RecipeIngredient objects with loaded relationships.
+            Tuple[List[ShoppingItem], Dict[str, List[Tuple[str, float, str]]]]:
+                Unsaved ShoppingItems, and (recipe_name, quantity, unit) contributions keyed
+                by the matching item's state key.
         """
         if not recipe_ids:
-            return []
+            return [], {}
 
-        # Count occurrences of each recipe ID
-        from collections import Counter
         recipe_counts = Counter(recipe_ids)
-        unique_recipe_ids = list(recipe_counts.keys())
-
-        stmt = select(RecipeIngredient).where(
-            RecipeIngredient.recipe_id.in_(unique_recipe_ids)
-        ).options(
-            joinedload(RecipeIngredient.ingredient),
-            joinedload(RecipeIngredient.recipe)
+        stmt = (
+            select(
+                RecipeIngredient.recipe_id,
+                RecipeIngredient.ingredient_id,
+                RecipeIngredient.quantity,
+                RecipeIngredient.unit,
+                Ingredient.ingredient_name,
+                Ingredient.ingredient_category,
+                Recipe.recipe_name,
+            )
+            .join(Ingredient, RecipeIngredient.ingredient_id == Ingredient.id)
+            .join(Recipe, RecipeIngredient.recipe_id == Recipe.id)
+            .where(RecipeIngredient.recipe_id.in_(recipe_counts))
+            .order_by(RecipeIngredient.recipe_id, RecipeIngredient.ingredient_id)
         )
-        recipe_ingredients = self.session.scalars(stmt).unique().all()
-
-        # Duplicate recipe ingredients based on count
-        result = []
-        for ri in recipe_ingredients:
-            count = recipe_counts[ri.recipe_id]
-            for _ in range(count):
-                result.append(ri)
-
-        return result
-
-    def aggregate_ingredients(self, recipe_ids: List[int]) -> List[ShoppingItem]:
-        """
-        Aggregate ingredients from recipes into shopping items.
 
-        Args:
-            recipe_ids (List[int]): List of recipe IDs to aggregate ingredients from.
+        # totals by (ingredient ID, unit group) in base units, contributions by recipe name
+        aggregation: Dict[Tuple[int, str], Dict[str, Any]] = {}
+
+        for row in self.session.execute(stmt):
+            base_qty, info = to_base_quantity(row.ingredient_name, row.quantity or 0.0, row.unit or "")
+            base_qty *= recipe_counts[row.recipe_id]
+
+            data = aggregation.setdefault((row.ingredient_id, info.group), {
+                "name": row.ingredient_name,
+                "category": row.ingredient_category,
+                "info": info,           # largest unit entered: display system and fallback unit
+                "raw_unit": row.unit or "",
+                "base": 0.0,
+                "recipes": defaultdict(float),
+            })
+            if info.factor > data["info"].factor:
+                data["info"] = info
+            data["base"] += base_qty
+            data["recipes"][row.recipe_name] += base_qty
 
-        Returns:
-            List[ShoppingItem]: List of aggregated ShoppingItem objects.
-        """
-        recipe_ingredients = self.get_recipe_ingredients(recipe_ids)
-
-        # aggregate by ingredient ID
-        aggregation: Dict[int, Dict[str, Any]] = defaultdict(lambda: {
-            "quantity": 0.0,
-            "unit": None,
-            "category": None,
-            "name": None,
-        })
-
-        for ri in recipe_ingredients:
-            ingredient: Ingredient = ri.ingredient
-            data = aggregation[ri.ingredient_id]
-            data["name"] = ingredient.ingredient_name
-            data["category"] = ingredient.ingredient_category
-            data["unit"] = ri.unit or data["unit"]
-            data["quantity"] += ri.quantity or 0.0
-
-        # convert to ShoppingItem objects
         items: List[ShoppingItem] = []
+        breakdown: Dict[str, List[Tuple[str, float, str]]] = {}
         for data in aggregation.values():
-            # apply unit conversions
-            converted_qty, converted_unit = self._convert_quantity(
-                data["name"], data["quantity"], data["unit"] or ""
-            )
+            name, info = data["name"], data["info"]
+            quantity, unit = best_display_unit(name, data["base"], info, data["raw_unit"])
 
-            # create state key for persistence
-            state_key = ShoppingState.create_key(data["name"], converted_unit)
+            # keyed by the unit group, not the display unit, so a checked item stays
+            # checked when the total moves to another unit (3 cup -> 1.25 quart)
+            state_key = ShoppingState.create_key(name, info.base_unit)
 
-            item = ShoppingItem(
-                ingredient_name=data["name"],
-                quantity=converted_qty,
-                unit=converted_unit,
+            items.append(ShoppingItem(
+                ingredient_name=name,
+                quantity=quantity,
+                unit=unit,
                 category=data["category"],
                 source="recipe",
                 have=False,
                 state_key=state_key
-            )
-            items.append(item)
+            ))
+            breakdown[state_key] = [
+                (recipe_name, *best_display_unit(name, base_qty, info, data["raw_unit"]))
+                for recipe_name, base_qty in data["recipes"].items()
+            ]
 
-        return items
+        return items, breakdown
 
-    def get_ingredient_breakdown(
-            self,
-            recipe_ids: List[int]
-        ) -> Dict[str, List[Tuple[str, float, str]]]:
+    def aggregate_ingredients(self, recipe_ids: List[int]) -> List[ShoppingItem]:
         """
-        Get detailed breakdown of ingredients used in recipes.
+        Aggregate ingredients from recipes into shopping items.
 
         Args:
-            recipe_ids (List[int]): List of recipe IDs to get breakdown for.
+            recipe_ids (List[int]): List of recipe IDs to aggregate ingredients from.
 
         Returns:
-            Dict[str, List[Tuple[str, float, str]]]: Breakdown by ingredient key.
+            List[ShoppingItem]: List of aggregated ShoppingItem objects.
         """
-        recipe_ingredients = self.get_recipe_ingredients(recipe_ids)
-        breakdown: Dict[str, List[Tuple[str, float, str]]] = defaultdict(list)
-
-        # First, aggregate by ingredient and recipe to combine duplicate recipes
-        recipe_aggregation: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(lambda: defaultdict(lambda: {
-            "quantity": 0.0,
-            "unit": None
-        }))
-
-        for ri in recipe_ingredients:
-            ingredient = ri.ingredient
-            recipe = ri.recipe
-
-            # apply unit conversions
-            converted_qty, converted_unit = self._convert_quantity(
-                ingredient.ingredient_name, ri.quantity or 0.0, ri.unit or ""
-            )
-
-            # create breakdown key using normalized format for state persistence
-            key = ShoppingState.create_key(ingredient.ingredient_name, converted_unit)
-
-            # Aggregate by recipe name within each ingredient
-            recipe_data = recipe_aggregation[key][recipe.recipe_name]
-            recipe_data["quantity"] += converted_qty
-            recipe_data["unit"] = converted_unit
-
-        # Convert aggregated data to the expected format
-        for ingredient_key, recipes in recipe_aggregation.items():
-            for recipe_name, recipe_data in recipes.items():
-                breakdown[ingredient_key].append((recipe_name, recipe_data["quantity"], recipe_data["unit"]))
-
-        return breakdown
+        items, _ = self.aggregate_with_breakdown(recipe_ids)
+        return items
 
     # ── Shopping Item CRUD Operations ───────────────────────────────────────────────────────────────────────
     def create_shopping_item(self, shopping_item: ShoppingItem) -> ShoppingItem:
@@ -245,6 +179,28 @@ class ShoppingRepo:
         result = self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    def get_state_fields(self, item_ids: List[int]) -> List[Tuple[int, str, Optional[str], float, Optional[str]]]:
+        """
+        Get what a status write needs for many items, in one query.
+
+        Args:
+            item_ids (List[int]): IDs of the items.
+
+        Returns:
+            List[Tuple[int, str, Optional[str], float, Optional[str]]]:
+                (id, source, state_key, quantity, unit) rows for the items that exist.
+        """
+        if not item_ids:
+            return []
+        stmt = select(
+            ShoppingItem.id,
+            ShoppingItem.source,
+            ShoppingItem.state_key,
+            ShoppingItem.quantity,
+            ShoppingItem.unit,
+        ).where(ShoppingItem.id.in_(item_ids))
+        return [tuple(row) for row in self.session.execute(stmt)]
+
     def update_item_status(self, item_id: int, have: bool) -> bool:
         """
         Update the 'have' status of a shopping item by ID.
@@ -329,6 +285,20 @@ class ShoppingRepo:
         """
         return self.clear_shopping_items(source="recipe")
 
+    def clear_completed_items(self) -> int:
+        """
+        Clear all checked shopping items.
+
+        The bare boolean predicate renders as `have = 1` on SQLite (`have` on
+        PostgreSQL), matching the partial index ix_shopping_items_have.
+
+        Returns:
+            int: Number of items deleted.
+        """
+        stmt = delete(ShoppingItem).where(ShoppingItem.have)
+        result = self.session.execute(stmt)
+        return result.rowcount
+
     # ── Shopping Item Search and Filter ─────────────────────────────────────────────────────────────────────
     def search_shopping_items(
         self,
@@ -393,6 +363,22 @@ class ShoppingRepo:
         result = self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    def get_checked_states(self, keys: List[str]) -> Dict[str, bool]:
+        """
+        Get the saved checked flag for many state keys in one query.
+
+        Args:
+            keys (List[str]): State keys (normalized here).
+
+        Returns:
+            Dict[str, bool]: Checked flag by normalized key, for keys that have a saved state.
+        """
+        normalized = {ShoppingState.normalize_key(key) for key in keys}
+        if not normalized:
+            return {}
+        stmt = select(ShoppingState.key, ShoppingState.checked).where(ShoppingState.key.in_(normalized))
+        return dict(self.session.execute(stmt).all())
+
     def save_shopping_state(
             self,
             key: str,
@@ -439,6 +425,66 @@ class ShoppingRepo:
         self.session.refresh(state)
         return state
 
+    def write_shopping_states(self, states: List[Tuple[str, float, str, bool]]) -> int:
+        """
+        Insert or update many shopping states in one executemany upsert.
+
+        SQLite and PostgreSQL use `INSERT ... ON CONFLICT(key) DO UPDATE`; other
+        backends fall back to one keyed SELECT plus an executemany UPDATE and INSERT.
+        Unlike save_shopping_state, nothing is read back into the session.
+
+        Args:
+            states (List[Tuple[str, float, str, bool]]): (key, quantity, unit, checked) tuples;
+                a later entry for the same key wins.
+
+        Returns:
+            int: Number of states written.
+        """
+        rows: Dict[str, dict] = {}
+        for key, quantity, unit, checked in states:
+            normalized_key = ShoppingState.normalize_key(key)
+            rows[normalized_key] = {
+                "key": normalized_key, "quantity": quantity, "unit": unit, "checked": checked
+            }
+        if not rows:
+            return 0
+
+        table = ShoppingState.__table__
+        dialect = self.session.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as upsert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as upsert
+            stmt = upsert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.key],
+                set_={
+                    "quantity": stmt.excluded.quantity,
+                    "unit": stmt.excluded.unit,
+                    "checked": stmt.excluded.checked,
+                },
+            )
+            self.session.execute(stmt, list(rows.values()))
+            return len(rows)
+
+        existing = set(self.session.scalars(
+            select(ShoppingState.key).where(ShoppingState.key.in_(rows))
+        ))
+        to_update = [
+            {"b_key": key, "quantity": row["quantity"], "unit": row["unit"], "checked": row["checked"]}
+            for key, row in rows.items() if key in existing
+        ]
+        to_insert = [row for key, row in rows.items() if key not in existing]
+        if to_update:
+            self.session.execute(
+                update(table).where(table.c.key == bindparam("b_key")),
+                to_update
+            )
+        if to_insert:
+            self.session.execute(insert(table), to_insert)
+        return len(rows)
+
     def toggle_shopping_state(self, key: str) -> Optional[bool]:
         """
         Toggle the checked status of a shopping state.
@@ -494,9 +540,39 @@ class ShoppingRepo:
                 checked_items / total_items * 100) if total_items > 0 else 0
         }
 
+    def write_have_status(self, updates: List[Tuple[int, bool]]) -> int:
+        """
+        Write 'have' for many items in one `UPDATE ... WHERE id IN (...)` statement.
+
+        Mixed values are set with a CASE on the item ID, so the statement count does
+        not grow with the batch.
+
+        Args:
+            updates (List[Tuple[int, bool]]): (item_id, have) tuples; a later entry for the same ID wins.
+
+        Returns:
+            int: Number of rows updated.
+        """
+        values = dict(updates)
+        if not values:
+            return 0
+
+        distinct = set(values.values())
+        if len(distinct) == 1:
+            have = distinct.pop()
+        else:
+            have = case(values, value=ShoppingItem.id)
+        stmt = (
+            update(ShoppingItem)
+            .where(ShoppingItem.id.in_(values))
+            .values(have=have)
+            .execution_options(synchronize_session=False)
+        )
+        return self.session.execute(stmt).rowcount
+
     def bulk_update_have_status(self, updates: List[Tuple[int, bool]]) -> int:
         """
-        Bulk update have status for multiple items.
+        Bulk update have status for multiple items in a single statement.
 
         Args:
             updates (List[Tuple[int, bool]]): List of (item_id, have_status) tuples.
@@ -504,28 +580,29 @@ class ShoppingRepo:
         Returns:
             int: Number of items updated.
         """
-        updated_count = 0
-        for item_id, have_status in updates:
-            item = self.get_shopping_item_by_id(item_id)
-            if item:
-                item.have = have_status
-                updated_count += 1
-
-
-        return updated_count
+        return self.write_have_status(updates)
 
     def bulk_update_states(self, updates: Dict[str, bool]) -> int:
         """
-        Bulk update 'checked' status for multiple shopping states by key.
+        Bulk update 'checked' status for multiple shopping states by key, in one statement.
         Args:
             updates: mapping of state key to new checked value.
         Returns:
             Number of states updated.
         """
-        updated_count = 0
-        for key, checked in updates.items():
-            state = self.get_shopping_state(key)
-            if state:
-                state.checked = checked
-                updated_count += 1
-        return updated_count
+        values = {ShoppingState.normalize_key(key): checked for key, checked in updates.items()}
+        if not values:
+            return 0
+
+        distinct = set(values.values())
+        if len(distinct) == 1:
+            checked = distinct.pop()
+        else:
+            checked = case(values, value=ShoppingState.key)
+        stmt = (
+            update(ShoppingState)
+            .where(ShoppingState.key.in_(values))
+            .values(checked=checked)
+            .execution_options(synchronize_session=False)
+        )
+        return self.session.execute(stmt).rowcount
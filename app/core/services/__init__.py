@@ -1,12 +1,29 @@
 # app/core/services/__init__.py
+#
+# Service classes are resolved on first attribute access (PEP 562) so that importing
+# the package does not pull in every repository, model and optional dependency up front.
 
-from .ingredient_service import IngredientService
-from .planner_service import PlannerService
-from .recipe_service import (
-    DuplicateRecipeError,
-    RecipeSaveError,
-    RecipeService)
-from .shopping_service import ShoppingService
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ingredient_service import IngredientService
+    from .planner_service import PlannerService
+    from .recipe_service import (
+        DuplicateRecipeError,
+        RecipeSaveError,
+        RecipeService)
+    from .shopping_service import ShoppingService
+
+# attribute name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "IngredientService":    ".ingredient_service",
+    "PlannerService":       ".planner_service",
+    "RecipeService":        ".recipe_service",
+    "RecipeSaveError":      ".recipe_service",
+    "DuplicateRecipeError": ".recipe_service",
+    "ShoppingService":      ".shopping_service",
+}
 
 __all__ = [
     "RecipeService",
@@ -16,3 +33,16 @@ __all__ = [
     "PlannerService",
     "ShoppingService",
 ]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value  # cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
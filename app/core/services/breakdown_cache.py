@@ -0,0 +1,75 @@
+"""app/core/services/breakdown_cache.py
+
+Cache of shopping list ingredient breakdowns keyed by the recipe multiset.
+
+ShoppingService stores the breakdown it builds while aggregating a shopping list, so
+the list's tooltips read it back instead of re-running the aggregation. Keys hold each
+recipe's count and its recipe_cache generation, so an edited recipe yields a new key
+and stale entries simply age out; ingredient edits clear the cache.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .recipe_cache import recipe_cache
+
+# ── Constants ──
+BREAKDOWN_CACHE_MAX_ENTRIES = 16
+
+Breakdown = Dict[str, List[Tuple[str, float, str]]]
+BreakdownKey = Tuple[Tuple[int, int, int], ...]   # (recipe_id, count, recipe generation)
+
+
+# ── Breakdown Cache ─────────────────────────────────────────────────────────────────────────────────────────
+class BreakdownCache:
+    """Thread-safe LRU cache of ingredient breakdowns keyed by recipe multiset."""
+
+    def __init__(self, max_entries: int = BREAKDOWN_CACHE_MAX_ENTRIES):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[BreakdownKey, Breakdown]" = OrderedDict()
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key_for(recipe_ids: Iterable[int]) -> BreakdownKey:
+        """Return the cache key for a list of recipe IDs (order-insensitive, duplicates counted)."""
+        return tuple(sorted(
+            (recipe_id, count, recipe_cache.version(recipe_id))
+            for recipe_id, count in Counter(recipe_ids).items()
+        ))
+
+    def get(self, key: BreakdownKey) -> Optional[Breakdown]:
+        """Return the cached breakdown, or None (counted as a miss)."""
+        with self._lock:
+            breakdown = self._entries.get(key)
+            if breakdown is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return breakdown
+
+    def put(self, key: BreakdownKey, breakdown: Breakdown) -> None:
+        """Cache a breakdown, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = breakdown
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every breakdown, e.g. after an ingredient is renamed or deleted."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """Return size and hit/miss counts."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+
+# Create a single instance for import
+breakdown_cache = BreakdownCache()
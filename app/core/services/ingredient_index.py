@@ -0,0 +1,282 @@
+"""app/core/services/ingredient_index.py
+
+Process-wide in-memory index of ingredient names for autocomplete.
+
+Names are split into casefolded word tokens and stored in a character trie. Every
+trie node keeps the best-ranked names below it (ranked by how many recipe links use
+the name, then alphabetically), so a single-word prefix is answered by walking the
+prefix and slicing that list. The index is built once from the database and then
+updated in place when ingredients are created or used (ranks only ever improve, so a
+name is just re-placed along its token paths); renames and deletes invalidate it, and
+the next search rebuilds it through the registered loader so open forms keep their
+suggestions.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import bisect
+import heapq
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from _dev_tools import DebugLogger
+
+# ── Constants ──
+NODE_TOP_SIZE = 50           # ranked names cached per trie node (the largest fast-path limit)
+DEFAULT_SUGGESTIONS = 20
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into casefolded word tokens (punctuation separates words)."""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: List[int] = []     # names with a token ending at this node
+        self.top: List[int] = []     # best-ranked names in this subtree
+
+
+# ── Ingredient Index ────────────────────────────────────────────────────────────────────────────────────────
+class IngredientIndex:
+    """Thread-safe word-prefix trie of ingredient names ranked by usage."""
+
+    def __init__(self, node_top_size: int = NODE_TOP_SIZE):
+        self._lock = threading.Lock()
+        self._node_top_size = node_top_size
+        self._loaded = False
+        self._loader: Optional[Callable[[], Iterable[Tuple[str, int]]]] = None
+        self._clear()
+
+    def _clear(self):
+        self._root = _TrieNode()
+        self._names: List[str] = []              # display name by id
+        self._folded: List[str] = []             # casefolded, whitespace-collapsed name by id
+        self._tokens: List[Tuple[str, ...]] = []
+        self._uses: List[int] = []
+        self._ids_by_folded: Dict[str, int] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been built since start-up or the last invalidation."""
+        return self._loaded
+
+    # ── Building ──
+    def load(self, rows: Iterable[Tuple[str, int]]) -> None:
+        """
+        Rebuild the index from (name, use count) rows.
+
+        Names that differ only in case or spacing share one entry, shown with the
+        spelling of its most used row.
+
+        Args:
+            rows (Iterable[Tuple[str, int]]): Ingredient names with their recipe link counts.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            self._clear()
+            for name, uses in sorted(rows, key=lambda row: -row[1]):
+                self._register(name, uses)
+            for name_id, tokens in enumerate(self._tokens):
+                for token in tokens:
+                    self._path(token)[-1].ids.append(name_id)
+            self._fill_tops(self._root)
+            self._loaded = True
+            count = len(self._names)
+        DebugLogger.log(
+            f"Ingredient index built: {count} names in {(time.perf_counter() - start) * 1000:.1f}ms", "debug"
+        )
+
+    def set_loader(self, loader: Callable[[], Iterable[Tuple[str, int]]]) -> None:
+        """Register the callable that fetches (name, use count) rows for rebuilds after invalidation."""
+        self._loader = loader
+
+    def invalidate(self) -> None:
+        """Drop the index (after renames and deletes); the next query rebuilds it through the loader."""
+        with self._lock:
+            self._clear()
+            self._loaded = False
+
+    def add(self, names: Iterable[str]) -> None:
+        """Add names that are not indexed yet (no-op until the index is loaded)."""
+        self._update(names, uses=0)
+
+    def record_use(self, names: Iterable[str]) -> None:
+        """Count one more recipe use of each name, adding unknown names."""
+        self._update(names, uses=1)
+
+    # ── Queries ──
+    def search(self, text: str, limit: int = DEFAULT_SUGGESTIONS) -> List[str]:
+        """
+        Return the best-ranked names matching typed text.
+
+        Every word of the text must be a prefix of some word of the name, so "chi br"
+        matches "Chicken Breast". An exact name match is always listed first; empty
+        text returns the most used names.
+
+        Args:
+            text (str): Text typed so far.
+            limit (int): Maximum number of names to return.
+
+        Returns:
+            List[str]: Matching display names, best first.
+        """
+        self._ensure_loaded()
+        query = tokenize(text)
+        with self._lock:
+            if not query:
+                return [self._names[i] for i in self._root.top[:limit]]
+
+            anchor = max(query, key=len)
+            node = self._walk(anchor)
+            if node is None:
+                return []
+
+            others = list(query)
+            others.remove(anchor)
+            matches = [name_id for name_id in node.top if self._matches(name_id, others)] if others else node.top
+            if len(matches) >= limit:
+                # the node's top list is the subtree's best, so its first matches are too
+                ranked = matches[:limit]
+            elif len(node.top) < self._node_top_size:
+                ranked = matches  # the top list holds the whole subtree
+            else:
+                candidates = [name_id for name_id in self._subtree_ids(node) if self._matches(name_id, others)]
+                ranked = heapq.nsmallest(limit, candidates, key=self._rank)
+
+            exact = self._ids_by_folded.get(" ".join(text.casefold().split()))
+            if exact is not None:
+                ranked = [exact] + [name_id for name_id in ranked if name_id != exact][:limit - 1]
+            return [self._names[i] for i in ranked]
+
+    def contains(self, name: str) -> bool:
+        """Return True if the name is indexed (case- and spacing-insensitive)."""
+        self._ensure_loaded()
+        with self._lock:
+            return " ".join(name.casefold().split()) in self._ids_by_folded
+
+    def get_stats(self) -> dict:
+        """Return index size and state."""
+        with self._lock:
+            return {"loaded": self._loaded, "names": len(self._names)}
+
+    # ── Internal ──
+    def _ensure_loaded(self):
+        """Rebuild an invalidated index through the loader, if one is registered."""
+        if self._loaded or self._loader is None:
+            return
+        try:
+            self.load(self._loader())
+        except Exception as e:
+            DebugLogger.log(f"Ingredient index rebuild failed: {e}", "error")
+
+    def _rank(self, name_id: int) -> Tuple[int, str]:
+        return -self._uses[name_id], self._folded[name_id]
+
+    def _matches(self, name_id: int, prefixes: List[str]) -> bool:
+        tokens = self._tokens[name_id]
+        return all(any(token.startswith(prefix) for token in tokens) for prefix in prefixes)
+
+    def _register(self, name: str, uses: int) -> Optional[int]:
+        """Add a name's entry (not its trie paths); returns the new id, or None if known."""
+        folded = " ".join(name.casefold().split())
+        tokens = tuple(dict.fromkeys(tokenize(name)))
+        if not tokens:
+            return None
+        name_id = self._ids_by_folded.get(folded)
+        if name_id is not None:
+            self._uses[name_id] += uses
+            return None
+        name_id = len(self._names)
+        self._names.append(name.strip())
+        self._folded.append(folded)
+        self._tokens.append(tokens)
+        self._uses.append(uses)
+        self._ids_by_folded[folded] = name_id
+        return name_id
+
+    def _update(self, names: Iterable[str], uses: int):
+        with self._lock:
+            if not self._loaded:
+                return
+            for name in names:
+                known = self._ids_by_folded.get(" ".join(name.casefold().split()))
+                new_id = self._register(name, uses)
+                if new_id is not None:
+                    for token in self._tokens[new_id]:
+                        path = self._path(token)
+                        path[-1].ids.append(new_id)
+                        for node in path:
+                            self._promote(node, new_id)
+                elif known is not None and uses:
+                    for token in self._tokens[known]:
+                        for node in self._path(token):
+                            self._promote(node, known)
+
+    def _promote(self, node: _TrieNode, name_id: int):
+        """Re-place a name whose rank improved (or that is new) in a node's top list."""
+        top = node.top
+        rank = self._rank(name_id)
+        if name_id in top:
+            top.remove(name_id)
+        elif len(top) >= self._node_top_size and rank >= self._rank(top[-1]):
+            return
+        position = bisect.bisect_left([self._rank(i) for i in top], rank)
+        top.insert(position, name_id)
+        del top[self._node_top_size:]
+
+    def _walk(self, prefix: str) -> Optional[_TrieNode]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _path(self, token: str) -> List[_TrieNode]:
+        """Return the nodes from the root to `token`, creating missing ones."""
+        node = self._root
+        path = [node]
+        for char in token:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+            path.append(node)
+        return path
+
+    def _subtree_ids(self, node: _TrieNode) -> set:
+        ids = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            ids.update(current.ids)
+            stack.extend(current.children.values())
+        return ids
+
+    def _refresh_top(self, node: _TrieNode):
+        candidates = set(node.ids)
+        for child in node.children.values():
+            candidates.update(child.top)
+        node.top = heapq.nsmallest(self._node_top_size, candidates, key=self._rank)
+
+    def _fill_tops(self, root: _TrieNode):
+        # iterative post-order so children are ranked before their parent
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+        for node in reversed(order):
+            self._refresh_top(node)
+
+
+# Create a single instance for import
+ingredient_index = IngredientIndex()
@@ -0,0 +1,217 @@
+"""app/core/services/ingredient_matcher.py
+
+Process-wide fuzzy matcher over stored ingredients, used to catch near-duplicates.
+
+Each ingredient is reduced to a plural-stemmed key ("Roma Tomatoes" -> "roma tomato")
+and indexed by the key's character trigrams. A lookup counts shared trigrams through
+the posting lists and scores candidates by trigram Jaccard similarity, so "tomatoes"
+finds "Tomato" (1.0) and "Roma tomato" (0.64). Like the ingredient name index, the
+matcher is loaded once, extended in place on create and invalidated on rename,
+delete and merge, then rebuilt through its loader on the next match.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from _dev_tools import DebugLogger
+
+from ..utils.text_utils import fuzzy_key, trigrams
+
+# ── Constants ──
+SUGGEST_THRESHOLD = 0.5      # minimum similarity offered as a suggestion on entry
+MERGE_THRESHOLD = 0.9        # default similarity for grouping duplicates to merge
+DEFAULT_MATCHES = 5
+
+
+@dataclass(frozen=True)
+class MatchEntry:
+    """An indexed ingredient."""
+    id: int
+    name: str
+    category: str
+    key: str
+    category_key: str
+    grams: FrozenSet[str]
+    uses: int
+
+
+# ── Ingredient Matcher ──────────────────────────────────────────────────────────────────────────────────────
+class IngredientMatcher:
+    """Thread-safe trigram index of ingredients with plural-stemmed keys."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._loader: Optional[Callable[[], Iterable[Tuple[int, str, str, int]]]] = None
+        self._entries: Dict[int, MatchEntry] = {}
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the matcher has been built since start-up or the last invalidation."""
+        return self._loaded
+
+    # ── Building ──
+    def load(self, rows: Iterable[Tuple[int, str, str, int]]) -> None:
+        """
+        Rebuild the matcher from (id, name, category, use count) rows.
+
+        Args:
+            rows (Iterable[Tuple[int, str, str, int]]): Ingredients with their recipe link counts.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+            for ingredient_id, name, category, uses in rows:
+                self._index(ingredient_id, name, category, uses)
+            self._loaded = True
+
+    def add(self, ingredient_id: int, name: str, category: str) -> None:
+        """Index a newly created ingredient (no-op until the matcher is loaded)."""
+        with self._lock:
+            if self._loaded and ingredient_id not in self._entries:
+                self._index(ingredient_id, name, category, 0)
+
+    def set_loader(self, loader: Callable[[], Iterable[Tuple[int, str, str, int]]]) -> None:
+        """Register the callable that fetches (id, name, category, use count) rows for rebuilds."""
+        self._loader = loader
+
+    def invalidate(self) -> None:
+        """Drop the matcher; the next match rebuilds it through the loader."""
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+            self._loaded = False
+
+    # ── Queries ──
+    def match(
+        self,
+        name: str,
+        category: Optional[str] = None,
+        limit: int = DEFAULT_MATCHES,
+        threshold: float = SUGGEST_THRESHOLD,
+    ) -> List[Tuple[MatchEntry, float]]:
+        """
+        Return the stored ingredients most similar to a name.
+
+        Args:
+            name (str): Name as entered.
+            category (Optional[str]): If given, ingredients in this category rank first
+                among equally similar ones.
+            limit (int): Maximum number of matches.
+            threshold (float): Minimum trigram similarity.
+
+        Returns:
+            List[Tuple[MatchEntry, float]]: Matches with their similarity, best first.
+        """
+        self._ensure_loaded()
+        grams = trigrams(fuzzy_key(name))
+        category_key = fuzzy_key(category) if category else None
+        with self._lock:
+            scored = self._scored(grams, threshold)
+        scored.sort(key=lambda pair: (
+            -pair[1], pair[0].category_key != category_key, -pair[0].uses, pair[0].name.casefold()
+        ))
+        return scored[:limit]
+
+    def canonical(self, name: str, category: str) -> Optional[MatchEntry]:
+        """
+        Return the stored ingredient a name is a plural/case variant of, in the same category.
+
+        Args:
+            name (str): Name as entered.
+            category (str): Category as entered.
+
+        Returns:
+            Optional[MatchEntry]: The most used stored ingredient with the same stemmed
+                name and category, or None if there is none.
+        """
+        key, category_key = fuzzy_key(name), fuzzy_key(category)
+        with self._lock:
+            same = [
+                entry for entry, _ in self._scored(trigrams(key), 1.0)
+                if entry.key == key and entry.category_key == category_key
+            ]
+        return min(same, key=lambda entry: (-entry.uses, entry.id), default=None)
+
+    def duplicate_groups(self, threshold: float = MERGE_THRESHOLD) -> List[List[MatchEntry]]:
+        """
+        Group ingredients of the same category whose names are at least `threshold` similar.
+
+        Groups are transitive (if A~B and B~C, all three share a group). The first
+        entry of each group is the canonical one: the most used, then the oldest.
+
+        Args:
+            threshold (float): Minimum trigram similarity for two names to be grouped.
+
+        Returns:
+            List[List[MatchEntry]]: Groups with at least two ingredients.
+        """
+        with self._lock:
+            parent = {ingredient_id: ingredient_id for ingredient_id in self._entries}
+
+            def find(ingredient_id: int) -> int:
+                while parent[ingredient_id] != ingredient_id:
+                    parent[ingredient_id] = parent[parent[ingredient_id]]
+                    ingredient_id = parent[ingredient_id]
+                return ingredient_id
+
+            for entry in self._entries.values():
+                for other, _ in self._scored(entry.grams, threshold):
+                    if other.id != entry.id and other.category_key == entry.category_key:
+                        parent[find(other.id)] = find(entry.id)
+
+            groups: Dict[int, List[MatchEntry]] = defaultdict(list)
+            for ingredient_id, entry in self._entries.items():
+                groups[find(ingredient_id)].append(entry)
+
+        result = [
+            sorted(members, key=lambda entry: (-entry.uses, entry.id))
+            for members in groups.values() if len(members) > 1
+        ]
+        result.sort(key=lambda members: members[0].name.casefold())
+        return result
+
+    # ── Internal ──
+    def _ensure_loaded(self):
+        """Rebuild an invalidated matcher through the loader, if one is registered."""
+        if self._loaded or self._loader is None:
+            return
+        try:
+            self.load(self._loader())
+        except Exception as e:
+            DebugLogger.log(f"Ingredient matcher rebuild failed: {e}", "error")
+
+    def _index(self, ingredient_id: int, name: str, category: str, uses: int):
+        key = fuzzy_key(name)
+        entry = MatchEntry(ingredient_id, name, category, key, fuzzy_key(category), trigrams(key), uses)
+        self._entries[ingredient_id] = entry
+        for gram in entry.grams:
+            self._postings[gram].add(ingredient_id)
+
+    def _scored(self, grams: FrozenSet[str], threshold: float) -> List[Tuple[MatchEntry, float]]:
+        """Return (entry, similarity) for every entry at or above the threshold (lock held)."""
+        if not grams:
+            return []
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+
+        # Jaccard >= t needs at least t * |grams| shared trigrams, which prunes most candidates
+        min_shared = threshold * len(grams)
+        scored = []
+        for ingredient_id, count in shared.items():
+            if count < min_shared:
+                continue
+            entry = self._entries[ingredient_id]
+            similarity = count / (len(grams) + len(entry.grams) - count)
+            if similarity >= threshold:
+                scored.append((entry, similarity))
+        return scored
+
+
+# Create a single instance for import
+ingredient_matcher = IngredientMatcher()
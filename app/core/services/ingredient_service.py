@@ -5,17 +5,47 @@ Uses SQLAlchemy repository pattern for database interactions.
 """
 
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from _dev_tools import DebugLogger
+
 from ..dtos.ingredient_dtos import (
     IngredientCreateDTO,
+    IngredientMatchDTO,
+    IngredientMergeConflictDTO,
+    IngredientMergeGroupDTO,
+    IngredientMergeResultDTO,
+    IngredientResponseDTO,
     IngredientSearchDTO,
     IngredientUpdateDTO)
 from ..models.ingredient import Ingredient
 from ..repositories.ingredient_repo import IngredientRepo
+from .breakdown_cache import breakdown_cache
+from .ingredient_index import IngredientIndex, ingredient_index
+from .ingredient_matcher import (
+    DEFAULT_MATCHES,
+    MERGE_THRESHOLD,
+    SUGGEST_THRESHOLD,
+    IngredientMatcher,
+    MatchEntry,
+    ingredient_matcher)
+from .recipe_cache import recipe_cache
+from .session_manager import session_scope
+
+
+# ── Loaders ─────────────────────────────────────────────────────────────────────────────────────────────────
+def _fetch_name_usage() -> list[tuple[str, int]]:
+    """Name index rows read with a short-lived session (rebuilds happen outside any service)."""
+    with session_scope() as session:
+        return IngredientRepo(session).get_name_usage()
+
+def _fetch_usage_by_id() -> list[tuple[int, str, str, int]]:
+    """Matcher rows read with a short-lived session."""
+    with session_scope() as session:
+        return IngredientRepo(session).get_usage_by_id()
 
 
 # ── Ingredient Service ──────────────────────────────────────────────────────────────────────────────────────
@@ -76,6 +106,165 @@ class IngredientService:
         """
         return self.repo.get_distinct_names()
 
+    def load_name_index(self) -> IngredientIndex:
+        """
+        Return the process-wide ingredient name index, building it on first use.
+
+        Also registers the loader the index uses to rebuild itself after an invalidation.
+
+        Returns:
+            IngredientIndex: The loaded index (shared; updated as ingredients are created).
+        """
+        ingredient_index.set_loader(_fetch_name_usage)
+        if not ingredient_index.loaded:
+            ingredient_index.load(self.repo.get_name_usage())
+        return ingredient_index
+
+    # ── Fuzzy Matching ──────────────────────────────────────────────────────────────────────────────────────
+    def load_matcher(self) -> IngredientMatcher:
+        """
+        Return the process-wide fuzzy ingredient matcher, building it on first use.
+
+        Also registers the loader the matcher uses to rebuild itself after an invalidation.
+
+        Returns:
+            IngredientMatcher: The loaded matcher (shared; updated as ingredients are created).
+        """
+        ingredient_matcher.set_loader(_fetch_usage_by_id)
+        if not ingredient_matcher.loaded:
+            ingredient_matcher.load(self.repo.get_usage_by_id())
+        return ingredient_matcher
+
+    def suggest_matches(
+        self,
+        name: str,
+        category: Optional[str] = None,
+        limit: int = DEFAULT_MATCHES,
+        threshold: float = SUGGEST_THRESHOLD,
+    ) -> List[IngredientMatchDTO]:
+        """
+        Return stored ingredients similar to a name being entered (plurals and typos included).
+
+        Args:
+            name (str): Name as entered.
+            category (Optional[str]): Category as entered; same-category matches rank first.
+            limit (int): Maximum number of suggestions.
+            threshold (float): Minimum trigram similarity (0-1).
+
+        Returns:
+            List[IngredientMatchDTO]: Suggestions, most similar first.
+        """
+        matches = self.load_matcher().match(name, category, limit, threshold)
+        return [
+            IngredientMatchDTO(
+                id=entry.id,
+                ingredient_name=entry.name,
+                ingredient_category=entry.category,
+                score=round(score, 3),
+            )
+            for entry, score in matches
+        ]
+
+    def find_duplicate_groups(self, threshold: float = MERGE_THRESHOLD) -> List[IngredientMergeGroupDTO]:
+        """
+        Group near-duplicate ingredients of the same category for merging.
+
+        Args:
+            threshold (float): Minimum trigram similarity between names in a group (0-1).
+
+        Returns:
+            List[IngredientMergeGroupDTO]: Groups, each with the most used ingredient as canonical.
+        """
+        def to_dto(entry: MatchEntry) -> IngredientResponseDTO:
+            return IngredientResponseDTO(
+                id=entry.id, ingredient_name=entry.name, ingredient_category=entry.category
+            )
+
+        return [
+            IngredientMergeGroupDTO(canonical=to_dto(group[0]), duplicates=[to_dto(e) for e in group[1:]])
+            for group in self.load_matcher().duplicate_groups(threshold)
+        ]
+
+    def find_merge_conflicts(self, mapping: Dict[int, int]) -> List[IngredientMergeConflictDTO]:
+        """
+        List the recipe links a merge would drop along with their quantity.
+
+        A recipe linking both a duplicate and its canonical ingredient keeps one link;
+        the other's quantity is added into it unless the units do not convert
+        (e.g. "1 can" and "2 whole"), in which case it is listed here.
+
+        Args:
+            mapping (Dict[int, int]): Duplicate ingredient id -> canonical ingredient id.
+
+        Returns:
+            List[IngredientMergeConflictDTO]: Links whose quantity the merge would discard.
+        """
+        return [
+            IngredientMergeConflictDTO(
+                recipe_id=row.recipe_id,
+                recipe_name=row.recipe_name,
+                ingredient_name=row.ingredient_name,
+                quantity=row.quantity,
+                unit=row.unit,
+                kept_ingredient_name=kept.ingredient_name,
+                kept_quantity=kept.quantity,
+                kept_unit=kept.unit,
+            )
+            for row, kept in self.repo.find_merge_conflicts(mapping)
+        ]
+
+    def merge_ingredients(self, mapping: Dict[int, int]) -> IngredientMergeResultDTO:
+        """
+        Merge duplicate ingredients into canonical ones in a single transaction.
+
+        Recipe links are rewritten to the canonical ids and the duplicates deleted;
+        where a recipe links both, quantities are added into the kept link when the
+        units convert (see find_merge_conflicts). Nothing is changed if any statement fails.
+
+        Args:
+            mapping (Dict[int, int]): Duplicate ingredient id -> canonical ingredient id.
+
+        Returns:
+            IngredientMergeResultDTO: Counts of merged ingredients and rewritten/combined/dropped links.
+
+        Raises:
+            ValueError: If a canonical id is itself mapped to another ingredient.
+        """
+        mapping = {dup: canon for dup, canon in mapping.items() if dup != canon}
+        chained = set(mapping) & set(mapping.values())
+        if chained:
+            raise ValueError(f"Ingredients {sorted(chained)} are both merged and merge targets")
+        if not mapping:
+            return IngredientMergeResultDTO(merged=0, links_rewritten=0, links_dropped=0)
+
+        try:
+            rewritten, combined, dropped = self.repo.merge_into(mapping)
+            self.session.commit()
+            # the bulk statements bypass the identity map, so detach the stale (possibly
+            # deleted) objects before SQLite reuses their ids; expiring is not enough,
+            # an expired object still holds its identity
+            self.session.expunge_all()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            DebugLogger.log(f"Ingredient merge failed, rolled back: {e}", "error")
+            raise e
+
+        breakdown_cache.clear()
+        recipe_cache.clear()
+        ingredient_index.invalidate()
+        ingredient_matcher.invalidate()
+        DebugLogger.log(
+            f"Merged {len(mapping)} ingredients: {rewritten} links rewritten, "
+            f"{combined} combined, {dropped} dropped", "info"
+        )
+        return IngredientMergeResultDTO(
+            merged=len(mapping),
+            links_rewritten=rewritten,
+            links_combined=combined,
+            links_dropped=dropped,
+            mapping=mapping,
+        )
+
     def get_all(self) -> list[Ingredient]:
         """
         Return all ingredients in the database.
@@ -99,6 +288,8 @@ class IngredientService:
         try:
             ing = self.get_or_create(create_dto)
             self.session.commit()
+            ingredient_index.add([ing.ingredient_name])
+            ingredient_matcher.add(ing.id, ing.ingredient_name, ing.ingredient_category)
             return ing
         except SQLAlchemyError as e:
             self.session.rollback()
@@ -115,6 +306,9 @@ class IngredientService:
             if update_dto.ingredient_category is not None:
                 ing.ingredient_category = update_dto.ingredient_category
             self.session.commit()
+            breakdown_cache.clear()  # names and categories are baked into breakdown keys
+            ingredient_index.invalidate()
+            ingredient_matcher.invalidate()
             return ing
         except SQLAlchemyError as e:
             self.session.rollback()
@@ -128,6 +322,9 @@ class IngredientService:
                 return False
             self.repo.delete(ing)
             self.session.commit()
+            breakdown_cache.clear()
+            ingredient_index.invalidate()
+            ingredient_matcher.invalidate()
             return True
         except SQLAlchemyError as e:
             self.session.rollback()
@@ -21,25 +21,25 @@ from ..dtos.planner_dtos import (
     MealSelectionCreateDTO,
     MealSelectionResponseDTO,
     MealSelectionUpdateDTO,
-    RecipeCardDTO)
+    RecipeCardDTO,
+    SavedMealPlanDTO)
 from ..models.meal_selection import MealSelection
 from ..repositories.planner_repo import PlannerRepo
+from .session_manager import ScopedService
 
 
 # ── Planner Service ─────────────────────────────────────────────────────────────────────────────────────────
-class PlannerService:
+class PlannerService(ScopedService):
     """Service for meal planner operations with business logic."""
 
     def __init__(self, session: Session | None = None):
         """
         Initialize the PlannerService with a database session and repository.
-        If no session is provided, a new session is created.
+        If no session is provided, a new session is created and owned (see ScopedService).
         """
-        if session is None:
-            from app.core.database.db import create_session
-            session = create_session()
-        self.session = session
+        self.session = self._init_session(session)
         self.repo = PlannerRepo(self.session)
+        self._saved_meal_ids: Optional[tuple[int, ...]] = None  # last plan known to be persisted
 
     # ── Meal Planner State Management ───────────────────────────────────────────────────────────────────────
     def load_saved_meal_ids(self) -> List[int]:
@@ -50,7 +50,9 @@ class PlannerService:
             List[int]: List of saved meal IDs from saved meal states.
         """
         try:
-            return self.repo.get_saved_meal_ids()
+            meal_ids = self.repo.get_saved_meal_ids()
+            self._saved_meal_ids = tuple(meal_ids)
+            return meal_ids
         except SQLAlchemyError as e:
             DebugLogger.log(f"Failed to load saved meal IDs: {e}", "error")
             return []
@@ -68,10 +70,46 @@ class PlannerService:
         except SQLAlchemyError as e:
             raise RuntimeError(f"Failed to load saved meal plan: {e}")
 
+    def load_saved_meal_plan(self) -> SavedMealPlanDTO:
+        """
+        Load the saved meal plan and every recipe it references in two queries.
+
+        Used to build all planner tabs at once, so the cost does not grow with
+        one round of lookups per tab.
+
+        Returns:
+            SavedMealPlanDTO: Saved meals in tab order, prefetched recipes and missing meal IDs.
+        """
+        try:
+            rows = self.repo.get_saved_meal_plan_rows()
+            meals = [meal for _, meal in rows if meal is not None]
+            missing_ids = [meal_id for meal_id, meal in rows if meal is None]
+
+            recipe_ids = [
+                recipe_id
+                for meal in meals
+                for recipe_id in (meal.main_recipe_id, meal.side_recipe_1_id,
+                                  meal.side_recipe_2_id, meal.side_recipe_3_id)
+                if recipe_id
+            ]
+            recipes = self.repo.get_recipes_for_cards(recipe_ids)
+            if not missing_ids:
+                self._saved_meal_ids = tuple(meal.id for meal in meals)
+
+            return SavedMealPlanDTO(
+                meals=[self._meal_to_response_dto(meal, recipes) for meal in meals],
+                recipes=recipes,
+                missing_meal_ids=missing_ids,
+            )
+        except SQLAlchemyError as e:
+            DebugLogger.log(f"Failed to load saved meal plan: {e}", "error")
+            return SavedMealPlanDTO()
+
     def saveMealPlan(self, meal_ids: List[int]) -> MealPlanSaveResultDTO:
         """
         Save a meal plan by storing the meal IDs.
-        Validates meal IDs before saving.
+        Validates meal IDs before saving. Skips the database entirely when the
+        plan matches the one last loaded or saved through this service.
 
         Args:
             meal_ids (List[int]): List of meal selection IDs to save.
@@ -79,6 +117,14 @@ class PlannerService:
         Returns:
             MealPlanSaveResultDTO: Result with saved meal count and any validation errors.
         """
+        if tuple(meal_ids) == self._saved_meal_ids:
+            return MealPlanSaveResultDTO(
+                success=True,
+                saved_count=len(meal_ids),
+                invalid_ids=[],
+                message=f"Meal plan unchanged ({len(meal_ids)} meals)"
+            )
+
         try:
             # validate meal IDs exist
             valid_ids = self.repo.validate_meal_ids(meal_ids)
@@ -93,8 +139,10 @@ class PlannerService:
                 )
 
             # save the meal plan
-            self.repo.save_active_meal_ids(valid_ids)
+            written = self.repo.save_active_meal_ids(valid_ids)
             self.session.commit()
+            self._saved_meal_ids = tuple(valid_ids)
+            DebugLogger.log(f"Saved meal plan: {written} saved meal state rows written", "debug")
             return MealPlanSaveResultDTO(
                 success=True,
                 saved_count=len(valid_ids),
@@ -104,6 +152,7 @@ class PlannerService:
 
         except SQLAlchemyError as e:
             self.session.rollback()
+            self._saved_meal_ids = None
             return MealPlanSaveResultDTO(
                 success=False,
                 saved_count=0,
@@ -121,8 +170,10 @@ class PlannerService:
         try:
             self.repo.save_active_meal_ids(meal_ids)
             self.session.commit()
+            self._saved_meal_ids = tuple(meal_ids)
         except SQLAlchemyError as e:
             self.session.rollback()
+            self._saved_meal_ids = None
             DebugLogger.log(f"Failed to save active meal IDs, transaction rolled back: {e}", "error")
             raise
 
@@ -136,11 +187,36 @@ class PlannerService:
         try:
             self.repo.clear_saved_meal_states()
             self.session.commit()
+            self._saved_meal_ids = ()
             return True
         except SQLAlchemyError:
             self.session.rollback()
             return False
 
+    def prune_orphans(self) -> int:
+        """
+        Delete meal selections whose main recipe no longer exists, and any saved
+        meal states pointing at them, in a single transaction.
+
+        Returns:
+            int: Number of meal selections removed (0 on failure).
+        """
+        try:
+            states = self.repo.delete_orphaned_saved_states()
+            meals = self.repo.delete_orphaned_meal_selections()
+            self.session.commit()
+            if states:
+                self._saved_meal_ids = None
+            if states or meals:
+                DebugLogger.log(
+                    f"Pruned {meals} orphaned meal selections and {states} saved meal states", "info"
+                )
+            return meals
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            DebugLogger.log(f"Failed to prune orphaned meals, transaction rolled back: {e}", "error")
+            return 0
+
     def get_meal_plan_summary(self) -> MealPlanSummaryDTO:
         """
         Get a summary of the current meal plan.
@@ -317,6 +393,8 @@ class PlannerService:
         try:
             result = self.repo.delete_meal_selection(meal_id)
             self.session.commit()
+            # saved states cascade with the meal, so the persisted plan may have changed
+            self._saved_meal_ids = None
             return result
         except SQLAlchemyError:
             self.session.rollback()
@@ -384,16 +462,28 @@ class PlannerService:
             return []
 
     # ── Helper Methods ──────────────────────────────────────────────────────────────────────────────────────
-    def _meal_to_response_dto(self, meal: MealSelection) -> MealSelectionResponseDTO:
+    def _meal_to_response_dto(self, meal: MealSelection, recipes: dict | None = None) -> MealSelectionResponseDTO:
         """
         Convert a MealSelection model to a response DTO.
 
         Args:
             meal (MealSelection): Meal selection model.
+            recipes (dict | None): Prefetched recipes by ID; when given, recipe
+                relationships are not touched (no lazy loads).
 
         Returns:
             MealSelectionResponseDTO: Response DTO.
         """
+        if recipes is not None:
+            main, side_1, side_2, side_3 = (
+                recipes.get(rid) if rid else None
+                for rid in (meal.main_recipe_id, meal.side_recipe_1_id,
+                            meal.side_recipe_2_id, meal.side_recipe_3_id)
+            )
+        else:
+            main, side_1, side_2, side_3 = (
+                meal.main_recipe, meal.side_recipe_1, meal.side_recipe_2, meal.side_recipe_3
+            )
         return MealSelectionResponseDTO(
         id=meal.id,
         meal_name=meal.meal_name,
@@ -401,10 +491,10 @@ class PlannerService:
         side_recipe_1_id=meal.side_recipe_1_id,
         side_recipe_2_id=meal.side_recipe_2_id,
         side_recipe_3_id=meal.side_recipe_3_id,
-        main_recipe=RecipeCardDTO.from_recipe(meal.main_recipe),
-        side_recipe_1=RecipeCardDTO.from_recipe(meal.side_recipe_1),
-        side_recipe_2=RecipeCardDTO.from_recipe(meal.side_recipe_2),
-        side_recipe_3=RecipeCardDTO.from_recipe(meal.side_recipe_3),
+        main_recipe=RecipeCardDTO.from_recipe(main),
+        side_recipe_1=RecipeCardDTO.from_recipe(side_1),
+        side_recipe_2=RecipeCardDTO.from_recipe(side_2),
+        side_recipe_3=RecipeCardDTO.from_recipe(side_3),
         )
 
     # ── Validation Methods ───────────────────────────────────────────────────────────────────
@@ -0,0 +1,176 @@
+"""app/core/services/recipe_cache.py
+
+Application-wide read-through cache of recipe snapshots.
+
+RecipeService reads through the cache and refreshes or invalidates entries on every
+write; the UI additionally invalidates on the `recipe_updated` / `recipe_deleted`
+global signals. Each recipe ID carries a generation counter that is bumped on
+invalidation, so a load that raced with a write never re-populates stale data.
+The cache also holds the dashboard's library statistics, dropped on any change.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from _dev_tools import DebugLogger
+
+from ..dtos.recipe_dtos import RecipeSnapshotDTO, RecipeStatsDTO
+from ..models.recipe import Recipe
+
+# ── Constants ──
+RECIPE_CACHE_MAX_ENTRIES = 256
+STATS_SUMMARY_TTL_S = 300.0   # "this week" drifts with the clock, so summaries also expire
+
+
+# ── Recipe Cache ────────────────────────────────────────────────────────────────────────────────────────────
+class RecipeCache:
+    """Thread-safe LRU cache of RecipeSnapshotDTOs keyed by recipe ID."""
+
+    def __init__(self, max_entries: int = RECIPE_CACHE_MAX_ENTRIES):
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[int, RecipeSnapshotDTO]" = OrderedDict()
+        self._generations: Dict[int, int] = {}
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._summary: Optional[RecipeStatsDTO] = None
+        self._summary_at = 0.0
+        self._summary_generation = 0
+
+    # ── Reads ──
+    def get(self, recipe_id: int) -> Optional[RecipeSnapshotDTO]:
+        """Return the cached snapshot, or None (counted as a miss)."""
+        with self._lock:
+            snapshot = self._entries.get(recipe_id)
+            if snapshot is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(recipe_id)
+            self._hits += 1
+            return snapshot
+
+    def get_or_load(
+        self,
+        recipe_id: int,
+        loader: Callable[[int], Optional[Recipe]]
+    ) -> Optional[RecipeSnapshotDTO]:
+        """
+        Return the cached snapshot, loading and caching it on a miss.
+
+        Args:
+            recipe_id (int): ID of the recipe.
+            loader (Callable[[int], Optional[Recipe]]): Loads the Recipe (with ingredients) by ID.
+
+        Returns:
+            Optional[RecipeSnapshotDTO]: The snapshot, or None if the recipe does not exist.
+        """
+        snapshot = self.get(recipe_id)
+        if snapshot is not None:
+            return snapshot
+
+        generation = self.version(recipe_id)
+        recipe = loader(recipe_id)  # outside the lock; may hit the database
+        if recipe is None:
+            return None
+        return self.put(recipe, expected_version=generation)
+
+    def version(self, recipe_id: int) -> int:
+        """Return the current generation of a recipe ID (bumped on every invalidation)."""
+        with self._lock:
+            return self._generations.get(recipe_id, 0)
+
+    def is_current(self, snapshot: RecipeSnapshotDTO) -> bool:
+        """Return True if no write has invalidated `snapshot` since it was taken."""
+        return snapshot.version == self.version(snapshot.id)
+
+    def get_summary(self) -> Optional[RecipeStatsDTO]:
+        """Return the cached library statistics, or None if missing or expired."""
+        with self._lock:
+            if self._summary is None or time.monotonic() - self._summary_at > STATS_SUMMARY_TTL_S:
+                return None
+            return self._summary
+
+    def summary_version(self) -> int:
+        """Return the statistics generation (bumped whenever any recipe changes)."""
+        with self._lock:
+            return self._summary_generation
+
+    # ── Writes ──
+    def put(self, recipe: Recipe, expected_version: Optional[int] = None) -> RecipeSnapshotDTO:
+        """
+        Snapshot a freshly loaded or written recipe into the cache.
+
+        Args:
+            recipe (Recipe): Recipe with its ingredients loaded.
+            expected_version (int, optional): Generation observed before loading; if the
+                recipe was invalidated since, the snapshot is returned but not cached.
+
+        Returns:
+            RecipeSnapshotDTO: The snapshot.
+        """
+        with self._lock:
+            generation = self._generations.get(recipe.id, 0)
+            snapshot = RecipeSnapshotDTO.from_recipe(recipe, version=generation)
+            if expected_version is not None and expected_version != generation:
+                return snapshot
+
+            self._entries[recipe.id] = snapshot
+            self._entries.move_to_end(recipe.id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return snapshot
+
+    def put_summary(self, summary: RecipeStatsDTO, expected_version: int) -> None:
+        """Cache library statistics unless a recipe changed since `expected_version`."""
+        with self._lock:
+            if expected_version == self._summary_generation:
+                self._summary = summary
+                self._summary_at = time.monotonic()
+
+    def invalidate(self, recipe_id: int) -> None:
+        """Drop a recipe's snapshot and bump its generation (statistics are dropped too)."""
+        with self._lock:
+            self._entries.pop(recipe_id, None)
+            self._generations[recipe_id] = self._generations.get(recipe_id, 0) + 1
+            self._invalidations += 1
+            self.invalidate_summary()
+
+    def invalidate_summary(self) -> None:
+        """Drop the cached statistics, e.g. after a recipe is created."""
+        with self._lock:
+            self._summary = None
+            self._summary_generation += 1
+
+    def clear(self) -> None:
+        """Drop every snapshot (generations are bumped so in-flight loads are discarded)."""
+        with self._lock:
+            for recipe_id in list(self._entries):
+                self._generations[recipe_id] = self._generations.get(recipe_id, 0) + 1
+            self._entries.clear()
+            self.invalidate_summary()
+            DebugLogger.log("Recipe cache cleared", "debug")
+
+    # ── Metrics ──
+    def get_stats(self) -> dict:
+        """Return size, hit/miss counts, hit rate, evictions and invalidations."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+# Create a single instance for import
+recipe_cache = RecipeCache()
@@ -4,6 +4,7 @@ RecipeService using SQLAlchemy repository pattern.
 """
 
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+from datetime import timedelta
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
@@ -15,11 +16,24 @@ from ..dtos.recipe_dtos import (
     RecipeCreateDTO,
     RecipeFilterDTO,
     RecipeIngredientDTO,
+    RecipeSnapshotDTO,
+    RecipeStatsDTO,
     RecipeUpdateDTO)
 from ..models.ingredient import Ingredient
 from ..models.recipe import Recipe
 from ..repositories.ingredient_repo import IngredientRepo
 from ..repositories.recipe_repo import RecipeRepo
+from ..utils.data_time_utils import utcnow
+from ..utils.text_utils import fuzzy_key
+from ..utils.unit_utils import combine_quantities
+from .ingredient_index import ingredient_index
+from .ingredient_matcher import ingredient_matcher
+from .ingredient_service import IngredientService
+from .recipe_cache import recipe_cache
+from .session_manager import ScopedService
+
+# ── Constants ──
+RECENT_RECIPE_DAYS = 7  # window for the dashboard's "this week" count
 
 
 # ── Exceptions ──────────────────────────────────────────────────────────────────────────────────────────────
@@ -31,18 +45,15 @@ class DuplicateRecipeError(Exception):
 
 
 # ── Recipe Service ──────────────────────────────────────────────────────────────────────────────────────────
-class RecipeService:
+class RecipeService(ScopedService):
     """Service layer for managing recipes and their ingredients."""
 
     def __init__(self, session: Session | None = None):
         """
         Initialize the RecipeService with a database session and repositories.
-        If no session is provided, a new session is created.
+        If no session is provided, a new session is created and owned (see ScopedService).
         """
-        if session is None:
-            from app.core.database.db import create_session
-            session = create_session()
-        self.session = session
+        self.session = self._init_session(session)
         # ensure ingredient repository is created before passing into recipe repository
         self.ingredient_repo = IngredientRepo(self.session)
         self.recipe_repo = RecipeRepo(self.session, self.ingredient_repo)
@@ -58,8 +69,14 @@ class RecipeService:
             )
 
         try:
+            recipe_dto = recipe_dto.model_copy(
+                update={"ingredients": self._canonicalize_ingredients(recipe_dto.ingredients)}
+            )
             recipe = self.recipe_repo.persist_recipe_and_links(recipe_dto)
             self.session.commit()
+            recipe_cache.invalidate_summary()
+            ingredient_index.record_use(ing.ingredient_name for ing in recipe_dto.ingredients)
+            self._index_ingredients(recipe_dto.ingredients)
             return recipe
         except SQLAlchemyError as err:
             self.session.rollback()
@@ -67,6 +84,64 @@ class RecipeService:
                 f"Unable to save recipe '{recipe_dto.recipe_name}': {err}"
             ) from err
 
+    def _canonicalize_ingredients(self, ing_dtos: list[RecipeIngredientDTO]) -> list[RecipeIngredientDTO]:
+        """
+        Collapse plural and case variants onto one spelling before ingredients are resolved.
+
+        Entries are grouped by stemmed name and category, so "Basil Leaves" and "basil
+        leaf" in one save, or "Tomatoes" when "Tomato" is stored, resolve to a single
+        ingredient. A group takes the stored spelling if there is one, else the first
+        entered; its entries become one line with the quantities added. Looser matches
+        are only suggested in the form, never applied.
+
+        Raises:
+            RecipeSaveError: If variants of one ingredient are listed in units that do not add up.
+        """
+        matcher = IngredientService(self.session).load_matcher()
+        canonical: list[RecipeIngredientDTO] = []
+        groups: dict[tuple[str, str], int] = {}   # (name key, category key) -> index in canonical
+        for ing in ing_dtos:
+            group = (fuzzy_key(ing.ingredient_name), fuzzy_key(ing.ingredient_category))
+            index = groups.get(group)
+            if index is None:
+                stored = matcher.canonical(ing.ingredient_name, ing.ingredient_category)
+                if stored and (stored.name, stored.category) != (ing.ingredient_name, ing.ingredient_category):
+                    ing = ing.model_copy(update={
+                        "ingredient_name": stored.name,
+                        "ingredient_category": stored.category,
+                        "existing_ingredient_id": stored.id,
+                    })
+                groups[group] = len(canonical)
+                canonical.append(ing)
+                continue
+
+            first = canonical[index]
+            if ing.quantity is None:
+                continue  # nothing to add
+            if first.quantity is None:
+                canonical[index] = first.model_copy(update={"quantity": ing.quantity, "unit": ing.unit})
+                continue
+            total = combine_quantities(
+                first.ingredient_name, first.quantity, first.unit,
+                ing.ingredient_name, ing.quantity, ing.unit,
+            )
+            if total is None:
+                # "1 can" next to "2 whole" cannot become one line, and a recipe links an ingredient once
+                raise RecipeSaveError(
+                    f"'{ing.ingredient_name}' is listed more than once in units that "
+                    f"do not add up ({first.unit or 'no unit'} and {ing.unit or 'no unit'})."
+                )
+            canonical[index] = first.model_copy(update={"quantity": total})
+        return canonical
+
+    def _index_ingredients(self, ing_dtos: list[RecipeIngredientDTO]):
+        """Add ingredients created by a save to the shared matcher (one keyed lookup)."""
+        if not ingredient_matcher.loaded or not ing_dtos:
+            return
+        keys = [Ingredient.create_key(ing.ingredient_name, ing.ingredient_category) for ing in ing_dtos]
+        for ingredient in self.ingredient_repo.find_by_keys(keys).values():
+            ingredient_matcher.add(ingredient.id, ingredient.ingredient_name, ingredient.ingredient_category)
+
     def resolve_ingredient(
         self, ing_dto: RecipeIngredientDTO
         ) -> Ingredient:
@@ -121,6 +196,8 @@ class RecipeService:
             self.session.rollback()
             DebugLogger.log("Failed to toggle recipe {recipe_id} favorite status, rolling back: {e}", "error")
             raise
+        finally:
+            recipe_cache.invalidate(recipe_id)
         return updated_recipe
 
     def update_recipe_reference_image_path(self, recipe_id: int, image_path: str) -> Recipe | None:
@@ -141,6 +218,7 @@ class RecipeService:
 
             recipe.reference_image_path = image_path
             self.session.commit()
+            recipe_cache.invalidate(recipe_id)
             DebugLogger.log(f"Updated recipe {recipe_id} default image path to: {image_path}", "info")
             return recipe
         except Exception as e:
@@ -166,6 +244,7 @@ class RecipeService:
 
             recipe.banner_image_path = image_path
             self.session.commit()
+            recipe_cache.invalidate(recipe_id)
             DebugLogger.log(f"Updated recipe {recipe_id} banner image path to: {image_path}", "info")
             return recipe
         except Exception as e:
@@ -181,6 +260,7 @@ class RecipeService:
                 return False
             self.recipe_repo.delete_recipe(recipe)
             self.session.commit()
+            recipe_cache.invalidate(recipe_id)
             return True
         except Exception as e:
             self.session.rollback()
@@ -192,10 +272,19 @@ class RecipeService:
         Update an existing recipe and its ingredient links.
         """
         try:
+            if update_dto.ingredients:
+                update_dto = update_dto.model_copy(
+                    update={"ingredients": self._canonicalize_ingredients(update_dto.ingredients)}
+                )
             updated_recipe = self.recipe_repo.update_recipe(recipe_id, update_dto)
             if not updated_recipe:
                 raise RecipeSaveError(f"Recipe {recipe_id} not found.")
             self.session.commit()
+            recipe_cache.invalidate(recipe_id)
+            if update_dto.ingredients:
+                # links are replaced, so only new names are added; counts catch up on the next load
+                ingredient_index.add(ing.ingredient_name for ing in update_dto.ingredients)
+                self._index_ingredients(update_dto.ingredients)
             return updated_recipe
         except SQLAlchemyError as err:
             self.session.rollback()
@@ -214,3 +303,45 @@ class RecipeService:
             Optional[Recipe]: The Recipe if found, else None.
         """
         return self.recipe_repo.get_by_id(recipe_id)
+
+    def get_recipe_snapshot(self, recipe_id: int) -> RecipeSnapshotDTO | None:
+        """
+        Retrieve a read-only snapshot of a recipe through the shared recipe cache.
+
+        Prefer this over `get_recipe` when the recipe is only displayed; repeated
+        lookups from different views are served without touching the database.
+
+        Args:
+            recipe_id (int): ID of the recipe to retrieve.
+
+        Returns:
+            Optional[RecipeSnapshotDTO]: The snapshot if found, else None.
+        """
+        return recipe_cache.get_or_load(recipe_id, self.recipe_repo.get_by_id)
+
+    def get_stats(self) -> RecipeStatsDTO:
+        """
+        Return library-wide recipe statistics from one aggregate query.
+
+        The result is cached until any recipe is created, changed or deleted (or
+        STATS_SUMMARY_TTL_S passes), so revisiting the dashboard costs nothing.
+
+        Returns:
+            RecipeStatsDTO: Total, favorite and recent recipe counts and the average cook time.
+        """
+        cached = recipe_cache.get_summary()
+        if cached is not None:
+            return cached
+
+        version = recipe_cache.summary_version()
+        total, favorites, recent, avg_time = self.recipe_repo.get_stats(
+            since=utcnow() - timedelta(days=RECENT_RECIPE_DAYS)
+        )
+        stats = RecipeStatsDTO(
+            total_recipes=total,
+            favorites=favorites,
+            this_week=recent,
+            avg_time=int(avg_time or 0),
+        )
+        recipe_cache.put_summary(stats, expected_version=version)
+        return stats
@@ -2,14 +2,17 @@
 app/core/services/session_manager.py
 
 Provides a context manager for SQLAlchemy sessions,
-ensuring commit, rollback, and closure are handled.
+ensuring commit, rollback, and closure are handled,
+plus the session lifecycle shared by services and the shutdown leak report.
 """
 
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+from collections import Counter
 from contextlib import contextmanager
 
+from sqlalchemy.orm import Session
+
 from _dev_tools import DebugLogger
-from ..database.db import create_session
 
 
 @contextmanager
@@ -18,6 +21,8 @@ def session_scope():
     Provide a transactional scope around a series of operations.
     Commits on success, rolls back on exception, and always closes the session.
     """
+    from ..database.db import create_session
+
     session = create_session()
     operation_count = getattr(session_scope, '_operation_count', 0) + 1
     setattr(session_scope, '_operation_count', operation_count)
@@ -30,7 +35,81 @@ def session_scope():
             DebugLogger.log(f"Database operations: {operation_count} transactions completed", "debug")
     except Exception as e:
         session.rollback()
-        DebugLogger.log("Database transaction failed, rolling back: {e}", "error")
+        DebugLogger.log(f"Database transaction failed, rolling back: {e}", "error")
         raise
     finally:
         session.close()
+
+
+# ── Service Lifecycle ───────────────────────────────────────────────────────────────────────────────────────
+class ScopedService:
+    """
+    Session lifecycle for services that may create their own session.
+
+    A service constructed without a session owns the one it creates. Use it as a
+    context manager for a single UI action, or call `close()` when done:
+
+        with RecipeService() as service:
+            service.toggle_favorite(recipe_id)
+
+    Long-lived owners (pages) should call `claim(owner)` so the session is reported
+    as owned rather than leaked. Sessions passed in by the caller are never closed.
+    """
+
+    session: Session
+    _owns_session: bool = False
+
+    def _init_session(self, session: Session | None) -> Session:
+        """Return `session`, or a new session owned by this service."""
+        if session is None:
+            from app.core.database.db import create_session
+            session = create_session()
+            self._owns_session = True
+        return session
+
+    def claim(self, owner: str) -> "ScopedService":
+        """Declare the owned session as intentionally long-lived, held by `owner`."""
+        if self._owns_session:
+            from app.core.database.db import session_registry
+            session_registry.set_owner(self.session, owner)
+        return self
+
+    def close(self) -> None:
+        """Close the session if this service created it."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+# ── Leak Report ─────────────────────────────────────────────────────────────────────────────────────────────
+def report_open_sessions() -> int:
+    """
+    Log sessions that are still open, typically called at shutdown.
+
+    Sessions claimed by a long-lived owner are summarised at debug level; any
+    others were never closed and are reported as leaks with where they were created.
+
+    Returns:
+        int: Number of leaked (unowned) sessions.
+    """
+    from app.core.database.db import session_registry
+
+    open_sessions = session_registry.open_sessions()
+    owned = Counter(info.owner for info in open_sessions if info.owner)
+    leaked = Counter(info.origin for info in open_sessions if not info.owner)
+    stats = session_registry.get_stats()
+
+    DebugLogger.log(
+        f"Sessions: {stats['created']} created, {stats['closed']} closed, peak {stats['peak']} open; "
+        f"still open: {dict(owned) or 'none'} owned by pages",
+        "debug"
+    )
+    for origin, count in leaked.most_common():
+        DebugLogger.log(f"Session leak: {count} session(s) never closed, created at {origin}", "warning")
+    return sum(leaked.values())
@@ -7,7 +7,7 @@ Orchestrates repository operations and coordinates with meal planning.
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 from ..dtos.shopping_dtos import (
     BulkOperationResultDTO,
     BulkStateUpdateDTO,
+    ItemStatusWriteDTO,
     ManualItemCreateDTO,
     ShoppingItemResponseDTO,
     ShoppingItemUpdateDTO,
@@ -23,21 +24,21 @@ from ..dtos.shopping_dtos import (
     ShoppingListGenerationResultDTO,
     ShoppingListResponseDTO)
 from ..models.shopping_item import ShoppingItem
+from ..models.shopping_state import ShoppingState
 from ..repositories.planner_repo import PlannerRepo
 from ..repositories.shopping_repo import ShoppingRepo
+from .breakdown_cache import breakdown_cache
+from .session_manager import ScopedService
 
 
 # ── Shopping Service ────────────────────────────────────────────────────────────────────────────────────────
-class ShoppingService:
+class ShoppingService(ScopedService):
     """Service for shopping list operations with business logic."""
 
     def __init__(self, session: Session | None = None):
         """Initialize the ShoppingService with a database session and repositories.
-        If no session is provided, a new session is created."""
-        if session is None:
-            from app.core.database.db import create_session
-            session = create_session()
-        self.session = session
+        If no session is provided, a new session is created and owned (see ScopedService)."""
+        self.session = self._init_session(session)
         self.shopping_repo = ShoppingRepo(self.session)
         self.planner_repo = PlannerRepo(self.session)
 
@@ -100,15 +101,20 @@ class ShoppingService:
             # clear existing recipe-generated items
             deleted_count = self.shopping_repo.clear_shopping_items(source="recipe")
 
-            # aggregate ingredients from recipes
-            recipe_items = self.shopping_repo.aggregate_ingredients(recipe_ids)
+            # aggregate ingredients from recipes; the tooltip breakdown comes from the same pass
+            key = breakdown_cache.key_for(recipe_ids)
+            recipe_items, breakdown = self.shopping_repo.aggregate_with_breakdown(recipe_ids)
+            breakdown_cache.put(key, breakdown)
 
             # Apply saved states to items
+            saved_states = self.shopping_repo.get_checked_states(
+                [item.state_key for item in recipe_items if item.state_key]
+            )
             for item in recipe_items:
                 if item.state_key:
-                    saved_state = self.shopping_repo.get_shopping_state(item.state_key)
-                    if saved_state:
-                        item.have = saved_state.checked
+                    checked = saved_states.get(ShoppingState.normalize_key(item.state_key))
+                    if checked is not None:
+                        item.have = checked
 
             # save new items
             items_created = 0
@@ -374,18 +380,44 @@ class ShoppingService:
             self.session.rollback()
             return False
 
+    def write_item_statuses(self, writes: List[ItemStatusWriteDTO]) -> int:
+        """
+        Persist a batch of queued 'have' changes in one transaction.
+
+        Used by the shopping write-behind queue and bulk_update_status: the batch carries
+        each item's state key, quantity and unit, so items are not read back before
+        writing. Statuses are written with one UPDATE, states with one upsert.
+
+        Args:
+            writes (List[ItemStatusWriteDTO]): Coalesced writes, at most one per item.
+
+        Returns:
+            int: Number of items written.
+
+        Raises:
+            SQLAlchemyError: After rolling back, so the caller can re-queue the batch.
+        """
+        if not writes:
+            return 0
+        try:
+            written = self.shopping_repo.write_have_status([(w.item_id, w.have) for w in writes])
+            self.shopping_repo.write_shopping_states([
+                (w.state_key, w.quantity, w.unit, w.have) for w in writes if w.state_key
+            ])
+            self.session.commit()
+            return written
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
     def clear_completed_items(self) -> int:
         """
         Clear all completed (have=True) shopping items and return count deleted.
         """
-        from sqlalchemy import delete
-
-        from app.core.models.shopping_item import ShoppingItem
         try:
-            stmt = delete(ShoppingItem).where(ShoppingItem.have.is_(True))
-            result = self.session.execute(stmt)
+            deleted = self.shopping_repo.clear_completed_items()
             self.session.commit()
-            return result.rowcount
+            return deleted
         except SQLAlchemyError:
             return 0
 
@@ -393,6 +425,9 @@ class ShoppingService:
         """
         Bulk update 'have' status for multiple shopping items.
 
+        Reads the items' state fields in one query, then writes every status with a
+        single UPDATE and every recipe item's state with one upsert.
+
         Args:
             update_dto (BulkStateUpdateDTO): DTO containing item_updates mapping (item_id -> have status).
 
@@ -400,21 +435,18 @@ class ShoppingService:
             BulkOperationResultDTO: Operation result with count of updated items.
         """
         try:
-            updated_count = 0
-            for item_id, have in update_dto.item_updates.items():
-                item = self.shopping_repo.get_shopping_item_by_id(item_id)
-                if not item:
-                    continue
-                item.have = have
-                # update state for recipe items
-                if item.state_key and item.source == "recipe":
-                    self.shopping_repo.save_shopping_state(
-                        item.state_key, item.quantity, item.unit or "", item.have
-                    )
-                self.shopping_repo.update_item(item)
-                updated_count += 1
-            # commit transaction after bulk updates
-            self.session.commit()
+            rows = self.shopping_repo.get_state_fields(list(update_dto.item_updates))
+            writes = [
+                ItemStatusWriteDTO(
+                    item_id=item_id,
+                    have=update_dto.item_updates[item_id],
+                    state_key=state_key if source == "recipe" else None,
+                    quantity=quantity,
+                    unit=unit or "",
+                )
+                for item_id, source, state_key, quantity, unit in rows
+            ]
+            updated_count = self.write_item_statuses(writes)
             return BulkOperationResultDTO(
                 success=True,
                 updated_count=updated_count,
@@ -430,47 +462,27 @@ class ShoppingService:
             )
 
     # ── Analysis and Breakdown ──────────────────────────────────────────────────────────────────────────────
-    def get_ingredient_breakdown(self, recipe_ids: List[int]) -> Any:
+    def get_breakdown_map(self, recipe_ids: List[int]) -> Dict[str, List[Tuple[str, float, str]]]:
         """
-        Get detailed breakdown of ingredients by recipe, returned as an object with 'items'.
+        Get the per-recipe contributions for each shopping item key.
+
+        Served from the breakdown cache filled by generate_shopping_list; only a miss
+        (e.g. a recipe edited since) re-runs the aggregation.
 
         Args:
-            recipe_ids (List[int]): List of recipe IDs.
+            recipe_ids (List[int]): Recipe IDs the list was generated from.
 
         Returns:
-            An object with attribute 'items', a list of breakdown items.
-        """
-        try:
-            raw = self.shopping_repo.get_ingredient_breakdown(recipe_ids)
-            class _BreakdownResponse:
-                pass
-            resp = _BreakdownResponse()
-            resp.items = []
-            for key, contributions in raw.items():
-                parts = key.split("::")
-                # capitalize ingredient name for proper formatting
-                ingredient_name = parts[0].capitalize() if parts else ""
-                unit = parts[1] if len(parts) > 1 else ""
-                total_qty = sum(qty for _, qty, _ in contributions)
-                class _Item:
-                    pass
-                item = _Item()
-                item.ingredient_name = ingredient_name
-                item.total_quantity = total_qty
-                item.unit = unit
-                # build recipe_breakdown list
-                item.recipe_breakdown = [
-                    type('Rpt', (), {'recipe_name': rn, 'quantity': q, 'unit': u})
-                    for rn, q, u in contributions
-                ]
-                resp.items.append(item)
-            return resp
-        except SQLAlchemyError:
-            class _BreakdownResponse:
-                pass
-            resp = _BreakdownResponse()
-            resp.items = []
-            return resp
+            Dict[str, List[Tuple[str, float, str]]]: (recipe_name, quantity, unit) tuples by item key.
+        """
+        if not recipe_ids:
+            return {}
+        key = breakdown_cache.key_for(recipe_ids)
+        breakdown = breakdown_cache.get(key)
+        if breakdown is None:
+            _, breakdown = self.shopping_repo.aggregate_with_breakdown(recipe_ids)
+            breakdown_cache.put(key, breakdown)
+        return breakdown
 
     # ── Helper Methods ──────────────────────────────────────────────────────────────────────────────────────
     def _item_to_response_dto(self, item: ShoppingItem) -> ShoppingItemResponseDTO:
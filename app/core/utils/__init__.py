@@ -1,5 +1,8 @@
 # File: app/core/utils/__init__.py
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 # ── Conversion Utilities ─────────────────────────────────────────────────────────────────────
 from .conversion_utils import (
     SimpleObject,
@@ -42,49 +45,101 @@ from .format_utils import (
     format_quantity_and_unit)
 
 # ── Image Utilities ─────────────────────────────────────────────────────────────────────────
-from .image_utils import (
-    ImageFormat, ImageInfo,
-    img_ai_generate_filename,
-    img_ai_get_hash,
-    img_ai_slugify,
-    img_apply_circular_mask,
-    img_apply_rounded_mask,
-    img_cache_clear,
-    img_cache_get,
-    img_cache_get_key,
-    img_cache_set,
-    img_calc_scale_factor,
-    img_convert_format,
-    img_create_temp_path,
-    img_crop_from_scaled_coords,
-    img_crop_to_square,
-    img_get_info,
-    img_get_placeholder,
-    img_intersect_bounds, img_qt_apply_round_path,
-    img_qt_apply_round_path,
-    img_qt_load_safe,
-    img_qt_to_pixmap,
-    img_resize_to_size,
-    img_resolve_path,
-    img_save_with_quality,
-    img_scale_to_fit,
-    img_validate_format,
-    img_validate_path)
+# image_utils pulls in QtGui and the app config, so its names are resolved on first access (PEP 562).
+if TYPE_CHECKING:
+    from .image_utils import (
+        ImageFormat,
+        ImageInfo,
+        img_ai_generate_filename,
+        img_ai_get_hash,
+        img_ai_slugify,
+        img_apply_circular_mask,
+        img_apply_rounded_mask,
+        img_cache_clear,
+        img_cache_decode_source,
+        img_cache_get,
+        img_cache_get_key,
+        img_cache_set,
+        img_cache_set_source,
+        img_calc_scale_factor,
+        img_convert_format,
+        img_create_temp_path,
+        img_crop_from_scaled_coords,
+        img_crop_to_square,
+        img_get_info,
+        img_get_placeholder,
+        img_intersect_bounds,
+        img_qt_apply_round_path,
+        img_qt_is_dpr_change,
+        img_qt_load_safe,
+        img_qt_to_pixmap,
+        img_resize_to_size,
+        img_resolve_path,
+        img_save_with_quality,
+        img_scale_to_fit,
+        img_validate_format,
+        img_validate_path)
+
+_LAZY_IMAGE_UTILS = frozenset({
+    "ImageFormat",
+    "ImageInfo",
+    "img_ai_generate_filename",
+    "img_ai_get_hash",
+    "img_ai_slugify",
+    "img_apply_circular_mask",
+    "img_apply_rounded_mask",
+    "img_cache_clear",
+    "img_cache_decode_source",
+    "img_cache_get",
+    "img_cache_get_key",
+    "img_cache_set",
+    "img_cache_set_source",
+    "img_calc_scale_factor",
+    "img_convert_format",
+    "img_create_temp_path",
+    "img_crop_from_scaled_coords",
+    "img_crop_to_square",
+    "img_get_info",
+    "img_get_placeholder",
+    "img_intersect_bounds",
+    "img_qt_apply_round_path",
+    "img_qt_is_dpr_change",
+    "img_qt_load_safe",
+    "img_qt_to_pixmap",
+    "img_resize_to_size",
+    "img_resolve_path",
+    "img_save_with_quality",
+    "img_scale_to_fit",
+    "img_validate_format",
+    "img_validate_path",
+})
 
 from .singleton import QSingleton
 # ── Text Utilities ──────────────────────────────────────────────────────────────────────────
 from .text_utils import (
     camel_to_title_case,
     extract_first_number,
+    fuzzy_key,
     is_empty_or_whitespace,
     normalize_line_endings,
     safe_split_extract,
     sanitize_form_input,
     sanitize_multiline_input,
     snake_to_title_case,
+    stem_plural,
     text_to_enum_key,
+    trigrams,
     truncate_with_ellipsis)
 
+# ── Unit Utilities ──────────────────────────────────────────────────────────────────────────
+from .unit_utils import (
+    UnitInfo,
+    best_display_unit,
+    combine_quantities,
+    normalize_unit,
+    resolve_unit,
+    to_base_quantity)
+
 # ── Validation Utilities ────────────────────────────────────────────────────────────────────
 from .validation_utils import (
     ValidationResult,
@@ -142,9 +197,11 @@ __all__ = [
     "img_apply_circular_mask",
     "img_apply_rounded_mask",
     "img_cache_clear",
+    "img_cache_decode_source",
     "img_cache_get",
     "img_cache_get_key",
     "img_cache_set",
+    "img_cache_set_source",
     "img_calc_scale_factor",
     "img_convert_format",
     "img_create_temp_path",
@@ -154,6 +211,7 @@ __all__ = [
     "img_get_placeholder",
     "img_intersect_bounds",
     "img_qt_apply_round_path",
+    "img_qt_is_dpr_change",
     "img_qt_load_safe",
     "img_qt_to_pixmap",
     "img_resize_to_size",
@@ -166,14 +224,24 @@ __all__ = [
     "camel_to_title_case",
     "extract_first_number",
     "extract_numeric_range",
+    "fuzzy_key",
     "is_empty_or_whitespace",
     "normalize_line_endings",
     "safe_split_extract",
     "sanitize_form_input",
     "sanitize_multiline_input",
     "snake_to_title_case",
+    "stem_plural",
     "text_to_enum_key",
+    "trigrams",
     "truncate_with_ellipsis",
+    # Units
+    "UnitInfo",
+    "best_display_unit",
+    "combine_quantities",
+    "normalize_unit",
+    "resolve_unit",
+    "to_base_quantity",
     # Validation
     "ValidationResult",
     "batch_validate_inputs",
@@ -191,3 +259,15 @@ __all__ = [
     "QSingleton",
     "utcnow",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMAGE_UTILS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(".image_utils", __name__), name)
+    globals()[name] = value  # cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,6 +9,8 @@ Image processing utilities for the application.
 # img_cache_get()            -> Retrieve cached image
 # img_cache_set()            -> Store image in cache
 # img_cache_clear()          -> Clear cache entries
+# img_cache_decode_source()  -> Decode source image (any thread)
+# img_cache_set_source()     -> Store decoded source image
 #
 # ── Processor Utils ────────────────────────────────────────
 # img_resize_to_size()       -> Resize image to specific size
@@ -40,6 +42,7 @@ Image processing utilities for the application.
 # img_qt_to_pixmap()         -> Convert to QPixmap safely
 # img_qt_load_safe()         -> Load QPixmap safely from path
 # img_qt_apply_round_path()  -> Apply rounded rect path
+# img_qt_is_dpr_change()     -> Check for screen/DPR change event
 #
 # ── Cropping Utils ─────────────────────────────────────────
 # img_calc_scale_factor()    -> Calculate scale between pixmaps
@@ -55,11 +58,12 @@ import hashlib
 import re
 import tempfile
 import uuid
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, NamedTuple, Optional, Tuple, Union
 
-from PySide6.QtCore import QRect, QRectF, QSize, Qt
-from PySide6.QtGui import QColor, QPainter, QPainterPath, QPixmap, QFont, QFontMetrics
+from PySide6.QtCore import QEvent, QRect, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPainterPath, QPixmap, QFont, QFontMetrics
 
 from app.config import AppPaths
 # NOTE: Do not import from app.style.icon.* at module import time to avoid
@@ -72,6 +76,7 @@ __all__ = [
 
     # Cache Utils
     'img_cache_get_key', 'img_cache_get', 'img_cache_set', 'img_cache_clear',
+    'img_cache_decode_source', 'img_cache_set_source',
 
     # Processor Utils
     'img_resize_to_size', 'img_scale_to_fit', 'img_crop_to_square',
@@ -90,7 +95,7 @@ __all__ = [
     'img_ai_generate_filename', 'img_ai_slugify', 'img_ai_get_hash',
 
     # Qt Integration Utils
-    'img_qt_to_pixmap', 'img_qt_load_safe', 'img_qt_apply_round_path',
+    'img_qt_to_pixmap', 'img_qt_load_safe', 'img_qt_apply_round_path', 'img_qt_is_dpr_change',
 
     # Cropping Utils
     'img_calc_scale_factor', 'img_crop_from_scaled_coords', 'img_intersect_bounds',
@@ -121,19 +126,29 @@ class ImageInfo(NamedTuple):
 # ── Constants ───────────────────────────────────────────────────────────────────────────────────────────────
 _SLUG_RE = re.compile(r"[^a-z0-9]+")
 _IMAGE_CACHE: Dict[str, QPixmap] = {}
+_SOURCE_CACHE: "OrderedDict[str, QImage]" = OrderedDict()  # decoded sources, filled off the GUI thread
+_SOURCE_CACHE_MAX = 32
+# events a widget receives when it moves to another screen or its screen's scale changes
+_DPR_CHANGE_EVENTS = frozenset(
+    event_type for event_type in (
+        QEvent.ScreenChangeInternal,
+        getattr(QEvent, "DevicePixelRatioChange", None),  # Qt 6.6+
+    ) if event_type is not None
+)
 _TEMP_DIR = Path(tempfile.gettempdir()) / "app_image_utils"
 _TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
 
 # ── Cache Utils ─────────────────────────────────────────────────────────────────────────────────────────────
 def img_cache_get_key(path: Union[str, Path], size: Optional[Union[int, QSize]] = None,
-                     radii: Optional[Tuple[int, int, int, int]] = None) -> str:
+                     radii: Optional[Tuple[int, int, int, int]] = None, dpr: float = 1.0) -> str:
     """Generate cache key for image with processing parameters.
 
     Args:
         path: Image file path
         size: Target size (int for square, QSize for rect)
         radii: Rounded corner radii (tl, tr, br, bl)
+        dpr: Device pixel ratio the image is rendered for
 
     Returns:
         Cache key string
@@ -149,6 +164,9 @@ def img_cache_get_key(path: Union[str, Path], size: Optional[Union[int, QSize]]
     if radii is not None:
         key_parts.append(f"radii_{'_'.join(map(str, radii))}")
 
+    if dpr != 1.0:
+        key_parts.append(f"dpr_{dpr:g}")
+
     return "|".join(key_parts)
 
 def img_cache_get(key: str) -> Optional[QPixmap]:
@@ -190,6 +208,36 @@ def img_cache_clear(pattern: Optional[str] = None) -> int:
         del _IMAGE_CACHE[key]
     return len(keys_to_remove)
 
+def img_cache_decode_source(path: Union[str, Path]) -> Optional[QImage]:
+    """Decode an image file into a QImage.
+
+    Unlike QPixmap, QImage may be created off the GUI thread, so this is used to
+    prewarm sources in the background before widgets ask for them.
+
+    Args:
+        path: Image file path
+
+    Returns:
+        Decoded QImage or None if the file is missing or unreadable
+    """
+    if not img_validate_path(path):
+        return None
+    image = QImage(str(path))
+    return None if image.isNull() else image
+
+def img_cache_set_source(path: Union[str, Path], image: QImage) -> None:
+    """Store a decoded source image for img_qt_load_safe() to reuse.
+
+    Args:
+        path: Image file path the image was decoded from
+        image: Decoded QImage
+    """
+    key = str(path)
+    _SOURCE_CACHE[key] = image
+    _SOURCE_CACHE.move_to_end(key)
+    while len(_SOURCE_CACHE) > _SOURCE_CACHE_MAX:
+        _SOURCE_CACHE.popitem(last=False)
+
 
 # ── Processor Utils ─────────────────────────────────────────────────────────────────────────────────────────
 def img_resize_to_size(pixmap: QPixmap, size: Union[int, QSize],
@@ -633,8 +681,23 @@ def img_qt_load_safe(path: Union[str, Path]) -> QPixmap:
     Returns:
         QPixmap (null if failed to load)
     """
+    # skip the disk read + decode when the source was prewarmed
+    image = _SOURCE_CACHE.get(str(path))
+    if image is not None:
+        return QPixmap.fromImage(image)
     return QPixmap(str(path))  # Returns null pixmap if loading fails
 
+def img_qt_is_dpr_change(event: QEvent) -> bool:
+    """Check whether an event means the widget's device pixel ratio may have changed.
+
+    Args:
+        event: Event received by a widget
+
+    Returns:
+        True for screen-change and DPR-change events
+    """
+    return event.type() in _DPR_CHANGE_EVENTS
+
 def img_qt_apply_round_path(width: int, height: int,
                            radii: Tuple[int, int, int, int]) -> QPainterPath:
     """Create rounded rectangle path for clipping.
@@ -21,6 +21,11 @@ Text processing and string manipulation utilities.
 # is_empty_or_whitespace()     -> Check for empty/whitespace
 # truncate_with_ellipsis()     -> Truncate text with ellipsis
 # normalize_line_endings()     -> Normalize line endings
+#
+# ── Fuzzy Matching Helpers ──────────────────────────────────
+# stem_plural()                -> Map singular and plural to one stem
+# fuzzy_key()                  -> Casefolded, plural-stemmed word key
+# trigrams()                   -> Padded character trigrams of a key
 
 """
 
@@ -28,7 +33,7 @@ Text processing and string manipulation utilities.
 from __future__ import annotations
 
 import re
-from typing import Optional
+from typing import FrozenSet, Optional
 
 __all__ = [
     # String Cleaning & Sanitization
@@ -42,8 +47,20 @@ __all__ = [
 
     # String Validation Helpers
     'is_empty_or_whitespace', 'truncate_with_ellipsis', 'normalize_line_endings',
+
+    # Fuzzy Matching Helpers
+    'stem_plural', 'fuzzy_key', 'trigrams',
 ]
 
+# ── Constants ──
+_WORD_RE = re.compile(r"\w+")
+
+# plurals the suffix rules below would get wrong
+_IRREGULAR_PLURALS = {
+    "leaves": "leaf", "loaves": "loaf", "halves": "half", "knives": "knife",
+    "calves": "calf", "wolves": "wolf", "geese": "goose", "feet": "foot",
+}
+
 
 # ── String Cleaning & Sanitization ──────────────────────────────────────────────────────────────────────────
 def sanitize_form_input(text: str) -> str:
@@ -271,3 +288,70 @@ def normalize_line_endings(text: str) -> str:
 
     # Convert CRLF and CR to LF
     return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+# ── Fuzzy Matching Helpers ──────────────────────────────────────────────────────────────────────────────────
+def stem_plural(word: str) -> str:
+    """
+    Reduce an English word so its singular and plural forms share one stem.
+
+    The stem is not always a real word ("berry" and "berries" both become "berri");
+    only the mapping of both forms to the same value matters.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        str: The stem
+
+    Examples:
+        "tomatoes" -> "tomato", "peaches" -> "peach", "cloves" -> "clove"
+    """
+    if word in _IRREGULAR_PLURALS:
+        return _IRREGULAR_PLURALS[word]
+    if len(word) <= 3:
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "i"
+    if word.endswith("ie"):
+        return word[:-1]
+    if word.endswith("y") and word[-2] not in "aeiou":
+        return word[:-1] + "i"
+    if word.endswith(("oes", "ches", "shes", "sses", "xes")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def fuzzy_key(text: str) -> str:
+    """
+    Build a matching key: casefolded words, plural-stemmed, single-spaced.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        str: The key
+
+    Examples:
+        "Roma  Tomatoes" -> "roma tomato"
+    """
+    return " ".join(stem_plural(word) for word in _WORD_RE.findall(text.casefold()))
+
+
+def trigrams(key: str) -> FrozenSet[str]:
+    """
+    Return the character trigrams of a key, each word padded as "  word ".
+
+    Args:
+        key: Key from fuzzy_key()
+
+    Returns:
+        FrozenSet[str]: Distinct trigrams
+    """
+    grams = set()
+    for word in key.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
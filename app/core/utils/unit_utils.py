@@ -0,0 +1,354 @@
+"""app/core/utils/unit_utils.py
+
+Table-driven unit normalization for aggregating ingredient quantities.
+
+# ── Internal Index ──────────────────────────────────────────────────────────────────────
+#
+# ── Unit Tables ─────────────────────────────────────────────────────────────────────────
+# UNIT_DEFINITIONS              -> Canonical units: dimension, factor to base, system
+# UNIT_ALIASES                  -> Spellings accepted for each canonical unit
+# COUNT_ALIASES                 -> Plural spellings of count-like units
+# INGREDIENT_OVERRIDES          -> Per-ingredient densities and extra units
+#
+# ── Resolution ──────────────────────────────────────────────────────────────────────────
+# normalize_unit()              -> Map a raw unit string to its canonical unit
+# resolve_unit()                -> Memoized (ingredient, unit) -> UnitInfo
+# to_base_quantity()            -> Quantity in the unit's base unit plus its UnitInfo
+# combine_quantities()          -> Add a quantity into another, in the other's unit
+#
+# ── Display ─────────────────────────────────────────────────────────────────────────────
+# best_display_unit()           -> Pick the largest unit that gives a tidy quantity
+
+Volumes aggregate in millilitres and masses in grams; ingredients with a density
+override aggregate both in millilitres. Units outside the tables (can, pinch,
+slice...) only combine with the same unit. The tables are compiled into lookup
+dicts and per-ingredient display ladders once, at import.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+__all__ = [
+    # Unit Tables
+    'UNIT_DEFINITIONS', 'UNIT_ALIASES', 'COUNT_ALIASES', 'INGREDIENT_OVERRIDES',
+
+    # Resolution
+    'UnitInfo', 'normalize_unit', 'resolve_unit', 'to_base_quantity', 'combine_quantities',
+
+    # Display
+    'best_display_unit',
+]
+
+
+# ── Unit Tables ─────────────────────────────────────────────────────────────────────────────────────────────
+VOLUME = "volume"
+MASS = "mass"
+COUNT = "count"
+
+US = "us"
+METRIC = "metric"
+
+# canonical unit -> (dimension, factor to base unit [ml | g], measurement system)
+UNIT_DEFINITIONS: Dict[str, Tuple[str, float, str]] = {
+    "tsp":    (VOLUME, 4.92892, US),
+    "tbsp":   (VOLUME, 14.7868, US),
+    "fl oz":  (VOLUME, 29.5735, US),
+    "cup":    (VOLUME, 236.588, US),
+    "pint":   (VOLUME, 473.176, US),
+    "quart":  (VOLUME, 946.353, US),
+    "gallon": (VOLUME, 3785.41, US),
+    "ml":     (VOLUME, 1.0, METRIC),
+    "l":      (VOLUME, 1000.0, METRIC),
+    "oz":     (MASS, 28.3495, US),
+    "lb":     (MASS, 453.592, US),
+    "g":      (MASS, 1.0, METRIC),
+    "kg":     (MASS, 1000.0, METRIC),
+}
+
+UNIT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "tsp":    ("t", "teaspoon", "teaspoons", "tsps"),
+    "tbsp":   ("T", "tbs", "tbl", "tablespoon", "tablespoons", "tbsps"),
+    "fl oz":  ("floz", "fluid ounce", "fluid ounces"),
+    "cup":    ("c", "cups"),
+    "pint":   ("pt", "pints", "pts"),
+    "quart":  ("qt", "quarts", "qts"),
+    "gallon": ("gal", "gallons"),
+    "ml":     ("milliliter", "milliliters", "millilitre", "millilitres"),
+    "l":      ("liter", "liters", "litre", "litres"),
+    "oz":     ("ounce", "ounces"),
+    "lb":     ("lbs", "pound", "pounds"),
+    "g":      ("gram", "grams"),
+    "kg":     ("kilogram", "kilograms", "kilo", "kilos"),
+}
+
+# count-like units never convert, but their plural spellings should still combine
+COUNT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "bag":    ("bags",),
+    "box":    ("boxes",),
+    "bunch":  ("bunches",),
+    "can":    ("cans",),
+    "clove":  ("cloves",),
+    "head":   ("heads",),
+    "jar":    ("jars",),
+    "leaf":   ("leaves",),
+    "pack":   ("packs", "package", "packages", "pkg"),
+    "piece":  ("pieces", "pc", "pcs"),
+    "pinch":  ("pinches",),
+    "slice":  ("slices",),
+    "sprig":  ("sprigs",),
+    "square": ("squares",),
+    "stalk":  ("stalks",),
+    "strip":  ("strips",),
+}
+
+# ingredient -> density in g/ml and/or extra volume units in ml
+INGREDIENT_OVERRIDES: Dict[str, Dict] = {
+    "butter":         {"density": 0.911, "units": {"stick": 118.294}},
+    "flour":          {"density": 0.529},
+    "all-purpose flour": {"density": 0.529},
+    "sugar":          {"density": 0.845},
+    "brown sugar":    {"density": 0.93},
+    "powdered sugar": {"density": 0.56},
+    "honey":          {"density": 1.42},
+    "salt":           {"density": 1.217},
+    "rice":           {"density": 0.85},
+    "oats":           {"density": 0.41},
+}
+
+# display ladders, largest first; the minimum is the smallest tidy quantity in that unit
+DISPLAY_LADDERS: Dict[Tuple[str, str], List[Tuple[str, float]]] = {
+    (VOLUME, US):     [("gallon", 1.0), ("quart", 1.0), ("cup", 0.25), ("tbsp", 1.0), ("tsp", 0.125)],
+    (VOLUME, METRIC): [("l", 1.0), ("ml", 1.0)],
+    (MASS, US):       [("lb", 1.0), ("oz", 0.25)],
+    (MASS, METRIC):   [("kg", 1.0), ("g", 1.0)],
+}
+
+# dimension -> unit that group totals are kept in
+BASE_UNITS: Dict[str, str] = {VOLUME: "ml", MASS: "g"}
+
+# canonical unit -> label used in the app's unit pickers (see MEASUREMENT_UNITS)
+DISPLAY_LABELS: Dict[str, str] = {"tbsp": "Tbs", "oz": "oz.", "lb": "lb.", "l": "liter"}
+
+TIDY_STEP = 0.25           # quantities on a quarter step read well in any unit
+TIDY_TOLERANCE = 0.01
+SMALLER_UNIT_MAX = 16.0    # a unit smaller than the one entered is only used below this (not "49 tsp")
+DISPLAY_PRECISION = 3
+
+# ── Compiled Lookups ──
+_ALIAS_LOOKUP: Dict[str, str] = {}
+for _unit, _aliases in (*UNIT_ALIASES.items(), *COUNT_ALIASES.items()):
+    _ALIAS_LOOKUP[_unit] = _unit
+    for _alias in _aliases:
+        # "T" (tablespoon) and "t" (teaspoon) are the only case-sensitive spellings
+        _ALIAS_LOOKUP[_alias if _alias in ("T", "t") else _alias.lower()] = _unit
+
+_INGREDIENT_LADDERS: Dict[str, Dict[Tuple[str, str], List[Tuple[str, float, float]]]] = {}
+
+def _compile_ladder(entries: List[Tuple[str, float]], extra: Dict[str, float]) -> List[Tuple[str, float, float]]:
+    """Return (unit, factor, minimum) rungs sorted by factor, largest first."""
+    rungs = [(unit, UNIT_DEFINITIONS[unit][1], minimum) for unit, minimum in entries]
+    rungs += [(unit, factor, 1.0) for unit, factor in extra.items()]
+    return sorted(rungs, key=lambda rung: -rung[1])
+
+_DEFAULT_LADDERS = {key: _compile_ladder(entries, {}) for key, entries in DISPLAY_LADDERS.items()}
+for _name, _override in INGREDIENT_OVERRIDES.items():
+    _extra = _override.get("units", {})
+    if _extra:
+        _INGREDIENT_LADDERS[_name] = {
+            key: _compile_ladder(entries, _extra if key == (VOLUME, US) else {})
+            for key, entries in DISPLAY_LADDERS.items()
+        }
+
+
+# ── Resolution ──────────────────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class UnitInfo:
+    """How quantities in one (ingredient, unit) pair aggregate.
+
+    Attributes:
+        group: Aggregation group; quantities with the same group can be summed.
+        dimension: VOLUME, MASS or COUNT.
+        factor: Multiplier from the unit to the group's base unit.
+        system: US, METRIC or "" for count units (picks the display ladder).
+        unit: Canonical unit, or the cleaned raw unit for count units.
+    """
+
+    group: str
+    dimension: str
+    factor: float
+    system: str
+    unit: str
+
+    @property
+    def base_unit(self) -> str:
+        """The group's base unit ("ml", "g", or the count unit itself); stable across display units."""
+        return BASE_UNITS.get(self.dimension, self.unit)
+
+
+def normalize_unit(unit: str) -> str:
+    """
+    Map a raw unit string to its canonical unit.
+
+    Args:
+        unit: Unit as entered (e.g. "Tbs", "cups", "lb.")
+
+    Returns:
+        str: Canonical unit, or the lower-cased raw unit if it is not in the tables
+
+    Examples:
+        normalize_unit("Tbs") -> "tbsp"
+        normalize_unit("lb.") -> "lb"
+        normalize_unit("cans") -> "can"
+        normalize_unit("whole") -> "whole"
+    """
+    cleaned = (unit or "").strip().rstrip(".").strip()
+    if cleaned in ("T", "t"):
+        return _ALIAS_LOOKUP[cleaned]
+    lowered = cleaned.lower()
+    return _ALIAS_LOOKUP.get(lowered, lowered)
+
+
+@lru_cache(maxsize=4096)
+def resolve_unit(ingredient_name: str, unit: str) -> UnitInfo:
+    """
+    Resolve how an ingredient measured in `unit` aggregates (memoized per pair).
+
+    Args:
+        ingredient_name: Ingredient name (case-insensitive)
+        unit: Unit as entered
+
+    Returns:
+        UnitInfo: Aggregation group, factor to base and display system
+
+    Examples:
+        resolve_unit("milk", "cup")  -> UnitInfo(group="volume", factor=236.588, ...)
+        resolve_unit("flour", "lb")  -> UnitInfo(group="volume", factor=857.4..., ...)
+        resolve_unit("tomatoes", "can") -> UnitInfo(group="count:can", factor=1.0, ...)
+    """
+    name = ingredient_name.strip().lower()
+    canonical = normalize_unit(unit)
+    override = INGREDIENT_OVERRIDES.get(name, {})
+
+    extra = override.get("units", {})
+    if canonical in extra:
+        return UnitInfo(VOLUME, VOLUME, extra[canonical], US, canonical)
+
+    definition = UNIT_DEFINITIONS.get(canonical)
+    if definition is None:
+        return UnitInfo(f"{COUNT}:{canonical}", COUNT, 1.0, "", canonical)
+
+    dimension, factor, system = definition
+    density = override.get("density")
+    if density and dimension == MASS:
+        # weigh-or-measure ingredients aggregate as volume: ml = g / (g/ml)
+        return UnitInfo(VOLUME, VOLUME, factor / density, system, canonical)
+    return UnitInfo(dimension, dimension, factor, system, canonical)
+
+
+def to_base_quantity(ingredient_name: str, quantity: float, unit: str) -> Tuple[float, UnitInfo]:
+    """
+    Convert a quantity to its aggregation group's base unit.
+
+    Args:
+        ingredient_name: Ingredient name
+        quantity: Quantity in `unit`
+        unit: Unit as entered
+
+    Returns:
+        Tuple[float, UnitInfo]: Base quantity and the resolved unit info
+    """
+    info = resolve_unit(ingredient_name, unit or "")
+    return (quantity or 0.0) * info.factor, info
+
+
+def combine_quantities(
+    ingredient_name: str,
+    quantity: float,
+    unit: str,
+    other_name: str,
+    other_quantity: float,
+    other_unit: str
+) -> Optional[float]:
+    """
+    Add one ingredient quantity into another, expressed in the first one's unit.
+
+    Args:
+        ingredient_name: Ingredient name of the quantity being added to
+        quantity: Quantity being added to
+        unit: Its unit as entered
+        other_name: Ingredient name of the quantity being added
+        other_quantity: Quantity being added
+        other_unit: Its unit as entered
+
+    Returns:
+        Optional[float]: The sum in `unit`, or None if the units are in different groups
+
+    Examples:
+        combine_quantities("Tomato", 1, "whole", "tomatoes", 2, "whole") -> 3.0
+        combine_quantities("milk", 1, "cup", "milk", 2, "Tbs") -> 1.125
+        combine_quantities("milk", 1, "cup", "milk", 1, "can") -> None
+    """
+    info = resolve_unit(ingredient_name, unit or "")
+    other_base, other_info = to_base_quantity(other_name, other_quantity, other_unit or "")
+    if other_info.group != info.group:
+        return None
+    # rounded so conversion factors don't leave 1.1250004 in a stored quantity
+    return round(quantity + other_base / info.factor, 4)
+
+
+# ── Display ─────────────────────────────────────────────────────────────────────────────────────────────────
+def _is_tidy(value: float) -> bool:
+    steps = value / TIDY_STEP
+    return abs(steps - round(steps)) < TIDY_TOLERANCE
+
+
+def best_display_unit(
+    ingredient_name: str,
+    base_quantity: float,
+    info: UnitInfo,
+    raw_unit: str = ""
+) -> Tuple[float, str]:
+    """
+    Express a base quantity in the largest unit that gives a tidy number.
+
+    A rung is used when the quantity reaches its minimum and lands on a quarter step,
+    and, for units smaller than the one entered, stays below SMALLER_UNIT_MAX;
+    otherwise the quantity stays in the unit that was entered (0.33 cup is not
+    rewritten as 15.84 tsp, nor 1 cup + 1 tsp as 49 tsp).
+
+    Args:
+        ingredient_name: Ingredient name (selects ingredient-specific units, e.g. butter sticks)
+        base_quantity: Quantity in the group's base unit
+        info: UnitInfo of the group (its system picks the ladder, its unit is the fallback)
+        raw_unit: Unit as entered, shown unchanged for count units
+
+    Returns:
+        Tuple[float, str]: Display quantity and unit label
+
+    Examples:
+        best_display_unit("milk", 88.72, resolve_unit("milk", "cup")) -> (6.0, "Tbs")
+        best_display_unit("milk", 78.07, resolve_unit("milk", "cup")) -> (0.33, "cup")
+        best_display_unit("milk", 78.86, resolve_unit("milk", "cup")) -> (0.333, "cup")
+        best_display_unit("butter", 236.59, resolve_unit("butter", "tbsp")) -> (1.0, "cup")
+    """
+    if info.dimension == COUNT:
+        return round(base_quantity, DISPLAY_PRECISION), (raw_unit or info.unit).strip()
+
+    key = (info.dimension, info.system)
+    ladders = _INGREDIENT_LADDERS.get(ingredient_name.strip().lower(), _DEFAULT_LADDERS)
+    ladder = ladders[key]
+
+    for unit, factor, minimum in ladder:
+        value = base_quantity / factor
+        # compare with the same tolerance as the tidy check, so 15.999 tsp (1/3 cup) counts as 16
+        if factor < info.factor and value >= SMALLER_UNIT_MAX * (1 - TIDY_TOLERANCE):
+            break
+        if value >= minimum * (1 - TIDY_TOLERANCE) and _is_tidy(value):
+            return round(value, DISPLAY_PRECISION), DISPLAY_LABELS.get(unit, unit)
+
+    # no tidy rung: keep the unit the quantity was entered in
+    return round(base_quantity / info.factor, DISPLAY_PRECISION), DISPLAY_LABELS.get(info.unit, info.unit)
@@ -0,0 +1,413 @@
+"""app/style/icon/atlas.py
+
+Per-theme prerendered icon atlas persisted to disk.
+
+The atlas builder renders every `Name` icon at its own size and the common sizes,
+in every palette role icons are drawn with, at the screen's device pixel ratio,
+into one sprite sheet per palette. Sheets are stored as raw premultiplied ARGB32
+pixels next to a JSON index, so loading one is a memory map rather than a decode;
+pages are only read when a sprite is first copied out.
+
+SVGLoader consults the active atlas before rendering, which turns a theme switch
+into an atlas swap once both palettes have been built.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import hashlib
+import json
+import mmap
+import threading
+import time
+from pathlib import Path as FilePath
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QByteArray, QRect, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QGuiApplication, QImage, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+
+from _dev_tools import DebugLogger
+from app.config import AppPaths
+from app.core.utils import QSingleton
+
+from .config import Name, Size, Type
+from .svg_loader import SVGLoader
+
+# ── Constants ──
+ATLAS_FORMAT_VERSION = 1
+ATLAS_SHEET_WIDTH = 4096    # physical pixels per sheet row
+ATLAS_MAX_FILES = 4         # sheets kept on disk (light + dark at two pixel ratios)
+ATLAS_SOURCE_COLOR = "#000" # SVGLoader's default source color; other sources bypass the atlas
+ATLAS_SIZES: Tuple[Size, ...] = (Size.SMALL, Size.MEDIUM, Size.LARGE)
+
+# every palette role an icon can be drawn with: button state maps plus ThemedIcon's default
+ATLAS_ROLES: Tuple[str, ...] = tuple(sorted(
+    {role for icon_type in Type for role in icon_type.state_map.values()} | {"on_surface"}
+))
+
+_IMAGE_FORMAT = QImage.Format_ARGB32_Premultiplied
+
+SpriteRect = Tuple[int, int, int, int]  # x, y, width, height in physical pixels
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────────────────────────────────────────
+def sprite_key(file_path, color: str, width: int, height: int) -> str:
+    """Return the index key for one icon rendered at a logical size in a color."""
+    return f"{FilePath(file_path).stem}|{color.lower()}|{width}x{height}"
+
+def atlas_colors(palette: Dict[str, str]) -> List[str]:
+    """Return the distinct colors the atlas roles resolve to in `palette`."""
+    colors = {palette[role] for role in ATLAS_ROLES if palette.get(role)}
+    return sorted(colors)
+
+def atlas_sprites(palette: Dict[str, str]) -> List[Tuple[FilePath, str, QSize]]:
+    """List every (icon file, color, logical size) the atlas holds for `palette`."""
+    icons: Dict[str, Tuple[FilePath, set]] = {}
+    for name in Name:
+        path = name.spec.name.path
+        _, sizes = icons.setdefault(str(path), (path, set()))
+        sizes.add((name.spec.size.value.width(), name.spec.size.value.height()))
+        sizes.update((size.value.width(), size.value.height()) for size in ATLAS_SIZES)
+
+    return [
+        (path, color, QSize(width, height))
+        for path, sizes in icons.values()
+        for color in atlas_colors(palette)
+        for width, height in sorted(sizes)
+    ]
+
+def current_device_pixel_ratio() -> float:
+    """Return the primary screen's device pixel ratio (1.0 without a screen)."""
+    app = QGuiApplication.instance()
+    screen = app.primaryScreen() if app else None
+    return screen.devicePixelRatio() if screen else 1.0
+
+def atlas_key(palette: Dict[str, str], dpr: float) -> str:
+    """Hash everything a sheet depends on: colors, pixel ratio and icon sources."""
+    digest = hashlib.sha1(f"v{ATLAS_FORMAT_VERSION}|{dpr:g}|".encode("utf-8"))
+    digest.update("|".join(atlas_colors(palette)).encode("utf-8"))
+    for path in sorted({str(name.spec.name.path) for name in Name}):
+        try:
+            stat = FilePath(path).stat()
+            digest.update(f"|{path}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+        except OSError:
+            digest.update(f"|{path}:missing".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+# ── Atlas Builder ───────────────────────────────────────────────────────────────────────────────────────────
+def build_atlas(palette: Dict[str, str], dpr: float) -> Tuple[QImage, Dict[str, SpriteRect]]:
+    """Render the sprite sheet for `palette`.
+
+    Sprites are shelf-packed tallest first. Each one is rendered exactly as
+    SVGLoader.load would render it, clipped to its own cell. Only QImage painting
+    is used, so this is safe to call from a worker thread.
+
+    Args:
+        palette (Dict[str, str]): Theme color map (role -> color).
+        dpr (float): Device pixel ratio to render at.
+
+    Returns:
+        Tuple[QImage, Dict[str, SpriteRect]]: The sheet and the sprite index.
+    """
+    cells = []
+    for path, color, logical in atlas_sprites(palette):
+        physical = QSize(int(logical.width() * dpr), int(logical.height() * dpr))
+        cells.append((path, color, logical, physical))
+    cells.sort(key=lambda cell: cell[3].height(), reverse=True)
+
+    # ── Pack ──
+    placements = []
+    x = y = shelf_height = 0
+    for path, color, logical, physical in cells:
+        if x + physical.width() > ATLAS_SHEET_WIDTH:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        placements.append((path, color, logical, QRect(x, y, physical.width(), physical.height())))
+        x += physical.width()
+        shelf_height = max(shelf_height, physical.height())
+
+    sheet = QImage(ATLAS_SHEET_WIDTH, max(1, y + shelf_height), _IMAGE_FORMAT)
+    sheet.fill(Qt.transparent)
+
+    # ── Render ──
+    index: Dict[str, SpriteRect] = {}
+    painter = QPainter(sheet)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+    try:
+        for path, color, logical, rect in placements:
+            template = SVGLoader.get_template(path, ATLAS_SOURCE_COLOR)
+            if template is None:
+                continue
+            renderer = QSvgRenderer(QByteArray(template.render(color).encode("utf-8")))
+            if not renderer.isValid():
+                continue
+            painter.setClipRect(rect)
+            renderer.render(painter, QRectF(rect))
+            index[sprite_key(path, color, logical.width(), logical.height())] = (
+                rect.x(), rect.y(), rect.width(), rect.height()
+            )
+    finally:
+        painter.end()
+    return sheet, index
+
+
+# ── Icon Atlas ──────────────────────────────────────────────────────────────────────────────────────────────
+class IconAtlas(QSingleton):
+    """Owns the active icon atlas and builds missing ones in the background.
+
+    `activate()` memory-maps the sheet for a palette if it is already on disk and
+    attaches it to SVGLoader; otherwise it starts a background build and attaches
+    the sheet when the build finishes. Until then SVGLoader renders as before.
+    """
+
+    atlas_built = Signal(str)  # atlas key; emitted from the build thread
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if hasattr(self, "_index"):
+            return
+        self._key: Optional[str] = None
+        self._wanted_key: Optional[str] = None
+        self._dpr = 1.0
+        self._index: Dict[str, SpriteRect] = {}
+        self._image: Optional[QImage] = None
+        self._mapping: Optional[mmap.mmap] = None
+        self._building: set = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self.atlas_built.connect(self._on_atlas_built)
+
+    @classmethod
+    def _get_instance(cls) -> "IconAtlas":
+        """Return the singleton instance."""
+        return cls()
+
+    # ── Activation ──
+    def activate(self, palette: Dict[str, str]) -> bool:
+        """Swap in the atlas for `palette`, building it in the background if needed.
+
+        Args:
+            palette (Dict[str, str]): Theme color map (role -> color).
+
+        Returns:
+            bool: True if the atlas was loaded and attached immediately.
+        """
+        if not palette:
+            return False
+        dpr = current_device_pixel_ratio()
+        key = atlas_key(palette, dpr)
+        self._wanted_key = key
+        if key == self._key:
+            return True
+
+        self.detach()
+        if self._load(key):
+            return True
+        self._start_build(palette, dpr, key)
+        return False
+
+    def prebuild(self, palette: Dict[str, str]):
+        """Build the atlas for `palette` in the background without activating it."""
+        if not palette:
+            return
+        dpr = current_device_pixel_ratio()
+        key = atlas_key(palette, dpr)
+        if not self._index_file(key).exists():
+            self._start_build(palette, dpr, key)
+
+    def build(self, palette: Dict[str, str], dpr: Optional[float] = None) -> Optional[str]:
+        """Build and persist the atlas for `palette` synchronously.
+
+        Args:
+            palette (Dict[str, str]): Theme color map (role -> color).
+            dpr (float | None): Pixel ratio; defaults to the primary screen's.
+
+        Returns:
+            str | None: The atlas key, or None if the sheet could not be written.
+        """
+        dpr = current_device_pixel_ratio() if dpr is None else dpr
+        key = atlas_key(palette, dpr)
+        start = time.perf_counter()
+        sheet, index = build_atlas(palette, dpr)
+        if not self._write(key, sheet, index, dpr):
+            return None
+        DebugLogger.log(
+            f"[IconAtlas] Built atlas {key}: {len(index)} sprites, "
+            f"{sheet.sizeInBytes() / 1024 / 1024:.1f}MB in {(time.perf_counter() - start) * 1000:.0f}ms",
+            "info"
+        )
+        return key
+
+    def detach(self):
+        """Stop serving sprites and release the memory-mapped sheet."""
+        SVGLoader.set_atlas(None)
+        self._key = None
+        self._index = {}
+        # the mapping is unmapped once the last image wrapping it is released
+        self._image = None
+        self._mapping = None
+
+    def is_active(self) -> bool:
+        """Return True while an atlas is attached to SVGLoader."""
+        return self._key is not None
+
+    # ── Lookup ──
+    def lookup(self, file_path, color: str, size: QSize, dpr: float) -> Optional[QPixmap]:
+        """Return a pixmap for the sprite, or None if the atlas does not hold it.
+
+        Args:
+            file_path: Path to the icon's SVG file.
+            color (str): Fill color the icon is drawn with.
+            size (QSize): Logical icon size.
+            dpr (float): Pixel ratio the caller renders at.
+        """
+        if self._image is None or dpr != self._dpr:
+            return None
+        rect = self._index.get(sprite_key(file_path, color, size.width(), size.height()))
+        if rect is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        pixmap = QPixmap.fromImage(self._image.copy(*rect))
+        pixmap.setDevicePixelRatio(self._dpr)
+        return pixmap
+
+    # ── Background Build ──
+    def _start_build(self, palette: Dict[str, str], dpr: float, key: str):
+        with self._lock:
+            if key in self._building:
+                return
+            self._building.add(key)
+
+        def run():
+            try:
+                if self.build(dict(palette), dpr) is not None:
+                    self.atlas_built.emit(key)
+            except Exception as e:
+                DebugLogger.log(f"[IconAtlas] Failed to build atlas {key}: {e}", "warning")
+            finally:
+                with self._lock:
+                    self._building.discard(key)
+
+        threading.Thread(target=run, name=f"IconAtlas-{key}", daemon=True).start()
+
+    def _on_atlas_built(self, key: str):
+        """Attach a freshly built atlas if it is still the one the theme wants (GUI thread)."""
+        if key == self._wanted_key and key != self._key:
+            self._load(key)
+
+    # ── Persistence ──
+    @staticmethod
+    def _index_file(key: str) -> FilePath:
+        return AppPaths.ICON_ATLAS_DIR / f"{key}.json"
+
+    @staticmethod
+    def _sheet_file(key: str) -> FilePath:
+        return AppPaths.ICON_ATLAS_DIR / f"{key}.argb"
+
+    def _load(self, key: str) -> bool:
+        """Memory-map a persisted sheet and attach it to SVGLoader."""
+        index_file, sheet_file = self._index_file(key), self._sheet_file(key)
+        if not index_file.exists() or not sheet_file.exists():
+            return False
+        try:
+            meta = json.loads(index_file.read_text(encoding="utf-8"))
+            if meta.get("version") != ATLAS_FORMAT_VERSION:
+                return False
+            with open(sheet_file, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(mapping) != meta["bytes_per_line"] * meta["height"]:
+                DebugLogger.log(f"[IconAtlas] Truncated atlas sheet {sheet_file.name}", "warning")
+                return False
+            # the image wraps the mapping without copying; it must outlive the image
+            size_args = (meta["width"], meta["height"], meta["bytes_per_line"], _IMAGE_FORMAT)
+            try:
+                image = QImage(memoryview(mapping), *size_args)
+            except TypeError:  # bindings without buffer-protocol support need a bytes copy
+                image = QImage(mapping[:], *size_args).copy()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            DebugLogger.log(f"[IconAtlas] Failed to load atlas {key}: {e}", "warning")
+            return False
+
+        self.detach()
+        self._key, self._dpr, self._image, self._mapping = key, float(meta["dpr"]), image, mapping
+        self._index = {name: tuple(rect) for name, rect in meta["sprites"].items()}
+        SVGLoader.set_atlas(self)
+        index_file.touch()  # keeps recently used sheets out of pruning
+        DebugLogger.log(f"[IconAtlas] Activated atlas {key} ({len(self._index)} sprites)", "debug")
+        return True
+
+    def _write(self, key: str, sheet: QImage, index: Dict[str, SpriteRect], dpr: float) -> bool:
+        """Write the raw sheet, then its index; the index's presence marks a complete atlas."""
+        meta = {
+            "version": ATLAS_FORMAT_VERSION,
+            "width": sheet.width(),
+            "height": sheet.height(),
+            "bytes_per_line": sheet.bytesPerLine(),
+            "dpr": dpr,
+            "sprites": index,
+        }
+        try:
+            AppPaths.ICON_ATLAS_DIR.mkdir(parents=True, exist_ok=True)
+            sheet_file, index_file = self._sheet_file(key), self._index_file(key)
+            tmp_sheet = sheet_file.with_suffix(".tmp")
+            tmp_sheet.write_bytes(bytes(sheet.constBits()))
+            tmp_sheet.replace(sheet_file)
+            tmp_index = index_file.with_suffix(".jsontmp")
+            tmp_index.write_text(json.dumps(meta), encoding="utf-8")
+            tmp_index.replace(index_file)
+        except OSError as e:
+            DebugLogger.log(f"[IconAtlas] Failed to write atlas {key}: {e}", "warning")
+            return False
+        self._prune(keep={key, self._key})
+        return True
+
+    @staticmethod
+    def _prune(keep: set):
+        """Delete all but the ATLAS_MAX_FILES most recently used sheets."""
+        try:
+            index_files = sorted(
+                AppPaths.ICON_ATLAS_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+            )
+        except OSError:
+            return
+        for index_file in index_files[ATLAS_MAX_FILES:]:
+            if index_file.stem in keep:
+                continue
+            for stale in (index_file, index_file.with_suffix(".argb")):
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+
+    # ── Maintenance ──
+    def clear_cache(self) -> int:
+        """Detach the active atlas and delete every sheet on disk.
+
+        Returns:
+            int: Number of atlases removed.
+        """
+        self.detach()
+        removed = 0
+        if AppPaths.ICON_ATLAS_DIR.exists():
+            for index_file in AppPaths.ICON_ATLAS_DIR.glob("*.json"):
+                for stale in (index_file, index_file.with_suffix(".argb")):
+                    try:
+                        stale.unlink()
+                    except OSError:
+                        pass
+                removed += 1
+        return removed
+
+    def get_stats(self) -> dict:
+        """Return atlas usage statistics."""
+        return {
+            "active": self._key,
+            "sprites": len(self._index),
+            "dpr": self._dpr,
+            "mapped_bytes": len(self._mapping) if self._mapping is not None else 0,
+            "hits": self._hits,
+            "misses": self._misses,
+            "building": len(self._building),
+        }
@@ -7,12 +7,15 @@ hierarchy for theme-aware SVG icons with state management.
 """
 
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
-from PySide6.QtCore import QSize, Qt, QTimer
+from weakref import ref
+
+from PySide6.QtCore import QEvent, QSize, Qt
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QLabel, QSizePolicy, QVBoxLayout, QWidget
 
 from _dev_tools import DebugLogger
 from app.config import FALLBACK_COLOR
+from app.core.utils import img_qt_is_dpr_change
 from app.style.icon.config import Name, State, Type
 from app.style.icon.loader import IconLoader
 from app.style.icon.svg_loader import SVGLoader
@@ -121,33 +124,25 @@ class ThemedIcon(BaseIcon):
     Used by all theme-reactive icon widgets.
     """
 
-    def __init__(self, icon_enum: Name):
+    def __init__(self, icon_enum: Name, owner: QWidget = None):
         """Initialize themed icon.
 
         Args:
             icon_enum (Name): The predefined icon enum to use.
+            owner (QWidget): Widget displaying the icon; its visibility sets refresh priority.
         """
         super().__init__(icon_enum)
 
         # callback for when theme changes - set by owner widget
         self._refresh_callback = None
+        self._owner = ref(owner) if owner is not None else None
 
-        # debounce timer for theme updates (reused to prevent memory accumulation)
-        self._refresh_timer = QTimer()
-        self._refresh_timer.setSingleShot(True)
-        self._refresh_timer.timeout.connect(self._do_theme_refresh)
-
-        # register for theme updates
+        # register for theme updates (IconLoader debounces and batches refreshes)
         IconLoader.register(self)
 
     def __del__(self):
         """Cleanup when object is destroyed."""
         try:
-            # Stop and cleanup timer first
-            if hasattr(self, '_refresh_timer') and self._refresh_timer:
-                self._refresh_timer.stop()
-                self._refresh_timer.deleteLater()
-
             # Unregister from IconLoader
             IconLoader.unregister(self)
         except (AttributeError, RuntimeError, TypeError) as e:
@@ -169,25 +164,37 @@ class ThemedIcon(BaseIcon):
     def refresh_theme(self, palette: dict[str, str]):
         """Called when the theme palette updates. Refreshes icon appearance.
 
-        Compatible with existing IconLoader protocol. Includes debouncing to
-        prevent excessive re-rendering during rapid theme switches.
+        Compatible with existing IconLoader protocol. IconLoader debounces rapid
+        theme switches and calls this in batches, so the refresh happens immediately.
 
         Args:
             palette (dict[str, str]): The current color map from ThemeManager.
         """
-        # debounce rapid theme changes using reused timer
-        if self._refresh_timer.isActive():
-            self._refresh_timer.stop()
-
-        self._refresh_timer.start(50)  # 50ms debounce
-
-    def _do_theme_refresh(self):
-        """Perform the actual theme refresh after debouncing."""
         if self._refresh_callback:
             self._refresh_callback()
         else:
             self._render_icon()
 
+    def device_pixel_ratio(self):
+        """Return the owner widget's device pixel ratio, or None to use the primary screen's."""
+        owner = self._owner() if self._owner is not None else None
+        try:
+            return owner.devicePixelRatioF() if owner is not None else None
+        except RuntimeError:  # underlying widget already deleted
+            return None
+
+    def refresh_priority(self) -> int:
+        """Return the refresh order for this icon: 0 on screen, 1 scrolled away, 2 hidden."""
+        owner = self._owner() if self._owner is not None else None
+        if owner is None:
+            return 2
+        try:
+            if not owner.isVisible():
+                return 2
+            return 1 if owner.visibleRegion().isEmpty() else 0
+        except RuntimeError:  # underlying widget already deleted
+            return 2
+
     def setSize(self, width: int, height: int):
         """Override to ensure theme refreshes are respected when size changes."""
         super().setSize(width, height)
@@ -239,7 +246,8 @@ class ThemedIcon(BaseIcon):
             file_path=self._icon_spec.name.path,
             color=color,
             size=size,
-            as_icon=True
+            as_icon=True,
+            dpr=self.device_pixel_ratio()
         )
 
 
@@ -261,7 +269,7 @@ class AppIcon(QLabel):
         super().__init__(parent)
 
         # initialize ThemedIcon functionality via composition
-        self._themed_icon = ThemedIcon(icon_enum)
+        self._themed_icon = ThemedIcon(icon_enum, owner=self)
 
         # set callback so ThemedIcon can update this widget when theme changes
         self._themed_icon.set_refresh_callback(self._render_icon)
@@ -284,12 +292,19 @@ class AppIcon(QLabel):
                 file_path=self._themed_icon._icon_spec.name.path,
                 color=color,
                 size=size,
-                as_icon=False
+                as_icon=False,
+                dpr=self.devicePixelRatioF()
             )
             self.setPixmap(pixmap)
         except Exception as e:
             DebugLogger.log(f"Failed to render icon {self._themed_icon._icon_enum.name}: {e}", "warning")
 
+    def event(self, event: QEvent) -> bool:
+        """Re-render at the new device pixel ratio after a screen or scale change."""
+        if img_qt_is_dpr_change(event) and hasattr(self, "_themed_icon"):
+            self._render_icon()
+        return super().event(event)
+
     def setSize(self, width: int, height: int):
         """Set custom icon size."""
         self._themed_icon.setSize(width, height)
@@ -331,7 +346,7 @@ class StateIcon(QWidget):
         DebugLogger.log(f"StateIcon init - WA_TransparentForMouseEvents set to {self.testAttribute(Qt.WA_TransparentForMouseEvents)}", "debug")
 
         # initialize ThemedIcon functionality via composition
-        self._themed_icon = ThemedIcon(icon_enum)
+        self._themed_icon = ThemedIcon(icon_enum, owner=self)
 
         # set callback so ThemedIcon can update this widget when theme changes
         self._themed_icon.set_refresh_callback(self._on_theme_refresh)
@@ -611,7 +626,8 @@ class StateIcon(QWidget):
                 file_path=self._themed_icon._icon_spec.name.path,
                 color=color,
                 size=size,
-                as_icon=False
+                as_icon=False,
+                dpr=self.devicePixelRatioF()
             )
             self._state_pixmaps[state] = pixmap
             self._render_count += 1
@@ -679,6 +695,13 @@ class StateIcon(QWidget):
         self._render_needed_states()
         self._update_display()
 
+    def event(self, event: QEvent) -> bool:
+        """Drop state pixmaps rendered for the old device pixel ratio after a screen or scale change."""
+        if img_qt_is_dpr_change(event) and getattr(self, "_state_pixmaps", None):
+            self._render_needed_states()
+            self._update_display()
+        return super().event(event)
+
     def sizeHint(self) -> QSize:
         """Return the preferred size for this StateIcon widget."""
         return self._themed_icon._current_size
@@ -4,18 +4,26 @@ Module providing IconLoader for managing themed icons.
 
 IconLoader is a singleton registry that stores the active theme palette
 and refreshes all registered icons when the application theme changes.
+Refreshes are scheduled centrally: one debounce timer coalesces rapid theme
+changes and one batch timer works through the icons, on-screen icons first.
 """
 
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import time
+from collections import deque
 from typing import Dict, Optional, Protocol
-from weakref import WeakSet
+from weakref import WeakSet, ref
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QTimer
 
 from _dev_tools import DebugLogger
 from app.core.utils import QSingleton
 from app.style.theme_controller import Theme
 
+# ── Constants ──
+REFRESH_BATCH_SIZE = 40     # icons refreshed per event-loop tick after a theme change
+REFRESH_DEBOUNCE_MS = 50    # rapid theme changes within this window refresh icons once
+
 
 # ── Themed Icon ─────────────────────────────────────────────────────────────────────────────────────────────
 class ThemedIcon(Protocol):
@@ -23,6 +31,9 @@ class ThemedIcon(Protocol):
     def refresh_theme(self, palette: dict[str, str]) -> None: ...
     def objectName(self) -> str: ...
 
+    # optional: 0 = on screen, 1 = visible but scrolled away, 2 = hidden (default 1)
+    def refresh_priority(self) -> int: ...
+
 
 # ── Icon Loader ─────────────────────────────────────────────────────────────────────────────────────────────
 class IconLoader(QSingleton):
@@ -37,6 +48,19 @@ class IconLoader(QSingleton):
         super().__init__(parent)
         self._icons: WeakSet[ThemedIcon] = WeakSet()
         self._palette: Dict = {}
+
+        # theme refreshes are debounced once, then spread across event-loop ticks in batches
+        self._refresh_queue: deque = deque()
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self._start_refresh)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._process_refresh_batch)
+        self._refresh_started_at = 0.0
+        self._refresh_stats: Dict[str, float] = {}
         self._initialized = True
 
     # ── Private Methods ─────────────────────────────────────────────────────────────────────────────────────
@@ -49,12 +73,61 @@ class IconLoader(QSingleton):
         self._palette = new_palette
         DebugLogger.log(f"Refreshing {len(self._icons)} icons", "debug")
 
-        # Clear SVG cache once before refreshing all icons
+        # swap in the prerendered atlas for the new palette, then clear SVG cache once
+        from app.style.icon.atlas import IconAtlas
         from app.style.icon.svg_loader import SVGLoader
+        IconAtlas._get_instance().activate(new_palette)
         SVGLoader.clear_cache()
 
+        # a newer palette supersedes any refresh still in progress
+        self._refresh_queue.clear()
+        self._refresh_timer.stop()
+        self._refresh_stats = {}
+        self._debounce_timer.start()
+
+    def _start_refresh(self) -> None:
+        """Queue every registered icon, on-screen ones first, and refresh the first batch."""
+        self._refresh_started_at = time.perf_counter()
+        buckets: Dict[int, list] = {0: [], 1: [], 2: []}
         for icon in tuple(self._icons):
-            icon.refresh_theme(new_palette)
+            priority = getattr(icon, "refresh_priority", None)
+            buckets.get(priority() if priority else 1, buckets[1]).append(ref(icon))
+
+        self._refresh_queue = deque(buckets[0] + buckets[1] + buckets[2])
+        self._refresh_stats = {
+            "icons": len(self._refresh_queue),
+            "on_screen": len(buckets[0]),
+            "hidden": len(buckets[2]),
+            "batches": 0,
+        }
+        self._process_refresh_batch()
+
+    def _process_refresh_batch(self) -> None:
+        """Refresh the next batch of queued icons, then yield to the event loop."""
+        for _ in range(min(REFRESH_BATCH_SIZE, len(self._refresh_queue))):
+            icon = self._refresh_queue.popleft()()
+            if icon is not None and icon in self._icons:
+                icon.refresh_theme(self._palette)
+        self._refresh_stats["batches"] = self._refresh_stats.get("batches", 0) + 1
+
+        if self._refresh_queue:
+            self._refresh_timer.start()
+        else:
+            self._refresh_stats["ms"] = (time.perf_counter() - self._refresh_started_at) * 1000
+            DebugLogger.log(
+                f"Icon theme refresh complete: {self._refresh_stats['icons']} icons "
+                f"({self._refresh_stats['on_screen']} on screen first) in {self._refresh_stats['batches']} "
+                f"batches, {self._refresh_stats['ms']:.1f}ms",
+                "debug"
+            )
+
+    def is_refreshing(self) -> bool:
+        """Return True while a theme refresh is debouncing or has queued icons pending."""
+        return self._debounce_timer.isActive() or bool(self._refresh_queue)
+
+    def get_refresh_stats(self) -> Dict[str, float]:
+        """Return counts and timing for the most recent theme refresh."""
+        return dict(self._refresh_stats, registered=len(self._icons))
 
 
     # ── Public Methods ──────────────────────────────────────────────────────────────────────────────────────
@@ -74,8 +147,10 @@ class IconLoader(QSingleton):
         instance._palette = theme.get_current_color_map()
         theme.theme_refresh.connect(instance._on_theme_refresh)
 
-        # Clear cache once and immediately refresh all icons
+        # Activate the palette's atlas, clear cache once and immediately refresh all icons
+        from app.style.icon.atlas import IconAtlas
         from app.style.icon.svg_loader import SVGLoader
+        IconAtlas._get_instance().activate(instance._palette)
         SVGLoader.clear_cache()
 
         for icon in tuple(instance._icons):
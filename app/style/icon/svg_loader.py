@@ -11,7 +11,7 @@ data before rendering.
 import re
 from collections import OrderedDict
 from pathlib import Path
-from typing import Union
+from typing import Dict, Optional, Tuple, Union
 
 from PySide6.QtCore import QByteArray, QRectF, QSize, Qt
 from PySide6.QtGui import QIcon, QPainter, QPixmap
@@ -23,6 +23,10 @@ from _dev_tools import DebugLogger
 # Fallback path for default error icon
 _ERROR_ICON_PATH = Path(__file__).parent.parent.parent / "assets" / "icons" / "error.svg"
 
+# Private-use code point standing in for the color while a template is built;
+# it cannot occur in icon sources, so splitting on it yields the literal segments
+_COLOR_SLOT = "\ue000"
+
 def _replace_svg_colors(svg_data: str, source: str, new_color: str) -> str:
     """
     Replace fill and stroke occurrences of source color with new_color in SVG data.
@@ -95,6 +99,37 @@ def _replace_svg_colors(svg_data: str, source: str, new_color: str) -> str:
     return svg_data
 
 
+# ── SVG Template ────────────────────────────────────────────────────────────────────────────────────────────
+class SVGTemplate:
+    """An SVG source tokenized once into literal segments around its color slots.
+
+    The template is built by running `_replace_svg_colors` a single time with a
+    placeholder color, so recoloring for any palette is one `str.join`.
+    """
+
+    __slots__ = ("_segments", "injected_fill")
+
+    def __init__(self, segments: Tuple[str, ...], injected_fill: bool = False):
+        self._segments = segments
+        self.injected_fill = injected_fill
+
+    @classmethod
+    def from_source(cls, raw_svg: str, source: str) -> "SVGTemplate":
+        """Tokenize `raw_svg`, marking every place `source` would be recolored."""
+        segments = tuple(_replace_svg_colors(raw_svg, source, _COLOR_SLOT).split(_COLOR_SLOT))
+        # no fill existed in the source, so one had to be injected
+        return cls(segments, injected_fill=len(segments) > 1 and 'fill=' not in raw_svg.lower())
+
+    @property
+    def slot_count(self) -> int:
+        """Number of color slots in the template."""
+        return len(self._segments) - 1
+
+    def render(self, color: str) -> str:
+        """Return the SVG source with every color slot set to `color`."""
+        return color.join(self._segments)
+
+
 # ── SVG Loader ──────────────────────────────────────────────────────────────────────────────────────────────
 class SVGLoader:
     """Utility class for loading and recoloring SVG files with smart caching."""
@@ -102,10 +137,17 @@ class SVGLoader:
     # Smart cache with LRU eviction using OrderedDict
     _cache: OrderedDict[tuple, Union[QPixmap, QIcon]] = OrderedDict()
 
+    # Palette-independent caches; these survive clear_cache() on theme change
+    _raw_sources: Dict[str, str] = {}
+    _templates: Dict[Tuple[str, str], SVGTemplate] = {}
+
     # Cache configuration
     _MAX_CACHE_SIZE = 200  # Maximum number of cached items
     _CACHE_HIGH_WATER_MARK = 150  # Start evicting when we reach this
 
+    # Prerendered sprite sheet for the active palette (see app/style/icon/atlas.py)
+    _atlas = None
+
     # Track which icons have had fill attributes injected (for logging purposes)
     _injected_icons: set[str] = set()
 
@@ -120,6 +162,7 @@ class SVGLoader:
         size: Union[QSize, tuple[int, int]] = QSize(24, 24),
         source: str = "#000",
         as_icon: bool = False,
+        dpr: Optional[float] = None,
     ) -> Union[QPixmap, QIcon]:
         """Load an SVG file, optionally recolor it, and render as QPixmap or QIcon.
 
@@ -132,6 +175,9 @@ class SVGLoader:
                 Defaults to "#000".
             as_icon (bool, optional): If True, returns a QIcon; otherwise, a QPixmap.
                 Defaults to False.
+            dpr (float, optional): Device pixel ratio to render at, normally the
+                displaying widget's `devicePixelRatioF()`. Defaults to the primary
+                screen's ratio.
 
         Returns:
             QPixmap or QIcon: The rendered and recolored SVG image, or an
@@ -149,8 +195,15 @@ class SVGLoader:
         if logical_size.width() <= 0 or logical_size.height() <= 0:
             logical_size = QSize(24, 24)
 
+        # ── Determine Device Pixel Ratio ──
+        if dpr is None:
+            app = QApplication.instance()
+            screen = app.primaryScreen() if app else None
+            dpr = screen.devicePixelRatio() if screen else 1.0
+
         # ── Check Cache ──
-        cache_key = (str(file_path), color, logical_size.width(), logical_size.height(), source, as_icon)
+        # one shared pixmap per (icon, color, size, dpr); screens with different ratios get their own
+        cache_key = (str(file_path), color, logical_size.width(), logical_size.height(), source, as_icon, dpr)
         if cache_key in SVGLoader._cache:
             # Move to end (mark as recently used) for LRU
             result = SVGLoader._cache[cache_key]
@@ -160,36 +213,20 @@ class SVGLoader:
 
         SVGLoader._cache_misses += 1
 
-        # ── Read SVG ──
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                raw_svg = f.read()
-        except Exception as e:
-            DebugLogger.log(f"svg_loader: Failed to open SVG file {file_path}: {e}", "warning")
+        # ── Check Atlas ──
+        if SVGLoader._atlas is not None and source == "#000":
+            pixmap = SVGLoader._atlas.lookup(file_path, color, logical_size, dpr)
+            if pixmap is not None:
+                result = QIcon(pixmap) if as_icon else pixmap
+                SVGLoader._cache[cache_key] = result
+                SVGLoader._manage_cache_size()
+                return result
+
+        # ── Recolor From Template ──
+        template = SVGLoader.get_template(file_path, source)
+        if template is None:
             return QIcon(str(_ERROR_ICON_PATH)) if as_icon else QPixmap(str(_ERROR_ICON_PATH))
-        svg_data = raw_svg
-
-        # ── Note ───────────────────────────────────────────────────────────── #
-        # Replace the source color (both fill and stroke) with the new color
-        # Use regex for potentially more robust replacement across attributes
-        # ───────────────────────────────────────────────────────────────────── #
-
-        try:
-            svg_data = _replace_svg_colors(raw_svg, source, color)
-
-            # Only log injection of fill attributes once per icon (more significant event)
-            # Skip logging normal color replacements to reduce noise
-            if (svg_data != raw_svg and 'fill=' not in raw_svg.lower() and
-                file_path.name not in SVGLoader._injected_icons):
-                DebugLogger.log(
-                    f"svg_loader: Injected fill attribute for {file_path.name}",
-                    "debug"
-                )
-                SVGLoader._injected_icons.add(file_path.name)
-
-        except re.error as e:  # catch regex errors
-            DebugLogger.log(f"svg_loader: Regex error processing {file_path}: {e}", "warning")
-            svg_data = raw_svg
+        svg_data = template.render(color)
 
 
         # ── Render SVG ──
@@ -210,15 +247,6 @@ class SVGLoader:
 
 
         # ── Handle Rendering ──
-        app = QApplication.instance()
-
-        # check device pixel ratio
-        dpr = 1.0
-        if app:
-            screen = app.primaryScreen()
-            if screen:
-                dpr = screen.devicePixelRatio()
-
         # calculate physical size based on logical size and device pixel ratio
         physical = QSize(int(logical_size.width() * dpr), int(logical_size.height() * dpr))
 
@@ -252,6 +280,60 @@ class SVGLoader:
         SVGLoader._manage_cache_size()
         return result
 
+    @classmethod
+    def get_template(cls, file_path: Path, source: str = "#000") -> Optional[SVGTemplate]:
+        """Return the recolorable template for an SVG file, reading and tokenizing it once.
+
+        Args:
+            file_path (Path): Path to the SVG file.
+            source (str): Original fill/stroke color marking the color slots.
+
+        Returns:
+            SVGTemplate | None: The template, or None if the file cannot be read.
+        """
+        key = (str(file_path), source)
+        template = cls._templates.get(key)
+        if template is not None:
+            return template
+
+        # ── Read SVG ──
+        raw_svg = cls._raw_sources.get(key[0])
+        if raw_svg is None:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    raw_svg = f.read()
+            except Exception as e:
+                DebugLogger.log(f"svg_loader: Failed to open SVG file {file_path}: {e}", "warning")
+                return None
+            cls._raw_sources[key[0]] = raw_svg
+
+        # ── Tokenize ──
+        try:
+            template = SVGTemplate.from_source(raw_svg, source)
+        except re.error as e:  # catch regex errors
+            DebugLogger.log(f"svg_loader: Regex error processing {file_path}: {e}", "warning")
+            template = SVGTemplate((raw_svg,))  # render unrecolored
+
+        # Only log injection of fill attributes once per icon (more significant event)
+        if template.injected_fill and Path(file_path).name not in cls._injected_icons:
+            DebugLogger.log(f"svg_loader: Injected fill attribute for {Path(file_path).name}", "debug")
+            cls._injected_icons.add(Path(file_path).name)
+
+        cls._templates[key] = template
+        return template
+
+    @classmethod
+    def set_atlas(cls, atlas):
+        """Attach a prerendered icon atlas consulted before rendering (None detaches)."""
+        cls._atlas = atlas
+
+    @classmethod
+    def clear_template_cache(cls):
+        """Drop raw sources and templates (e.g. after icon files change on disk)."""
+        cls._raw_sources.clear()
+        cls._templates.clear()
+        cls._injected_icons.clear()
+
     @classmethod
     def _manage_cache_size(cls):
         """Manage cache size using LRU eviction when high water mark is reached."""
@@ -268,10 +350,12 @@ class SVGLoader:
 
     @classmethod
     def clear_cache(cls):
-        """Clear the SVG cache. Useful for memory management or theme changes."""
+        """Clear rendered pixmaps/icons. Useful for memory management or theme changes.
+
+        Raw sources and templates are palette-independent and are kept.
+        """
         cache_size = len(cls._cache)
         cls._cache.clear()
-        cls._injected_icons.clear()
         cls._cache_hits = 0
         cls._cache_misses = 0
         # Only log if there was actually something to clear
@@ -294,7 +378,9 @@ class SVGLoader:
             'cache_hits': cls._cache_hits,
             'cache_misses': cls._cache_misses,
             'hit_rate_percent': round(hit_rate, 2),
-            'injected_icons': len(cls._injected_icons)
+            'injected_icons': len(cls._injected_icons),
+            'templates': len(cls._templates),
+            'atlas_attached': cls._atlas is not None,
         }
 
     @classmethod
@@ -7,12 +7,74 @@ the material-color-utilities library.
 """
 
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
-from typing import Dict, Union
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 from _dev_tools.debug_logger import DebugLogger
+from app.config import AppPaths
 
 from .config import Mode, Qss, Typography
 
+# ── Constants ──
+# only match placeholders that look like variables (alphanumeric + underscore, no spaces/special chars)
+PLACEHOLDER_RE = re.compile(r"\{([a-zA-Z_][a-zA-Z0-9_]*)\}")
+CACHE_FORMAT_VERSION = 1  # bump to invalidate every rendered stylesheet on disk
+
+
+# ── Stylesheet Template ─────────────────────────────────────────────────────────────────────────────────────
+class StylesheetTemplate:
+    """
+    A QSS template parsed once into literal and placeholder segments.
+
+    Rendering walks the segment list and joins the result in a single pass, so a
+    theme change costs one dictionary lookup per placeholder occurrence.
+    """
+
+    __slots__ = ("source", "_literals", "_placeholders", "placeholder_names")
+
+    def __init__(self, content: str):
+        self.source = content
+        # literals[i] precedes placeholders[i]; the final literal trails the last placeholder
+        self._literals: List[str] = []
+        self._placeholders: List[str] = []
+
+        position = 0
+        for match in PLACEHOLDER_RE.finditer(content):
+            self._literals.append(content[position:match.start()])
+            self._placeholders.append(match.group(1))
+            position = match.end()
+        self._literals.append(content[position:])
+
+        self.placeholder_names = frozenset(self._placeholders)
+
+    def render(self, variables: Dict[str, str]) -> str:
+        """Substitute `variables` into the template; unknown placeholders are left as-is.
+
+        Args:
+            variables (Dict[str, str]): Placeholder name to value.
+
+        Returns:
+            str: The rendered stylesheet.
+        """
+        missing = self.placeholder_names.difference(variables)
+        for name in sorted(missing):
+            DebugLogger.log(
+                f"Warning: Placeholder {{{name}}} found in stylesheet but no matching variable provided",
+                "warning"
+            )
+
+        parts = []
+        append = parts.append
+        for literal, name in zip(self._literals, self._placeholders):
+            append(literal)
+            value = variables.get(name)
+            append(value if value is not None else f"{{{name}}}")
+        append(self._literals[-1])
+        return "".join(parts)
+
 
 class Stylesheet:
     """
@@ -22,6 +84,9 @@ class Stylesheet:
     and replaces them with actual color values from a provided color map.
     """
 
+    # compiled templates keyed by path -> (source signature, template)
+    _templates: Dict[str, Tuple[Tuple[int, int], StylesheetTemplate]] = {}
+
     @classmethod
     def inject_theme(
         cls,
@@ -30,54 +95,132 @@ class Stylesheet:
         font_map: Dict[str, str] = None
     ) -> str:
         """Injects color and font values into a stylesheet template using `{placeholder}` syntax."""
-        result = stylesheet_content  # make a copy to avoid mutating the original
-
         # combine color and font maps
         variable_map = color_map.copy()
         if font_map:
             variable_map.update(font_map)
 
-        # track successful and failed injections
-        successful_injections = 0
-        failed_injections = []
-
-        # replace placeholders starting with longest names first to avoid partial matches
-        for var_name in sorted(variable_map.keys(), key=lambda name: len(name), reverse=True):
-            var_value = variable_map[var_name]
-            placeholder = f"{{{var_name}}}"
-
-            # check if placeholder exists in stylesheet before replacement
-            if placeholder in result:
-                result = result.replace(placeholder, var_value)
-                successful_injections += 1
-                DebugLogger.log(
-                    "Successfully injected {placeholder} with value {var_value}",
-                    "debug"
-                )
-            else:
-                # only log as failed if the placeholder was expected but not found
-                # (don't spam logs for unused variables)
-                pass
-
-        # log summary of successful injections
-        if successful_injections > 0:
-            DebugLogger.log(
-                f"Theme injection completed: {successful_injections} variables successfully injected",
-                "debug"
-            )
+        template = StylesheetTemplate(stylesheet_content)
+        DebugLogger.log(
+            f"Theme injection completed: {len(template.placeholder_names & variable_map.keys())} variables injected",
+            "debug"
+        )
+        return template.render(variable_map)
+
+    @classmethod
+    def compile(cls, path: Qss) -> Optional[StylesheetTemplate]:
+        """Return the compiled template for a stylesheet file, parsing it only when it changes.
 
-        # check for any remaining unmatched placeholders in the result
-        # only match placeholders that look like variables (alphanumeric + underscore, no spaces/special chars)
-        import re
-        remaining_placeholders = re.findall(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}', result)
-        if remaining_placeholders:
-            for placeholder in remaining_placeholders:
-                DebugLogger.log(
-                    f"Warning: Placeholder {{{placeholder}}} found in stylesheet but no matching variable provided",
-                    "warning"
-                )
-
-        return result
+        Args:
+            path (Qss): Stylesheet to compile.
+
+        Returns:
+            StylesheetTemplate | None: The template, or None if the file cannot be read.
+        """
+        key = str(path.value)
+        signature = cls._source_signature(path)
+        cached = cls._templates.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        content = cls.read(path)
+        if not content:
+            return None
+        template = StylesheetTemplate(content)
+        cls._templates[key] = (signature, template)
+        DebugLogger.log(f"Compiled stylesheet template: {path.value}", "debug")
+        return template
+
+    @classmethod
+    def render(cls, path: Qss, variables: Dict[str, str], use_disk_cache: bool = True) -> str:
+        """Render a stylesheet file with `variables`, reusing a disk-cached result when possible.
+
+        The disk cache is keyed by the source file's signature and a hash of the variable
+        map (color map, font map and theme name), so a cache hit skips reading and
+        parsing the QSS entirely.
+
+        Args:
+            path (Qss): Stylesheet to render.
+            variables (Dict[str, str]): Placeholder name to value.
+            use_disk_cache (bool): Read and write rendered output under AppPaths.STYLESHEET_CACHE_DIR.
+
+        Returns:
+            str: The rendered stylesheet, or "" if the source cannot be read.
+        """
+        cache_file = cls._cache_file(path, variables) if use_disk_cache else None
+        if cache_file is not None and cache_file.exists():
+            try:
+                rendered = cache_file.read_text(encoding="utf-8")
+                DebugLogger.log(f"Loaded rendered stylesheet from cache: {cache_file.name}", "debug")
+                return rendered
+            except OSError as e:
+                DebugLogger.log(f"Failed to read stylesheet cache {cache_file}: {e}", "warning")
+
+        template = cls.compile(path)
+        if template is None:
+            return ""
+        rendered = template.render(variables)
+
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(".tmp")
+                tmp_file.write_text(rendered, encoding="utf-8")
+                tmp_file.replace(cache_file)
+                cls._prune_stale_cache(cache_file)
+            except OSError as e:
+                DebugLogger.log(f"Failed to write stylesheet cache {cache_file}: {e}", "warning")
+        return rendered
+
+    @classmethod
+    def clear_cache(cls) -> int:
+        """Drop compiled templates and delete rendered stylesheets on disk.
+
+        Returns:
+            int: Number of cache files removed.
+        """
+        cls._templates.clear()
+        removed = 0
+        if AppPaths.STYLESHEET_CACHE_DIR.exists():
+            for cache_file in AppPaths.STYLESHEET_CACHE_DIR.glob("*.qss"):
+                try:
+                    cache_file.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    @staticmethod
+    def _prune_stale_cache(current: Path):
+        """Remove rendered files left over from older versions of the same source file."""
+        stem, source_key, _ = current.stem.rsplit("-", 2)
+        for cache_file in current.parent.glob(f"{stem}-*.qss"):
+            if cache_file.stem.rsplit("-", 2)[1] != source_key:
+                try:
+                    cache_file.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _source_signature(path: Qss) -> Tuple[int, int]:
+        """Cheap change detector for a stylesheet file: (mtime_ns, size)."""
+        try:
+            stat = Path(path.value).stat()
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return 0, 0
+
+    @classmethod
+    def _cache_file(cls, path: Qss, variables: Dict[str, str]) -> Path:
+        """Cache file for a (source, variable map) pair."""
+        variables_hash = hashlib.sha1(
+            json.dumps(variables, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+        mtime_ns, size = cls._source_signature(path)
+        source_key = hashlib.sha1(
+            f"{CACHE_FORMAT_VERSION}|{path.value}|{mtime_ns}|{size}".encode("utf-8")
+        ).hexdigest()[:12]
+        return AppPaths.STYLESHEET_CACHE_DIR / f"{Path(path.value).stem}-{source_key}-{variables_hash}.qss"
 
 
     @classmethod
@@ -0,0 +1,382 @@
+"""app/style/theme/switch_engine.py
+
+Scoped application of theme changes.
+
+`QApplication.setStyleSheet` re-polishes every widget in the application. The
+ThemeSwitchEngine diffs the previous and new variable maps, works out which QSS
+rules (and so which widget classes/object names) reference the changed variables,
+and re-styles only those widgets when the change is narrow. Broad changes such as
+a light/dark toggle still fall back to a single app-wide stylesheet swap, as does
+any change where an override would beat a more specific application rule.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication, QWidget
+
+from _dev_tools import DebugLogger
+
+from .config import Qss
+from .style_sheet import PLACEHOLDER_RE, Stylesheet, StylesheetTemplate
+
+# ── Constants ──
+SCOPED_WIDGET_LIMIT = 200       # above this many affected widgets a full swap is cheaper
+OVERRIDE_PROPERTY = "_themeOverride"  # marks stylesheets owned by the engine
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_COMPOUND_SPLIT_RE = re.compile(r"\s*>\s*|\s+")
+_SUBJECT_RE = re.compile(r"^(?P<type>[A-Za-z_][A-Za-z0-9_]*|\*)?(?P<rest>.*)$")
+_ID_RE = re.compile(r"#([A-Za-z_][A-Za-z0-9_-]*)")
+_ATTRIBUTE_RE = re.compile(r"\[[^\]]*\]")
+_CLASS_RE = re.compile(r"(?:\.|(?<!:):(?!:)!?)[A-Za-z_][A-Za-z0-9_-]*")  # .Class and :pseudo-state
+_SUBCONTROL_RE = re.compile(r"::[A-Za-z_][A-Za-z0-9_-]*")
+_TYPE_RE = re.compile(r"^[A-Za-z_]")
+
+Specificity = Tuple[int, int, int]  # (ids, classes/attributes/pseudo-states, types/subcontrols)
+
+
+# ── Rule Index ──────────────────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class QssRule:
+    """A single top-level QSS rule and the variables it references."""
+    text: str                                   # full rule, still templated
+    subjects: Tuple[Tuple[Optional[str], Optional[str]], ...]  # (type name, object name) per selector
+    specificities: Tuple[Specificity, ...]      # per selector, parallel to subjects
+    properties: FrozenSet[str]                  # declared property families ("border-color" -> "border")
+    variables: FrozenSet[str]
+
+    @property
+    def is_broad(self) -> bool:
+        """True if any selector matches by type alone on QWidget or everything."""
+        return any(
+            object_name is None and type_name in (None, "*", "QWidget")
+            for type_name, object_name in self.subjects
+        )
+
+def _parse_subject(selector: str) -> Tuple[Optional[str], Optional[str]]:
+    """Extract (type name, object name) from the last compound of a selector."""
+    compound = _COMPOUND_SPLIT_RE.split(selector.strip())[-1]
+    compound = compound.split("::", 1)[0]
+    match = _SUBJECT_RE.match(compound)
+    type_name = match.group("type") if match else None
+    id_match = _ID_RE.search(compound)
+    return type_name, (id_match.group(1) if id_match else None)
+
+def _specificity(selector: str) -> Specificity:
+    """CSS specificity of a selector, counting QSS subcontrols like pseudo-elements."""
+    selector = _ATTRIBUTE_RE.sub(".attr", selector.strip())  # attributes weigh like classes
+    ids = len(_ID_RE.findall(selector))
+    subcontrols = len(_SUBCONTROL_RE.findall(selector))
+    classes = len(_CLASS_RE.findall(_SUBCONTROL_RE.sub("", selector)))
+    types = sum(1 for compound in _COMPOUND_SPLIT_RE.split(selector) if _TYPE_RE.match(compound))
+    return ids, classes, types + subcontrols
+
+def _property_families(body: str) -> FrozenSet[str]:
+    """Declared property names reduced to their shorthand family."""
+    families = set()
+    for declaration in body.split(";"):
+        name, colon, _ = declaration.partition(":")
+        if colon and name.strip():
+            families.add(name.strip().lower().split("-", 1)[0])
+    return frozenset(families)
+
+def parse_rules(source: str) -> List[QssRule]:
+    """Split a QSS template into top-level rules.
+
+    QSS has no nesting, so every `selector { body }` pair at brace depth zero is
+    one rule. Variable placeholders (`{name}`) inside a body are skipped over.
+
+    Args:
+        source (str): Templated stylesheet source.
+
+    Returns:
+        List[QssRule]: Rules in source order.
+    """
+    source = _COMMENT_RE.sub("", source)
+    rules = []
+    position = 0
+    while True:
+        open_brace = source.find("{", position)
+        # placeholders never appear in selectors, so the first brace opens the body
+        if open_brace == -1:
+            break
+        close_brace = open_brace + 1
+        while True:
+            close_brace = source.find("}", close_brace)
+            if close_brace == -1:
+                return rules
+            # a "}" that closes a placeholder is preceded by "{name"
+            placeholder_start = source.rfind("{", open_brace + 1, close_brace)
+            if placeholder_start != -1 and PLACEHOLDER_RE.fullmatch(source, placeholder_start, close_brace + 1):
+                close_brace += 1
+                continue
+            break
+
+        selector_text = source[position:open_brace].strip()
+        body = source[open_brace + 1:close_brace]
+        if selector_text:
+            selectors = [sel for sel in selector_text.split(",") if sel.strip()]
+            rules.append(QssRule(
+                text=f"{selector_text} {{{body}}}",
+                subjects=tuple(_parse_subject(sel) for sel in selectors),
+                specificities=tuple(_specificity(sel) for sel in selectors),
+                properties=_property_families(body),
+                variables=frozenset(PLACEHOLDER_RE.findall(body)),
+            ))
+        position = close_brace + 1
+    return rules
+
+
+# ── Theme Switch Engine ─────────────────────────────────────────────────────────────────────────────────────
+class ThemeSwitchEngine(QObject):
+    """Applies a rendered stylesheet with the smallest re-polish the change allows.
+
+    Scoped switches leave the application stylesheet untouched and instead give each
+    affected widget an override sheet holding just the changed rules. A widget's own
+    sheet beats the application sheet whatever the selector specificity, so a switch
+    is only scoped when no unchanged application rule would have won the cascade for
+    a property the override sets. An application event filter applies the same
+    overrides to widgets polished afterwards (or falls back to a full swap if one
+    of them would hit such a conflict), and the next full switch clears every override.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._rules: List[QssRule] = []
+        self._rules_source_id: Optional[int] = None
+        self._rule_order: Dict[QssRule, int] = {}
+        self._rendered = ""
+        self._applied_variables: Dict[str, str] = {}
+        self._override_rules: List[QssRule] = []
+        self._override_subjects: Set[Tuple[Optional[str], Optional[str]]] = set()
+        self._override_sheet = ""
+        self._conflict_candidates: List[QssRule] = []
+        self._full_pending = False
+        self._filter_installed = False
+        self.force_full = False  # benchmarks toggle this to compare strategies
+        self.last_switch_stats: Dict[str, object] = {}
+
+    # ── Diffing ──
+    @staticmethod
+    def diff(old: Dict[str, str], new: Dict[str, str]) -> Set[str]:
+        """Return the variable names whose values differ between two maps."""
+        return {name for name in old.keys() | new.keys() if old.get(name) != new.get(name)}
+
+    def _index_rules(self, source: Union[Qss, StylesheetTemplate]) -> bool:
+        """(Re)build the rule index when the compiled template changes."""
+        template = source if isinstance(source, StylesheetTemplate) else Stylesheet.compile(source)
+        if template is None:
+            return False
+        if self._rules_source_id != id(template):
+            self._rules = parse_rules(template.source)
+            self._rule_order = {rule: position for position, rule in enumerate(self._rules)}
+            self._rules_source_id = id(template)
+        return True
+
+    # ── Apply ──
+    def apply(
+        self,
+        source: Union[Qss, StylesheetTemplate],
+        variables: Dict[str, str],
+        rendered: str
+    ) -> Set[str]:
+        """Apply a theme change.
+
+        Args:
+            source (Qss | StylesheetTemplate): Stylesheet the sheet was rendered from
+                (compiled only for scoped switches).
+            variables (Dict[str, str]): Full variable map the sheet was rendered with.
+            rendered (str): `source` rendered with `variables`.
+
+        Returns:
+            Set[str]: Names of the variables that changed (empty if nothing was applied).
+        """
+        app = QApplication.instance()
+        if app is None:
+            DebugLogger.log("No QApplication instance found for stylesheet application", "error")
+            return set()
+
+        start = time.perf_counter()
+        first_apply = not self._applied_variables
+        changed = set(variables) if first_apply else self.diff(self._applied_variables, variables)
+        if not changed:
+            DebugLogger.log("Theme variables unchanged; skipping stylesheet application", "debug")
+            self.last_switch_stats = {"strategy": "skipped", "changed": 0, "widgets": 0, "ms": 0.0}
+            return changed
+
+        self._rendered = rendered
+        strategy, widget_count = "full", len(app.allWidgets())
+        if not first_apply and not self.force_full and self._index_rules(source):
+            affected_rules = [rule for rule in self._rules if rule.variables & changed]
+            targets = self._find_targets(app, affected_rules)
+            if targets is not None:
+                self._apply_scoped(app, affected_rules, variables, targets)
+                strategy, widget_count = "scoped", len(targets)
+
+        if strategy == "full":
+            self._apply_full(app, rendered)
+
+        self._applied_variables = dict(variables)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.last_switch_stats = {
+            "strategy": strategy, "changed": len(changed), "widgets": widget_count, "ms": elapsed_ms
+        }
+        DebugLogger.log(
+            f"Theme switch ({strategy}): {len(changed)} variables changed, "
+            f"{widget_count} widgets re-polished in {elapsed_ms:.1f}ms",
+            "info"
+        )
+        return changed
+
+    def _find_targets(self, app: QApplication, rules: List[QssRule]) -> Optional[List[QWidget]]:
+        """Return the widgets matched by `rules`, or None if a scoped switch is not worthwhile."""
+        if not rules or any(rule.is_broad for rule in rules):
+            return None
+
+        subjects = {subject for rule in rules for subject in rule.subjects}
+        overrides = self._merged_overrides(rules)
+        candidates = self._candidates(overrides)
+        targets = []
+        for widget in app.allWidgets():
+            if not self._matches(widget, subjects):
+                continue
+            # a widget's own stylesheet would be replaced by the override; fall back to a full swap
+            if widget.styleSheet() and not widget.property(OVERRIDE_PROPERTY):
+                return None
+            if self._conflicts(widget, overrides, candidates):
+                return None
+            targets.append(widget)
+            if len(targets) > SCOPED_WIDGET_LIMIT:
+                return None
+        return targets
+
+    def _merged_overrides(self, rules: List[QssRule]) -> List[QssRule]:
+        """The current override rules extended with `rules`, in source order."""
+        merged = set(self._override_rules) | set(rules)
+        return sorted(merged, key=lambda rule: self._rule_order.get(rule, -1))
+
+    def _candidates(self, overrides: List[QssRule]) -> List[QssRule]:
+        """Application rules that set a property some override rule also sets."""
+        families = frozenset().union(*(rule.properties for rule in overrides))
+        overridden = set(overrides)
+        return [rule for rule in self._rules if rule not in overridden and rule.properties & families]
+
+    def _conflicts(self, widget: QWidget, overrides: List[QssRule], candidates: List[QssRule]) -> bool:
+        """True if an application rule would beat an override rule on `widget` in the cascade."""
+        applied = []
+        for rule in overrides:
+            rank = self._rank(widget, rule, min)
+            if rank is not None:
+                applied.append((rule, rank))
+        if not applied:
+            return False
+
+        for rule in candidates:
+            rank = self._rank(widget, rule, max)
+            if rank is None:
+                continue
+            for override, override_rank in applied:
+                if rule.properties & override.properties and rank > override_rank:
+                    return True
+        return False
+
+    def _rank(self, widget: QWidget, rule: QssRule, pick) -> Optional[Tuple[Specificity, int]]:
+        """Cascade rank (specificity, source position) of the rule's selectors matching `widget`."""
+        matched = [
+            specificity for subject, specificity in zip(rule.subjects, rule.specificities)
+            if self._matches(widget, (subject,))
+        ]
+        if not matched:
+            return None
+        return pick(matched), self._rule_order.get(rule, -1)
+
+    @staticmethod
+    def _matches(widget: QWidget, subjects) -> bool:
+        object_name = widget.objectName()
+        for type_name, subject_name in subjects:
+            if subject_name is not None and subject_name != object_name:
+                continue
+            if type_name not in (None, "*") and not widget.inherits(type_name):
+                continue
+            return True
+        return False
+
+    def _apply_full(self, app: QApplication, rendered: str):
+        """Swap the application stylesheet, dropping any scoped overrides."""
+        for widget in app.allWidgets():
+            if widget.property(OVERRIDE_PROPERTY):
+                widget.setProperty(OVERRIDE_PROPERTY, False)
+                widget.setStyleSheet("")
+        self._override_rules = []
+        self._override_subjects = set()
+        self._override_sheet = ""
+        self._conflict_candidates = []
+
+        # paint once after the re-polish instead of once per widget
+        windows = [w for w in app.topLevelWidgets() if w.isVisible()]
+        for window in windows:
+            window.setUpdatesEnabled(False)
+        try:
+            app.setStyleSheet(rendered)
+        finally:
+            for window in windows:
+                window.setUpdatesEnabled(True)
+
+    def _apply_scoped(
+        self,
+        app: QApplication,
+        rules: List[QssRule],
+        variables: Dict[str, str],
+        targets: List[QWidget]
+    ):
+        """Give only the affected widgets an override sheet with the changed rules."""
+        # later scoped switches extend the override set; identical rules are replaced
+        self._override_rules = self._merged_overrides(rules)
+        self._conflict_candidates = self._candidates(self._override_rules)
+        self._override_subjects = {subject for rule in self._override_rules for subject in rule.subjects}
+        self._override_sheet = StylesheetTemplate(
+            "\n".join(rule.text for rule in self._override_rules)
+        ).render(variables)
+
+        for widget in targets:
+            widget.setProperty(OVERRIDE_PROPERTY, True)
+            widget.setStyleSheet(self._override_sheet)
+
+        if not self._filter_installed:
+            app.installEventFilter(self)
+            self._filter_installed = True
+
+    # ── Event Filter ──
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Style widgets created after a scoped switch the same way as existing ones."""
+        if (
+            self._override_rules
+            and event.type() == QEvent.Polish
+            and isinstance(obj, QWidget)
+            and not obj.styleSheet()
+        ):
+            if not self._matches(obj, self._override_subjects):
+                return False
+            if self._conflicts(obj, self._override_rules, self._conflict_candidates):
+                # the override would beat a more specific rule; swap the whole sheet instead
+                if not self._full_pending:
+                    self._full_pending = True
+                    QTimer.singleShot(0, self._reapply_full)
+                return False
+            obj.setProperty(OVERRIDE_PROPERTY, True)
+            obj.setStyleSheet(self._override_sheet)
+        return False
+
+    def _reapply_full(self):
+        """Deferred full swap of the last applied sheet, queued from the event filter."""
+        self._full_pending = False
+        app = QApplication.instance()
+        if app is not None and self._override_rules:
+            self._apply_full(app, self._rendered)
+            self.last_switch_stats = dict(self.last_switch_stats, strategy="full")
+            DebugLogger.log("Scoped theme override conflicts with a new widget; applied full stylesheet", "info")
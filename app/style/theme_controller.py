@@ -10,13 +10,13 @@ run-time changes of source color and light/dark modes.
 from typing import Dict, Optional
 
 from PySide6.QtCore import QObject, Signal
-from PySide6.QtWidgets import QApplication
 
 from _dev_tools import DebugLogger
 from app.core.utils import QSingleton
 
 from .theme.config import Mode, Qss, Typography
 from .theme.style_sheet import Stylesheet
+from .theme.switch_engine import ThemeSwitchEngine
 
 
 # ── Theme Manager ───────────────────────────────────────────────────────────────────────────────────────────
@@ -38,6 +38,8 @@ class Theme(QSingleton):
         self._current_font_map: Dict[str, str] = Typography.generate_font_variables()
         self._theme_name: str = "light"  # default theme name
         self._base_style = None
+        self._all_variables: Dict[str, str] = {}
+        self._switch_engine = ThemeSwitchEngine(self)
 
 
     @classmethod
@@ -51,20 +53,16 @@ class Theme(QSingleton):
     def _inject_theme_colors(self) -> str:
         """Injects the current theme colors and fonts into the given stylesheet content."""
         try:
-            base_content = Stylesheet.read(Qss.BASE)
-            if not base_content:
-                DebugLogger.log(f"Failed to load base stylesheet: {Qss.BASE.value}", "error")
-                return ""
-            DebugLogger.log(f"Loaded base stylesheet: {Qss.BASE.value}", "info")
-
             # combine all variable maps
             all_variables = self._current_color_map.copy()
             all_variables.update(self._current_font_map)
             all_variables['theme_name'] = self._theme_name
+            self._all_variables = all_variables
 
-            self._base_style = Stylesheet.inject_theme(base_content, all_variables)
+            # compiled once per source file; rendered output is disk-cached per variable map
+            self._base_style = Stylesheet.render(Qss.BASE, all_variables)
             if not self._base_style:
-                DebugLogger.log(f"Failed to process base stylesheet with theme variables", "error")
+                DebugLogger.log(f"Failed to process base stylesheet: {Qss.BASE.value}", "error")
                 return ""
             DebugLogger.log(f"Processed base stylesheet with theme variables for {self._theme_name} mode", "info")
             return self._base_style
@@ -74,27 +72,41 @@ class Theme(QSingleton):
 
 
 
-    def _load_global_stylesheet(self):
-        """Applies the processed global stylesheet to the application."""
-        try:
-            app = QApplication.instance()
-            if not app:
-                DebugLogger.log("No QApplication instance found for stylesheet application", "error")
-                return
+    def _load_global_stylesheet(self) -> set:
+        """Applies the processed global stylesheet, re-polishing only what the change affects.
 
+        Returns:
+            set: Names of the theme variables that changed (empty if nothing was applied).
+        """
+        try:
             if not self._base_style:
                 DebugLogger.log("No base stylesheet available to apply", "error")
-                return
+                return set()
 
-            app.setStyleSheet(self._base_style)
-            DebugLogger.log(f"Applied global stylesheet to application for {self._theme_name} theme", "info")
+            changed = self._switch_engine.apply(Qss.BASE, self._all_variables, self._base_style)
+            if changed:
+                DebugLogger.log(f"Applied global stylesheet to application for {self._theme_name} theme", "info")
+            return changed
         except Exception as e:
             DebugLogger.log(f"Error applying global stylesheet: {e}", "error")
+            return set()
 
 
 
 
 
+    def _prebuild_icon_atlas(self, file_path: str, mode: Mode):
+        """Render the opposite mode's icon atlas in the background so the next toggle is a swap."""
+        from app.style.icon.atlas import IconAtlas
+
+        from .theme.custom_color_loader import CustomColorLoader
+
+        other_mode = Mode.DARK if mode == Mode.LIGHT else Mode.LIGHT
+        other_color_map = CustomColorLoader.load_from_file(file_path, other_mode)
+        if other_color_map:
+            IconAtlas._get_instance().prebuild(other_color_map)
+
+
     # ── Public API ───────────────────────────────────────────────────────────────────────────
 
     @classmethod
@@ -133,6 +145,7 @@ class Theme(QSingleton):
         custom_color_map = CustomColorLoader.load_from_file(file_path, mode)
         if custom_color_map:
             instance = cls._get_instance()
+            previous_color_map = instance._current_color_map
             instance._current_color_map = custom_color_map
             instance._theme_mode = mode
             instance._theme_name = mode.value if mode else "light"
@@ -140,6 +153,7 @@ class Theme(QSingleton):
 
             instance._inject_theme_colors()
             instance._load_global_stylesheet()
+            palette_changed = previous_color_map != custom_color_map
 
             # auto-connect icon system (only once)
             if not hasattr(cls, '_icon_loader_connected'):
@@ -148,7 +162,10 @@ class Theme(QSingleton):
                 cls._icon_loader_connected = True
                 DebugLogger.log("IconLoader auto-connected to Theme system", "info")
 
-            instance.theme_refresh.emit(instance._current_color_map)
+            # icons only depend on the color map; skip the refresh when it is unchanged
+            if palette_changed:
+                instance.theme_refresh.emit(instance._current_color_map)
+                instance._prebuild_icon_atlas(file_path, mode)
 
             DebugLogger.log(f"Applied custom color map from {file_path} in {mode.value} mode", "info")
         else:
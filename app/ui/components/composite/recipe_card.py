@@ -25,13 +25,14 @@ from PySide6.QtCore import QSize, Qt, Signal
 from PySide6.QtWidgets import QDialog, QFrame, QHBoxLayout, QLabel, QMenu, QStackedWidget, QVBoxLayout, QWidget
 
 from _dev_tools import DebugLogger
+from app.core.dtos import RecipeSnapshotDTO
 from app.core.models import Recipe
 from app.core.services import RecipeService
 from app.style.icon import AppIcon, Icon, Type, Name
 from app.ui.components.layout import Separator
 from app.ui.components.layout.card import BaseCard
 from app.ui.components.widgets import ToolButton, RecipeImage
-from app.ui.utils import make_overlay
+from app.ui.utils import global_signals, make_overlay
 
 # ── Constants ──
 CARD_LAYOUT_SPACING = 15
@@ -256,18 +257,30 @@ class BaseRecipeCard(BaseCard):
         try:
             from app.ui.components.widgets.button import BaseButton
 
-            service = RecipeService()
-            updated_recipe = service.toggle_favorite(recipe_id)
+            with RecipeService() as service:
+                updated_recipe = service.toggle_favorite(recipe_id)
 
             # Update the card's recipe object with the new state
-            if self._recipe:
-                self._recipe.is_favorite = updated_recipe.is_favorite
+            self._set_favorite_state(updated_recipe.is_favorite)
+            global_signals.recipe_updated.emit(recipe_id)
 
             BaseButton.swapIcon(button, updated_recipe.is_favorite, Icon.FAV_FILLED, Icon.FAV)
 
         except Exception:
             pass
 
+    def _set_favorite_state(self, is_favorite: bool) -> None:
+        """Record a new favorite state on the displayed recipe.
+
+        Cached snapshots are immutable, so they are replaced with an updated copy.
+        """
+        if not self._recipe:
+            return
+        if isinstance(self._recipe, RecipeSnapshotDTO):
+            self._recipe = self._recipe.model_copy(update={"is_favorite": is_favorite})
+        else:
+            self._recipe.is_favorite = is_favorite
+
     def _create_meta_section(self, icon_widget: AppIcon, heading: str, value: str) -> QVBoxLayout:
         """Create a vertical layout section for displaying metadata with an icon, heading, and value.
 
@@ -371,9 +384,10 @@ class BaseRecipeCard(BaseCard):
         if not self._recipe or not getattr(self._recipe, "id", None):
             return
         try:
-            service = RecipeService()
-            updated = service.toggle_favorite(self._recipe.id)
-            self._recipe.is_favorite = updated.is_favorite
+            with RecipeService() as service:
+                updated = service.toggle_favorite(self._recipe.id)
+            self._set_favorite_state(updated.is_favorite)
+            global_signals.recipe_updated.emit(updated.id)
             self.add_to_favorites.emit(updated)
         except Exception as exc:
             DebugLogger.log(f"Failed to toggle favorite via context menu: {exc}", "error")
@@ -8,7 +8,7 @@ Consolidates RoundedImage and CircularImage functionality.
 from pathlib import Path
 from typing import Optional, Union
 
-from PySide6.QtCore import Property, QRectF, QSize, Qt
+from PySide6.QtCore import Property, QEvent, QRectF, QSize, Qt
 from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QLabel, QSizePolicy, QStyle, QStyleOption
 
@@ -19,6 +19,7 @@ from app.core.utils.image_utils import (
     img_cache_get_key,
     img_cache_set,
     img_get_placeholder,
+    img_qt_is_dpr_change,
     img_qt_load_safe,
     img_validate_path)
 
@@ -91,14 +92,16 @@ class BaseImage(QLabel):
     def _get_cache_key(self) -> str:
         """Generate cache key for this widget configuration."""
         source = self._image_path or "direct_pixmap"
-        return img_cache_get_key(source, size=self._size, radii=self._get_shape_params())
+        return img_cache_get_key(
+            source, size=self._size, radii=self._get_shape_params(), dpr=self.devicePixelRatioF()
+        )
 
     def _get_shape_params(self) -> tuple:
         """Get shape-specific parameters for caching. Override in subclasses."""
         return ()
 
-    def _apply_shape_mask(self, pixmap: QPixmap) -> QPixmap:
-        """Apply shape-specific mask to pixmap. Override in subclasses."""
+    def _apply_shape_mask(self, pixmap: QPixmap, dpr: float = 1.0) -> QPixmap:
+        """Apply shape-specific mask to a pixmap sized for `dpr`. Override in subclasses."""
         return pixmap
 
     def _draw_border(self, painter: QPainter) -> None:
@@ -107,7 +110,11 @@ class BaseImage(QLabel):
 
     # ── Core Implementation ──
     def _refresh_display(self) -> None:
-        """Refresh the displayed image with caching."""
+        """Refresh the displayed image with caching.
+
+        Pixmaps are rendered at the widget's device pixel ratio, so each screen
+        scale gets its own cache entry shared by every widget showing the image.
+        """
         cache_key = self._get_cache_key()
         cached = img_cache_get(cache_key)
 
@@ -115,48 +122,49 @@ class BaseImage(QLabel):
             self.setPixmap(cached)
             return
 
+        dpr = self.devicePixelRatioF()
+        physical = round(self._size * dpr)
+
         # Load source pixmap
         if self._image_path:
             if not img_validate_path(self._image_path):
                 # Show shaped placeholder for invalid paths
-                placeholder = img_get_placeholder(self._size)
-                shaped_placeholder = self._apply_shape_mask(placeholder)
-                img_cache_set(cache_key, shaped_placeholder)
-                self.setPixmap(shaped_placeholder)
+                self._show_shaped(cache_key, img_get_placeholder(physical), dpr)
                 return
             source_pixmap = img_qt_load_safe(self._image_path)
         elif self._original_pixmap:
             source_pixmap = self._original_pixmap
         else:
             # No source available - show shaped placeholder
-            placeholder = img_get_placeholder(self._size)
-            shaped_placeholder = self._apply_shape_mask(placeholder)
-            img_cache_set(cache_key, shaped_placeholder)
-            self.setPixmap(shaped_placeholder)
+            self._show_shaped(cache_key, img_get_placeholder(physical), dpr)
             return
 
         if source_pixmap.isNull():
             # Failed to load - show shaped placeholder
-            placeholder = img_get_placeholder(self._size)
-            shaped_placeholder = self._apply_shape_mask(placeholder)
-            img_cache_set(cache_key, shaped_placeholder)
-            self.setPixmap(shaped_placeholder)
+            self._show_shaped(cache_key, img_get_placeholder(physical), dpr)
             return
 
         # Scale to fit
         scaled = source_pixmap.scaled(
-            self._size, self._size,
+            physical, physical,
             Qt.KeepAspectRatioByExpanding,
             Qt.SmoothTransformation
         )
+        self._show_shaped(cache_key, scaled, dpr)
 
-        # Apply shape mask
-        shaped = self._apply_shape_mask(scaled)
-
-        # Cache and display
+    def _show_shaped(self, cache_key: str, pixmap: QPixmap, dpr: float) -> None:
+        """Apply the shape mask to a physical-size pixmap, then cache and display it."""
+        shaped = self._apply_shape_mask(pixmap, dpr)
+        shaped.setDevicePixelRatio(dpr)
         img_cache_set(cache_key, shaped)
         self.setPixmap(shaped)
 
+    def event(self, event: QEvent) -> bool:
+        """Reload from the cache entry for the new device pixel ratio after a screen or scale change."""
+        if img_qt_is_dpr_change(event) and (getattr(self, "_image_path", None) or getattr(self, "_original_pixmap", None)):
+            self._refresh_display()
+        return super().event(event)
+
     def paintEvent(self, event):
         """Custom paint event for border support."""
         # Let QLabel draw the pixmap first
@@ -211,8 +219,8 @@ class RoundedImage(BaseImage):
     def _get_shape_params(self) -> tuple:
         return self._radii
 
-    def _apply_shape_mask(self, pixmap: QPixmap) -> QPixmap:
-        return img_apply_rounded_mask(pixmap, self._radii)
+    def _apply_shape_mask(self, pixmap: QPixmap, dpr: float = 1.0) -> QPixmap:
+        return img_apply_rounded_mask(pixmap, tuple(round(r * dpr) for r in self._radii))
 
     def _draw_border(self, painter: QPainter) -> None:
         """Draw rounded rectangle border."""
@@ -254,8 +262,8 @@ class CircularImage(BaseImage):
     def _get_shape_params(self) -> tuple:
         return ("circular",)  # Unique identifier for circular shape
 
-    def _apply_shape_mask(self, pixmap: QPixmap) -> QPixmap:
-        return img_apply_circular_mask(pixmap, self._size)
+    def _apply_shape_mask(self, pixmap: QPixmap, dpr: float = 1.0) -> QPixmap:
+        return img_apply_circular_mask(pixmap, round(self._size * dpr))
 
     def _draw_border(self, painter: QPainter) -> None:
         """Draw circular border."""
@@ -361,14 +369,17 @@ class RectangularImage(QLabel):
     def _get_cache_key(self) -> str:
         """Generate cache key for this widget configuration."""
         source = self._image_path or "direct_pixmap"
-        return img_cache_get_key(source, size=f"{self._width}x{self._height}", radii=self._get_shape_params())
+        return img_cache_get_key(
+            source, size=f"{self._width}x{self._height}", radii=self._get_shape_params(),
+            dpr=self.devicePixelRatioF()
+        )
 
     def _get_shape_params(self) -> tuple:
         """Get shape-specific parameters for caching. Override in subclasses."""
         return ()
 
-    def _apply_shape_mask(self, pixmap: QPixmap) -> QPixmap:
-        """Apply shape-specific mask to pixmap. Override in subclasses."""
+    def _apply_shape_mask(self, pixmap: QPixmap, dpr: float = 1.0) -> QPixmap:
+        """Apply shape-specific mask to a pixmap sized for `dpr`. Override in subclasses."""
         return pixmap
 
     def _draw_border(self, painter: QPainter) -> None:
@@ -377,7 +388,7 @@ class RectangularImage(QLabel):
 
     # ── Core Implementation ──
     def _refresh_display(self) -> None:
-        """Refresh the displayed image with caching."""
+        """Refresh the displayed image with caching, rendered at the widget's device pixel ratio."""
         cache_key = self._get_cache_key()
         cached = img_cache_get(cache_key)
 
@@ -385,48 +396,49 @@ class RectangularImage(QLabel):
             self.setPixmap(cached)
             return
 
+        dpr = self.devicePixelRatioF()
+        physical = QSize(round(self._width * dpr), round(self._height * dpr))
+
         # Load source pixmap
         if self._image_path:
             if not img_validate_path(self._image_path):
                 # Show shaped placeholder for invalid paths
-                placeholder = img_get_placeholder(QSize(self._width, self._height))
-                shaped_placeholder = self._apply_shape_mask(placeholder)
-                img_cache_set(cache_key, shaped_placeholder)
-                self.setPixmap(shaped_placeholder)
+                self._show_shaped(cache_key, img_get_placeholder(physical), dpr)
                 return
             source_pixmap = img_qt_load_safe(self._image_path)
         elif self._original_pixmap:
             source_pixmap = self._original_pixmap
         else:
             # No source available - show shaped placeholder
-            placeholder = img_get_placeholder(QSize(self._width, self._height))
-            shaped_placeholder = self._apply_shape_mask(placeholder)
-            img_cache_set(cache_key, shaped_placeholder)
-            self.setPixmap(shaped_placeholder)
+            self._show_shaped(cache_key, img_get_placeholder(physical), dpr)
             return
 
         if source_pixmap.isNull():
             # Failed to load - show shaped placeholder
-            placeholder = img_get_placeholder(QSize(self._width, self._height))
-            shaped_placeholder = self._apply_shape_mask(placeholder)
-            img_cache_set(cache_key, shaped_placeholder)
-            self.setPixmap(shaped_placeholder)
+            self._show_shaped(cache_key, img_get_placeholder(physical), dpr)
             return
 
         # Scale to fit
         scaled = source_pixmap.scaled(
-            self._width, self._height,
+            physical,
             Qt.KeepAspectRatioByExpanding,
             Qt.SmoothTransformation
         )
+        self._show_shaped(cache_key, scaled, dpr)
 
-        # Apply shape mask
-        shaped = self._apply_shape_mask(scaled)
-
-        # Cache and display
+    def _show_shaped(self, cache_key: str, pixmap: QPixmap, dpr: float) -> None:
+        """Apply the shape mask to a physical-size pixmap, then cache and display it."""
+        shaped = self._apply_shape_mask(pixmap, dpr)
+        shaped.setDevicePixelRatio(dpr)
         img_cache_set(cache_key, shaped)
         self.setPixmap(shaped)
 
+    def event(self, event: QEvent) -> bool:
+        """Reload from the cache entry for the new device pixel ratio after a screen or scale change."""
+        if img_qt_is_dpr_change(event) and (getattr(self, "_image_path", None) or getattr(self, "_original_pixmap", None)):
+            self._refresh_display()
+        return super().event(event)
+
     def paintEvent(self, event):
         """Custom paint event for border support."""
         # Let QLabel draw the pixmap first
@@ -482,8 +494,8 @@ class RoundedRectImage(RectangularImage):
     def _get_shape_params(self) -> tuple:
         return self._radii
 
-    def _apply_shape_mask(self, pixmap: QPixmap) -> QPixmap:
-        return img_apply_rounded_mask(pixmap, self._radii)
+    def _apply_shape_mask(self, pixmap: QPixmap, dpr: float = 1.0) -> QPixmap:
+        return img_apply_rounded_mask(pixmap, tuple(round(r * dpr) for r in self._radii))
 
     def _draw_border(self, painter: QPainter) -> None:
         """Draw rounded rectangle border."""
@@ -1,10 +1,14 @@
 """app/ui/components/inputs/smart_line_edit.py
 
 Defines a SmartInput with a proxy-filtered dropdown completer and custom submission.
+
+A SmartInput either filters a fixed list of items through its proxy model, or, when
+given a `completion_source`, asks that callable for the matches of the typed text on
+every edit and shows only those (used for large, pre-indexed lists).
 """
 
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
-from typing import Sequence
+from typing import Callable, Optional, Sequence
 
 from PySide6.QtCore import QEvent, QStringListModel, Qt, QTimer, Signal
 from PySide6.QtWidgets import QCompleter, QLineEdit
@@ -29,11 +33,15 @@ class SmartInput(QLineEdit):
         parent=None,
         list_items: Sequence[str] = None,
         placeholder: str = None,
+        completion_source: Optional[Callable[[str], list[str]]] = None,
     ):
         super().__init__(parent)
-
+        self._completion_source = completion_source
+        self._source_text = ""
 
         # build source and proxy models
+        if completion_source is not None:
+            list_items = completion_source("")
         self.source = QStringListModel(list_items or [])
         self.proxy = IngredientProxyModel()
         self.proxy.setSourceModel(self.source)
@@ -87,7 +95,16 @@ class SmartInput(QLineEdit):
 
     def _reset_completer(self):
         """Clear any active filter on the proxy model."""
-        self.dropdown_menu.clear_filter()
+        self._apply_filter("")
+
+    def _apply_filter(self, text: str):
+        """Show the items matching text: from the completion source if set, else via the proxy."""
+        if self._completion_source is None:
+            self.dropdown_menu.set_filter(text)
+        elif text != self._source_text:
+            # textEdited and textChanged both fire per keystroke; reset the model once
+            self._source_text = text
+            self.source.setStringList(self._completion_source(text))
 
     def _handle_submission(self):
         """Emit either item_selected or custom_text_submitted on Enter press only."""
@@ -119,7 +136,7 @@ class SmartInput(QLineEdit):
 
     def _on_text_changed(self, text: str):
         """Handle user typing - show and filter dropdown."""
-        self.dropdown_menu.set_filter(text)
+        self._apply_filter(text)
         self.currentTextChanged.emit(text)
 
         # Show dropdown if there are matches
@@ -133,7 +150,7 @@ class SmartInput(QLineEdit):
         """Update filter without showing popup (for programmatic changes)."""
         if not self.hasFocus():
             return
-        self.dropdown_menu.set_filter(text)
+        self._apply_filter(text)
 
     def _on_completer_activated(self, text: str):
         """Handle explicit selection from dropdown."""
@@ -207,7 +224,7 @@ class SmartInput(QLineEdit):
         # Auto-show dropdown when focused via Tab
         if event.reason() in (Qt.TabFocusReason, Qt.BacktabFocusReason):
             # Show all items when first focused
-            self.dropdown_menu.clear_filter()
+            self._apply_filter("")
             if not self.dropdown_menu.completer.popup().isVisible():
                 from PySide6.QtCore import QTimer
                 QTimer.singleShot(50, lambda: self.dropdown_menu.completer.complete())
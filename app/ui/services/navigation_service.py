@@ -4,12 +4,34 @@ Connects signals to their respective slots for handling sidebar and page navigat
 """
 
 # ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
-from PySide6.QtWidgets import QStackedWidget
+import time
+from collections import deque
+from typing import Callable, Dict
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QStackedWidget, QWidget
 
 from _dev_tools import DebugLogger
 from app.core.services import PlannerService, ShoppingService
-from app.ui.views import AddRecipes, Dashboard, MealPlanner, RecipeBrowser, Settings, ShoppingList, ViewRecipe
+from app.ui import views  # view classes resolve lazily on attribute access
+
+# ── Constants ──
+PREFETCH_DELAY_MS = 400           # wait for the event loop to settle before building the next page
+RECLAIM_INTERVAL_MS = 60_000      # how often idle pages are checked for reclamation
+PAGE_IDLE_TTL_S = 300             # pages not visited for this long are destroyed
 
+# likely next pages for each page, in order of preference
+PREFETCH_MAP: Dict[str, tuple[str, ...]] = {
+    "dashboard":      ("meal_planner", "browse_recipes"),
+    "meal_planner":   ("browse_recipes", "shopping_list"),
+    "browse_recipes": ("add_recipe",),
+    "shopping_list":  ("meal_planner",),
+    "add_recipe":     ("browse_recipes",),
+    "settings":       (),
+}
+
+# pages that only mirror database state and can be rebuilt at no cost to the user
+RECLAIMABLE_PAGES = {"dashboard", "browse_recipes", "shopping_list", "settings"}
 
 
 # ── Navigation Service ──────────────────────────────────────────────────────────────────────────────────────
@@ -18,6 +40,21 @@ class NavigationService:
         self.sw_pages = stacked_widget
         self.page_instances = {}
 
+        # lazy page construction
+        self._page_factories: Dict[str, Callable[[], QWidget]] = {}
+        self._last_visited: Dict[str, float] = {}
+
+        # idle-time prefetch queue (one page built per tick)
+        self._prefetch_queue: deque[str] = deque()
+        self._prefetch_timer = QTimer()
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.timeout.connect(self._prefetch_next)
+
+        # periodic reclamation of pages that have not been visited recently
+        self._reclaim_timer = QTimer()
+        self._reclaim_timer.setInterval(RECLAIM_INTERVAL_MS)
+        self._reclaim_timer.timeout.connect(self.reclaim_idle_pages)
+
     @classmethod
     def create(cls, stacked_widget: QStackedWidget) -> 'NavigationService':
         """
@@ -27,46 +64,140 @@ class NavigationService:
         return cls(stacked_widget)
 
     def build_and_register_pages(self):
-        """Instantiate and register all page instances."""
-        page_map = {
-            "dashboard": Dashboard,
-            "meal_planner": MealPlanner,
-            "browse_recipes": RecipeBrowser,
-            "shopping_list": ShoppingList,
-            "add_recipe": AddRecipes,
-            "settings": Settings,
+        """Register a lazy factory for every page.
+
+        Pages are constructed on first `switch_to` (or by the idle prefetch queue),
+        so startup only pays for the page that is actually shown.
+        """
+        self._page_factories = {
+            "dashboard":      lambda: views.Dashboard(navigation_service=self),
+            "meal_planner":   lambda: views.MealPlanner(navigation_service=self),
+            "browse_recipes": lambda: views.RecipeBrowser(navigation_service=self),
+            "shopping_list":  lambda: views.ShoppingList(),
+            "add_recipe":     lambda: views.AddRecipes(),
+            "settings":       lambda: views.Settings(),
         }
-        for name, page_class in page_map.items():
-            # Pass navigation service to views that need it
-            if name == "dashboard":
-                instance = page_class(navigation_service=self)
-            elif name == "meal_planner":
-                instance = page_class(navigation_service=self)
-            elif name == "browse_recipes":
-                instance = page_class(navigation_service=self)
-            else:
-                instance = page_class()
-            self.page_instances[name] = instance
-            self.sw_pages.addWidget(instance)
+        self._reclaim_timer.start()
+
+    # ── Lazy Pages ──────────────────────────────────────────────────────────────────────────────────────────
+    def get_page(self, page_name: str) -> QWidget | None:
+        """Return the page instance for `page_name`, building it on first access.
+
+        Args:
+            page_name (str): Registered page name (e.g. "browse_recipes").
+
+        Returns:
+            QWidget | None: The page widget, or None if no such page is registered.
+        """
+        if page_name in self.page_instances:
+            return self.page_instances[page_name]
+
+        factory = self._page_factories.get(page_name)
+        if factory is None:
+            return None
+
+        start = time.perf_counter()
+        instance = factory()
+        self.page_instances[page_name] = instance
+        self.sw_pages.addWidget(instance)
+        DebugLogger.log(
+            f"[NavigationService] Built page '{page_name}' in {(time.perf_counter() - start) * 1000:.1f}ms",
+            "info"
+        )
+        return instance
+
+    def is_page_built(self, page_name: str) -> bool:
+        """Return True if the page has already been constructed."""
+        return page_name in self.page_instances
 
+    def _schedule_prefetch(self, page_name: str):
+        """Queue the likely next pages after `page_name` for idle-time construction."""
+        self._prefetch_queue.clear()
+        for candidate in PREFETCH_MAP.get(page_name, ()):
+            if candidate not in self.page_instances:
+                self._prefetch_queue.append(candidate)
+
+        if self._prefetch_queue:
+            self._prefetch_timer.start(PREFETCH_DELAY_MS)
+
+    def _prefetch_next(self):
+        """Build one queued page, then yield back to the event loop."""
+        while self._prefetch_queue:
+            page_name = self._prefetch_queue.popleft()
+            if page_name in self.page_instances:
+                continue
+            try:
+                self.get_page(page_name)
+                # count the prefetch as a visit so it is not reclaimed straight away
+                self._last_visited[page_name] = time.monotonic()
+            except Exception as e:
+                DebugLogger.log(f"[NavigationService] Prefetch of '{page_name}' failed: {e}", "warning")
+            break
+
+        if self._prefetch_queue:
+            self._prefetch_timer.start(PREFETCH_DELAY_MS)
+
+    def _is_reclaimable(self, page_name: str, widget: QWidget) -> bool:
+        """Return True if the page holds no state that would be lost by destroying it."""
+        if page_name not in RECLAIMABLE_PAGES:
+            return False
+        if widget is self.sw_pages.currentWidget():
+            return False
+        # recipe browser is mid-selection for the meal planner
+        if getattr(widget, "selection_mode", False):
+            return False
+        if getattr(widget, "has_unsaved_changes", False):
+            return False
+        return True
+
+    def reclaim_idle_pages(self, max_idle_s: float = PAGE_IDLE_TTL_S) -> list[str]:
+        """Destroy pages that have not been visited for `max_idle_s` seconds.
+
+        Reclaimed pages keep their factory and are rebuilt on the next visit.
+
+        Returns:
+            list[str]: Names of the pages that were reclaimed.
+        """
+        now = time.monotonic()
+        reclaimed = []
+        for page_name, widget in list(self.page_instances.items()):
+            if page_name not in self._page_factories:
+                continue
+            if now - self._last_visited.get(page_name, now) < max_idle_s:
+                continue
+            if not self._is_reclaimable(page_name, widget):
+                continue
+
+            self.sw_pages.removeWidget(widget)
+            widget.deleteLater()
+            del self.page_instances[page_name]
+            self._last_visited.pop(page_name, None)
+            reclaimed.append(page_name)
+
+        if reclaimed:
+            DebugLogger.log(f"[NavigationService] Reclaimed idle pages: {reclaimed}", "info")
+        return reclaimed
+
+    # ── Navigation ──────────────────────────────────────────────────────────────────────────────────────────
     def switch_to(self, page_name: str):
-        """Switch stacked widget to the given page."""
+        """Switch stacked widget to the given page, building it on first visit."""
         DebugLogger.log(f"NavigationService.switch_to called with: {page_name}", "info")
         # this is the core logic from app.py's _switch_page
-        if page_name not in self.page_instances:
-            DebugLogger.log(f"Page {page_name} not found in page_instances: {list(self.page_instances.keys())}", "error")
+        next_widget = self.get_page(page_name)
+        if next_widget is None:
+            DebugLogger.log(f"Page {page_name} not registered: {list(self._page_factories.keys())}", "error")
             return
 
-        next_widget = self.page_instances[page_name]
         current_widget = self.sw_pages.currentWidget()
+        self._last_visited[page_name] = time.monotonic()
 
         # Ensure any changes in the MealPlanner are saved before loading shopping list
         planner_widget = self.page_instances.get("meal_planner")
-        if isinstance(planner_widget, MealPlanner):
+        if planner_widget is not None and isinstance(planner_widget, views.MealPlanner):
             planner_widget.saveMealPlan()
 
         # refresh ShoppingList if navigating to it
-        if page_name == "shopping_list" and isinstance(next_widget, ShoppingList):
+        if page_name == "shopping_list" and isinstance(next_widget, views.ShoppingList):
             # Use context manager to ensure proper session cleanup
             from app.core.database.db import DatabaseSession
             try:
@@ -82,6 +213,8 @@ class NavigationService:
         if current_widget != next_widget:
             self.sw_pages.setCurrentWidget(next_widget)
 
+        self._schedule_prefetch(page_name)
+
         # ⚠️ Temporarily disabled until multi-effects solution is stable
         """ if current_widget != next_widget:
             Animator.transition_stack(current_widget, next_widget, self.sw_pages)
@@ -99,7 +232,7 @@ class NavigationService:
             old_widget.deleteLater()
 
         # Create new ViewRecipe widget with the specific recipe
-        full_recipe_widget = ViewRecipe(recipe, navigation_service=self)
+        full_recipe_widget = views.ViewRecipe(recipe, navigation_service=self)
 
         # Connect the back button to return to recipes
         full_recipe_widget.back_clicked.connect(lambda: self.switch_to("browse_recipes"))
@@ -120,7 +253,8 @@ class NavigationService:
         DebugLogger.log(f"[NavigationService] start_edit_recipe called for ID={recipe_id}", "debug")
         try:
             from app.core.services import RecipeService
-            recipe = RecipeService().get_recipe(recipe_id)
+            with RecipeService() as service:
+                recipe = service.get_recipe_snapshot(recipe_id)
         except Exception as exc:
             DebugLogger.log(f"Unable to load recipe {recipe_id} for editing: {exc}", "error")
             return
@@ -130,15 +264,14 @@ class NavigationService:
             return
         DebugLogger.log(f"[NavigationService] Loaded recipe {recipe_id} for edit ({recipe.recipe_name})", "debug")
 
-        add_view = self.page_instances.get("add_recipe")
-        if not isinstance(add_view, AddRecipes):
-            add_view = AddRecipes()
-            self.page_instances["add_recipe"] = add_view
-            self.sw_pages.addWidget(add_view)
+        add_view = self.get_page("add_recipe")
+        if add_view is None or not isinstance(add_view, views.AddRecipes):
+            DebugLogger.log("AddRecipes page is not registered; cannot edit.", "error")
+            return
+        self._last_visited["add_recipe"] = time.monotonic()
 
         # Navigate first so UI changes immediately, then populate on the next event loop tick
         self.sw_pages.setCurrentWidget(add_view)
         if hasattr(add_view, "enter_edit_mode"):
-            from PySide6.QtCore import QTimer
             DebugLogger.log("[NavigationService] Scheduling enter_edit_mode on AddRecipes view", "debug")
             QTimer.singleShot(0, lambda: add_view.enter_edit_mode(recipe, navigation_service=self))
@@ -0,0 +1,197 @@
+"""app/ui/services/shopping_write_queue.py
+
+Write-behind queue for shopping list checkbox toggles.
+
+A toggle updates the widget and the queue's pending map immediately; repeated toggles
+of the same item coalesce into one entry. Every FLUSH_INTERVAL_MS the pending map is
+handed to a writer thread that persists it with one UPDATE of shopping_items and one
+shopping_states upsert, and the remainder is flushed synchronously before the list is regenerated and at shutdown.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
+
+from _dev_tools import DebugLogger
+from app.core.dtos.shopping_dtos import ItemStatusWriteDTO
+from app.core.utils import QSingleton
+
+# ── Constants ──
+FLUSH_INTERVAL_MS = 250  # delay between the first queued toggle and its batch write
+
+
+# ── Shopping Write Worker ───────────────────────────────────────────────────────────────────────────────────
+class ShoppingWriteWorker(QObject):
+    """Drains the queue's pending map on the writer thread."""
+
+    batch_written = Signal(int, float)   # items written, elapsed ms
+    batch_failed = Signal(str)
+
+    def __init__(self, queue: "ShoppingWriteQueue"):
+        super().__init__()
+        self._queue = queue
+
+    @Slot()
+    def flush(self):
+        """Write everything pending. Also called directly (GUI thread) for synchronous flushes."""
+        # the write lock orders batches: each swap happens after the previous batch is written
+        with self._queue._write_lock:
+            batch = self._queue._take_pending()
+            if not batch:
+                return
+
+            from sqlalchemy.exc import SQLAlchemyError
+
+            from app.core.services import ShoppingService
+
+            start = time.perf_counter()
+            try:
+                with ShoppingService() as service:
+                    written = service.write_item_statuses(list(batch.values()))
+            except SQLAlchemyError as e:
+                self._queue._requeue(batch)
+                self.batch_failed.emit(str(e))
+                return
+            self.batch_written.emit(written, (time.perf_counter() - start) * 1000)
+
+
+# ── Shopping Write Queue ────────────────────────────────────────────────────────────────────────────────────
+class ShoppingWriteQueue(QSingleton):
+    """Coalesces shopping item 'have' writes and persists them off the GUI thread.
+
+    Widgets call `enqueue()` / `set_have()` when toggled and read `have()` for the latest value;
+    anything that reads shopping items from the database must call `flush()` first.
+    """
+
+    flush_requested = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if hasattr(self, "_thread"):
+            return
+        self._lock = threading.Lock()         # guards _pending
+        self._write_lock = threading.Lock()   # held while a batch is being written
+        self._pending: Dict[int, ItemStatusWriteDTO] = {}
+        self._toggles = 0
+        self._batches = 0
+        self._written = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FLUSH_INTERVAL_MS)
+        self._timer.timeout.connect(self.flush_requested)
+
+        self._thread: Optional[QThread] = QThread()
+        self._worker = ShoppingWriteWorker(self)
+        self._worker.moveToThread(self._thread)
+        self.flush_requested.connect(self._worker.flush)
+        self._worker.batch_written.connect(self._on_batch_written)
+        self._worker.batch_failed.connect(self._on_batch_failed)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.start()
+
+    @classmethod
+    def _get_instance(cls) -> "ShoppingWriteQueue":
+        """Return the singleton instance."""
+        return cls()
+
+    # ── Queueing ──
+    def set_have(
+        self,
+        item_id: int,
+        have: bool,
+        state_key: Optional[str] = None,
+        quantity: float = 0.0,
+        unit: Optional[str] = None
+    ) -> None:
+        """
+        Record an item's new 'have' status; the write happens on the next flush.
+
+        Args:
+            item_id (int): ID of the shopping item.
+            have (bool): New status.
+            state_key (str, optional): State key for recipe items, so the status survives regeneration.
+            quantity (float): Item quantity stored with the state.
+            unit (str, optional): Item unit stored with the state.
+        """
+        self.enqueue([ItemStatusWriteDTO(
+            item_id=item_id, have=have, state_key=state_key, quantity=quantity, unit=unit or ""
+        )])
+
+    def enqueue(self, writes: Iterable[ItemStatusWriteDTO], immediate: bool = False) -> None:
+        """
+        Queue several status writes at once (e.g. "check all" in a category).
+
+        Args:
+            writes (Iterable[ItemStatusWriteDTO]): Writes to queue; later writes for an item win.
+            immediate (bool): Hand the batch to the writer thread now instead of after
+                FLUSH_INTERVAL_MS; the write still happens off the GUI thread.
+        """
+        with self._lock:
+            for write in writes:
+                self._pending[write.item_id] = write  # last toggle wins
+                self._toggles += 1
+        if immediate:
+            self._timer.stop()
+            self.flush_requested.emit()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def have(self, item_id: int, default: bool) -> bool:
+        """Return the pending status of an item, or `default` if nothing is queued."""
+        with self._lock:
+            write = self._pending.get(item_id)
+        return default if write is None else write.have
+
+    def pending_count(self) -> int:
+        """Return the number of items waiting to be written."""
+        with self._lock:
+            return len(self._pending)
+
+    # ── Flushing ──
+    def flush(self) -> None:
+        """Write pending changes now, on the calling thread, after any in-flight batch."""
+        self._timer.stop()
+        self._worker.flush()
+
+    def shutdown(self, timeout_ms: int = 5000) -> None:
+        """Flush synchronously and stop the writer thread (connected to aboutToQuit)."""
+        self.flush()
+        if self._thread is not None and self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait(timeout_ms)
+        DebugLogger.log(f"[ShoppingWriteQueue] {self.get_stats()}", "debug")
+
+    def get_stats(self) -> dict:
+        """Return toggle, batch and written-row counts (toggles - written = coalesced)."""
+        with self._lock:
+            return {
+                "toggles": self._toggles,
+                "batches": self._batches,
+                "written": self._written,
+                "pending": len(self._pending),
+            }
+
+    # ── Internal ──
+    def _take_pending(self) -> Dict[int, ItemStatusWriteDTO]:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            return batch
+
+    def _requeue(self, batch: Dict[int, ItemStatusWriteDTO]) -> None:
+        """Put a failed batch back without overwriting toggles queued since."""
+        with self._lock:
+            for item_id, write in batch.items():
+                self._pending.setdefault(item_id, write)
+
+    def _on_batch_written(self, written: int, elapsed_ms: float):
+        with self._lock:
+            self._batches += 1
+            self._written += written
+        DebugLogger.log(f"[ShoppingWriteQueue] Wrote {written} item(s) in {elapsed_ms:.1f}ms", "debug")
+
+    def _on_batch_failed(self, error: str):
+        DebugLogger.log(f"[ShoppingWriteQueue] Batch write failed, will retry on next flush: {error}", "warning")
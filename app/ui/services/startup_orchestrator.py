@@ -0,0 +1,211 @@
+"""app/ui/services/startup_orchestrator.py
+
+Runs startup warm-up work on a worker thread so the shell window can paint first.
+
+The orchestrator warms the database connection, prunes orphaned meal selections,
+runs the first dashboard query and prewarms the image source cache off the GUI thread, then delivers results to views
+through signals while reporting progress.
+"""
+
+# ── Imports ─────────────────────────────────────────────────────────────────────────────────────────────────
+import time
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QThread, Signal, Slot
+
+from _dev_tools import DebugLogger
+from app.core.utils import QSingleton
+
+# ── Constants ──
+PREWARM_IMAGE_LIMIT = 12  # recipe images decoded ahead of the first dashboard paint
+
+StartupStep = tuple[str, str, Callable[[dict], Any]]  # (name, progress label, callable)
+
+
+# ── Step Functions ──────────────────────────────────────────────────────────────────────────────────────────
+def _warm_database(results: dict) -> None:
+    """Open the first pooled connection and configure ORM mappers."""
+    from sqlalchemy import text
+    from sqlalchemy.orm import configure_mappers
+
+    import app.core.models  # noqa: F401 - registers every mapped class
+    from app.core.database.db import engine
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    configure_mappers()
+
+def _prune_meal_plan(results: dict) -> int:
+    """Delete meal selections left behind by deleted recipes."""
+    from app.core.services import PlannerService
+
+    with PlannerService() as service:
+        return service.prune_orphans()
+
+def _fetch_dashboard(results: dict) -> dict:
+    """Run the dashboard's initial queries."""
+    from app.ui.views.dashboard.dashboard import fetch_dashboard_snapshot
+    return fetch_dashboard_snapshot()
+
+def _prewarm_images(results: dict) -> list:
+    """Decode the images the dashboard shows first into QImages (thread-safe)."""
+    from app.core.utils import img_cache_decode_source
+
+    snapshot = results.get("dashboard") or {}
+    recipes = list(snapshot.get("recent_recipes", []))
+    recipes += list(snapshot.get("meal_plan_recipes", {}).values())
+
+    paths = []
+    for recipe in recipes:
+        path = getattr(recipe, "reference_image_path", None)
+        if path and path not in paths:
+            paths.append(path)
+
+    decoded = []
+    for path in paths[:PREWARM_IMAGE_LIMIT]:
+        image = img_cache_decode_source(path)
+        if image is not None:
+            decoded.append((path, image))
+    return decoded
+
+DEFAULT_STEPS: list[StartupStep] = [
+    ("database",  "Connecting to database",  _warm_database),
+    ("meal_plan", "Tidying meal plan",       _prune_meal_plan),
+    ("dashboard", "Loading dashboard",       _fetch_dashboard),
+    ("images",    "Preparing recipe images", _prewarm_images),
+]
+
+
+# ── Startup Worker ──────────────────────────────────────────────────────────────────────────────────────────
+class StartupWorker(QObject):
+    """Runs startup steps sequentially on a worker thread."""
+
+    progress = Signal(int, str)           # percent complete, step label
+    step_finished = Signal(str, object)   # step name, step result
+    finished = Signal()
+
+    def __init__(self, steps: list[StartupStep]):
+        super().__init__()
+        self._steps = steps
+
+    @Slot()
+    def run(self):
+        """Execute each step, emitting its result; a failing step yields None."""
+        results: dict = {}
+        total = len(self._steps)
+        for index, (name, label, step) in enumerate(self._steps):
+            self.progress.emit(int(index * 100 / total), label)
+            start = time.perf_counter()
+            try:
+                results[name] = step(results)
+            except Exception as e:
+                DebugLogger.log(f"[StartupOrchestrator] Step '{name}' failed: {e}", "warning")
+                results[name] = None
+            DebugLogger.log(
+                f"[StartupOrchestrator] Step '{name}' finished in {(time.perf_counter() - start) * 1000:.1f}ms",
+                "debug"
+            )
+            self.step_finished.emit(name, results[name])
+
+        self.progress.emit(100, "Ready")
+        self.finished.emit()
+
+
+# ── Startup Orchestrator ────────────────────────────────────────────────────────────────────────────────────
+class StartupOrchestrator(QSingleton):
+    """Coordinates background warm-up and hands results to views on the GUI thread.
+
+    Views built while startup is running should check `is_running()` and connect to
+    the matching ready signal instead of querying the database synchronously.
+    """
+
+    progress = Signal(int, str)           # percent complete, step label
+    database_ready = Signal()
+    meal_plan_pruned = Signal(int)        # number of orphaned meal selections removed
+    dashboard_data_ready = Signal(dict)   # snapshot from fetch_dashboard_snapshot()
+    images_prewarmed = Signal(int)        # number of decoded images cached
+    finished = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if hasattr(self, "_thread"):
+            return
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[StartupWorker] = None
+        self._running = False
+        self._started_at = 0.0
+        self.dashboard_snapshot: Optional[dict] = None
+
+    @classmethod
+    def _get_instance(cls) -> "StartupOrchestrator":
+        """Return the singleton instance."""
+        return cls()
+
+    def is_running(self) -> bool:
+        """Return True while background warm-up has not finished."""
+        return self._running
+
+    def take_dashboard_snapshot(self) -> Optional[dict]:
+        """Return the warm-up dashboard snapshot once, then forget it.
+
+        Later dashboard builds query fresh data instead of reusing startup results.
+        """
+        snapshot, self.dashboard_snapshot = self.dashboard_snapshot, None
+        return snapshot
+
+    def start(self, steps: Optional[list[StartupStep]] = None):
+        """Start the warm-up steps on a worker thread.
+
+        Args:
+            steps (list[StartupStep] | None): Steps to run; defaults to DEFAULT_STEPS.
+        """
+        if self._running:
+            return
+
+        self._running = True
+        self._started_at = time.perf_counter()
+
+        self._thread = QThread()
+        self._worker = StartupWorker(steps or DEFAULT_STEPS)
+        self._worker.moveToThread(self._thread)
+
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.step_finished.connect(self._on_step_finished)
+        self._worker.finished.connect(self._on_finished)
+        self._worker.finished.connect(self._thread.quit)
+        self._thread.finished.connect(self._worker.deleteLater)
+
+        self._thread.start()
+
+    def wait(self, timeout_ms: int = 5000):
+        """Block until the worker thread exits (used at shutdown)."""
+        if self._thread is not None and self._thread.isRunning():
+            self._thread.wait(timeout_ms)
+
+    # ── Worker Slots (GUI thread) ──
+    def _on_progress(self, percent: int, label: str):
+        DebugLogger.log(f"[StartupOrchestrator] {percent:3d}% {label}", "debug")
+        self.progress.emit(percent, label)
+
+    def _on_step_finished(self, name: str, result: object):
+        if name == "database":
+            self.database_ready.emit()
+        elif name == "meal_plan":
+            self.meal_plan_pruned.emit(result or 0)
+        elif name == "dashboard" and result is not None:
+            self.dashboard_snapshot = result
+            self.dashboard_data_ready.emit(result)
+        elif name == "images":
+            from app.core.utils import img_cache_set_source
+            for path, image in result or []:
+                img_cache_set_source(path, image)
+            self.images_prewarmed.emit(len(result or []))
+
+    def _on_finished(self):
+        self._running = False
+        DebugLogger.log(
+            f"[StartupOrchestrator] Warm-up finished in {(time.perf_counter() - self._started_at) * 1000:.1f}ms",
+            "info"
+        )
+        self.finished.emit()
@@ -17,6 +17,7 @@ class GlobalSignals(QObject):
     scroll_to_bottom_requested = Signal()        # Request scroll to bottom
 
     recipe_deleted = Signal(int) # Emits recipe ID when a recipe is deleted
+    recipe_updated = Signal(int) # Emits recipe ID when a recipe is edited (including favorite/image changes)
 
     def __new__(cls):
         if cls._instance is None:
@@ -27,6 +28,14 @@ class GlobalSignals(QObject):
         if not hasattr(self, '_initialized'):
             super().__init__()
             self._initialized = True
+            # keep the shared recipe cache in step with changes announced elsewhere
+            self.recipe_deleted.connect(_invalidate_cached_recipe)
+            self.recipe_updated.connect(_invalidate_cached_recipe)
+
+def _invalidate_cached_recipe(recipe_id: int):
+    """Drop a recipe from the shared recipe cache (imported lazily; it pulls in the ORM)."""
+    from app.core.services.recipe_cache import recipe_cache
+    recipe_cache.invalidate(recipe_id)
 
 # Create a single instance for import
 global_signals = GlobalSignals()
@@ -1,13 +1,32 @@
 # app/ui/views/__init__.py
+#
+# Views are resolved on first attribute access (PEP 562); NavigationService builds pages
+# lazily, so a view's module (and its services, widgets and assets) only loads when needed.
+
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from .base import BaseView
-from .add_recipes.add_recipes import AddRecipes
-from .dashboard.dashboard import Dashboard
-from .meal_planner.meal_planner import MealPlanner
-from .recipe_browser.recipe_browser import RecipeBrowser
-from .settings.settings import Settings
-from .shopping_list.shopping_list import ShoppingList
-from .view_recipe.view_recipe import ViewRecipe
+
+if TYPE_CHECKING:
+    from .add_recipes.add_recipes import AddRecipes
+    from .dashboard.dashboard import Dashboard
+    from .meal_planner.meal_planner import MealPlanner
+    from .recipe_browser.recipe_browser import RecipeBrowser
+    from .settings.settings import Settings
+    from .shopping_list.shopping_list import ShoppingList
+    from .view_recipe.view_recipe import ViewRecipe
+
+# attribute name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "AddRecipes":    ".add_recipes.add_recipes",
+    "Dashboard":     ".dashboard.dashboard",
+    "MealPlanner":   ".meal_planner.meal_planner",
+    "RecipeBrowser": ".recipe_browser.recipe_browser",
+    "Settings":      ".settings.settings",
+    "ShoppingList":  ".shopping_list.shopping_list",
+    "ViewRecipe":    ".view_recipe.view_recipe",
+}
 
 __all__ = [
     "Dashboard",
@@ -19,3 +38,16 @@ __all__ = [
     "BaseView",
     "ViewRecipe",
 ]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value  # cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
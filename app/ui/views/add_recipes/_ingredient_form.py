@@ -12,6 +12,8 @@ from PySide6.QtWidgets import QHBoxLayout, QLineEdit, QWidget
 
 from app.config import INGREDIENT_CATEGORIES, MEASUREMENT_UNITS, FLOAT_VALIDATOR, NAME_PATTERN
 from app.core.services import IngredientService
+from app.core.services.ingredient_index import IngredientIndex, ingredient_index
+from app.core.services.ingredient_matcher import ingredient_matcher
 from app.core.services.session_manager import session_scope
 from app.core.dtos import IngredientSearchDTO
 from app.style import Type, Name
@@ -21,6 +23,9 @@ from app.ui.components.widgets.button import ToolButton
 from app.core.utils import sanitize_form_input, safe_float_conversion
 from app.ui.utils import clear_error_styles, dynamic_validation, global_signals
 
+# ── Constants ──
+FUZZY_MIN_CHARS = 3  # typed length before near-matches ("tomatoes" -> "Tomato") are offered
+
 
 class IngredientForm(QWidget):
     add_ingredient_requested = Signal(QWidget)
@@ -82,11 +87,11 @@ class IngredientForm(QWidget):
 
         self.main_layout.addWidget(self.cb_unit)
 
-        # Ingredient name field - expandable
-        all_ingredient_names = self._fetch_distinct_names()
+        # Ingredient name field - expandable; suggestions come from the shared name index
+        name_index = self._load_name_index()
         self.sle_ingredient_name = SmartInput(
-            list_items=all_ingredient_names,
-            placeholder="Ingredient Name"
+            placeholder="Ingredient Name",
+            completion_source=self._suggest_names if name_index else None,
         )
         self.sle_ingredient_name.setObjectName("NameField")
         self.sle_ingredient_name.setFixedHeight(combobox_height)
@@ -210,14 +215,25 @@ class IngredientForm(QWidget):
         """Returns the ingredient data as a dictionary for external collection."""
         return self._to_payload()
 
-    def _fetch_distinct_names(self) -> list[str]:
-        """Fetch distinct ingredient names using a short-lived session."""
+    def _load_name_index(self) -> IngredientIndex | None:
+        """Return the ingredient name index, loading it (and the fuzzy matcher) with a short-lived session the first time."""
+        if ingredient_index.loaded and ingredient_matcher.loaded:
+            return ingredient_index
         try:
             with session_scope() as session:
                 service = IngredientService(session)
-                return service.list_distinct_names()
+                service.load_matcher()
+                return service.load_name_index()
         except Exception:
-            return []
+            return None
+
+    def _suggest_names(self, text: str) -> list[str]:
+        """Prefix suggestions for typed text, falling back to near-matches of existing ingredients."""
+        names = ingredient_index.search(text)
+        if names or len(text.strip()) < FUZZY_MIN_CHARS:
+            return names
+        category = self.cb_ingredient_category.currentText() if hasattr(self, "cb_ingredient_category") else None
+        return list(dict.fromkeys(entry.name for entry, _ in ingredient_matcher.match(text, category or None)))
 
     # ── Event Handlers ──
 
@@ -23,6 +23,7 @@ from app.ui.utils import (
     clear_form_fields,
     collect_form_data,
     connect_form_signals,
+    global_signals,
     populate_form_from_data,
     setup_tab_order_chain,
     validate_required_fields)
@@ -325,6 +326,7 @@ class AddRecipes(BaseView):
                 f"[AddRecipes] Recipe '{updated_recipe.recipe_name}' updated with ID={updated_recipe.id}",
                 "info"
             )
+            global_signals.recipe_updated.emit(updated_recipe.id)
             self._display_save_message(
                 f"Recipe '{updated_recipe.recipe_name}' updated successfully!",
                 success=True
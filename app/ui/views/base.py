@@ -20,6 +20,11 @@ class BaseView(QWidget):
         self.setObjectName("BaseView")
         self._setup_scroll_layout()
 
+        # services kept for the life of the view, by service class; closed together on destroy
+        self._owned_services = {}
+        owned = self._owned_services  # the slot must not reference self
+        self.destroyed.connect(lambda *_: [service.close() for service in owned.values()])
+
     def _setup_scroll_layout(self):
         """Setup the standard scroll layout - same for all views."""
         self.lyt_main, self.scroll_area, self.scroll_content, self.scroll_layout = \
@@ -33,6 +38,21 @@ class BaseView(QWidget):
         """Override in subclasses if signal connections are needed."""
         pass
 
+    def own_service(self, service):
+        """Keep a service for the life of this view.
+
+        The service's session is reported as owned by the view (not leaked) and is
+        closed when the view is destroyed, e.g. when an idle page is reclaimed. Owning
+        another service of the same class replaces (and closes) the previous one, so
+        views that rebuild their service on reload do not accumulate sessions.
+        """
+        previous = self._owned_services.get(type(service))
+        if previous is not None and previous is not service:
+            previous.close()
+        service.claim(type(self).__name__)
+        self._owned_services[type(service)] = service
+        return service
+
     def setContentLayout(self, layout):
         """Replace the default scroll layout with a custom layout (e.g., FlowLayout)."""
         # Remove the old layout if it exists
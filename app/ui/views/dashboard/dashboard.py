@@ -5,7 +5,6 @@ relevant information about meal planning, recipes, and shopping lists.
 """
 
 # ── Imports ──────────────────────────────────────────────────────────────────────────────────
-from datetime import datetime, timedelta
 from typing import List, Optional
 
 from PySide6.QtCore import Qt
@@ -14,7 +13,7 @@ from PySide6.QtWidgets import (QGridLayout, QHBoxLayout, QLabel, QSizePolicy,
 
 from _dev_tools import DebugLogger
 from app.core.database.db import DatabaseSession
-from app.core.dtos.recipe_dtos import RecipeFilterDTO
+from app.core.dtos.recipe_dtos import RecipeFilterDTO, RecipeSnapshotDTO
 from app.core.models import Recipe
 from app.core.services import PlannerService, RecipeService, ShoppingService
 from app.style.icon.config import Name, Type
@@ -23,9 +22,13 @@ from app.ui.components.layout.card import Card
 from app.ui.components.layout.flow_layout import FlowLayoutContainer
 from app.ui.components.widgets.button import Button
 from app.ui.components.widgets.separator import Separator
+from app.ui.services.startup_orchestrator import StartupOrchestrator
 from app.ui.utils import create_two_column_layout
 from app.ui.views.base import BaseView
 
+# ── Constants ──
+MEAL_PREVIEW_LIMIT = 5  # meals shown in the meal plan preview card
+
 
 # ── Dashboard ────────────────────────────────────────────────────────────────────────────────
 class Dashboard(BaseView):
@@ -40,23 +43,28 @@ class Dashboard(BaseView):
         # Store navigation service
         self.navigation_service = navigation_service
 
-        # Initialize services
-        self.recipe_service = RecipeService()
-        self.planner_service = PlannerService()
-        self.shopping_service = ShoppingService()
-
         # Data containers
         self.meal_plan_data = []
+        self.meal_plan_recipes = {}
         self.recent_recipes = []
         self.shopping_summary = None
         self.stats_data = {}
 
+        # Load initial data; during startup the orchestrator fetches it off the GUI thread
+        startup = StartupOrchestrator._get_instance()
+        snapshot = startup.take_dashboard_snapshot()
+        self._awaiting_startup_data = snapshot is None and startup.is_running()
+        if snapshot is not None:
+            self._apply_snapshot(snapshot)
+        elif self._awaiting_startup_data:
+            startup.dashboard_data_ready.connect(self._on_startup_data_ready)
+            startup.finished.connect(self._on_startup_finished)
+        else:
+            self._load_dashboard_data()
+
         # Build UI
         self._build_ui()
 
-        # Load initial data
-        self._load_dashboard_data()
-
     def _build_ui(self):
         """Build the dashboard UI layout."""
 
@@ -189,7 +197,7 @@ class Dashboard(BaseView):
         else:
             # Display meal cards
             days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-            for i, recipe_id in enumerate(self.meal_plan_data[:5]):  # Show max 5
+            for i, recipe_id in enumerate(self.meal_plan_data[:MEAL_PREVIEW_LIMIT]):
                 if recipe_id:
                     recipe = self._get_recipe_by_id(recipe_id)
                     if recipe:
@@ -317,89 +325,38 @@ class Dashboard(BaseView):
 
     def _load_dashboard_data(self):
         """Load all data needed for dashboard display."""
-        try:
-            with DatabaseSession() as session:
-                # Initialize services with session
-                recipe_service = RecipeService(session)
-                planner_service = PlannerService(session)
-                shopping_service = ShoppingService(session)
-
-                # Load meal plan
-                self.meal_plan_data = planner_service.load_saved_meal_ids()
-                DebugLogger.log(f"Loaded {len(self.meal_plan_data)} meal IDs", "info")
-
-                # Load recent recipes
-                filter_dto = RecipeFilterDTO(
-                    sort_by="created_at",
-                    sort_order="desc",
-                    limit=6
-                )
-                self.recent_recipes = recipe_service.list_filtered(filter_dto)
-                DebugLogger.log(f"Loaded {len(self.recent_recipes)} recent recipes", "info")
-
-                # Load shopping list summary
-                shopping_list = shopping_service.get_shopping_list()
-                if shopping_list:
-                    self.shopping_summary = {
-                        "total_items": shopping_list.total_items,
-                        "checked_items": shopping_list.checked_items,
-                        "categories": shopping_list.categories or {}
-                    }
-
-                # Calculate statistics
-                self._calculate_statistics(recipe_service)
-
-        except Exception as e:
-            DebugLogger.log(f"Error loading dashboard data: {e}", "error")
-            # Initialize with empty data
-            self.meal_plan_data = []
-            self.recent_recipes = []
-            self.shopping_summary = None
-            self.stats_data = {}
-
-    def _calculate_statistics(self, recipe_service: RecipeService):
-        """Calculate recipe statistics."""
-        try:
-            # Get all recipes
-            all_recipes_dto = RecipeFilterDTO()
-            all_recipes = recipe_service.list_filtered(all_recipes_dto)
-
-            # Total recipes
-            self.stats_data["total_recipes"] = len(all_recipes)
-
-            # Favorites
-            fav_dto = RecipeFilterDTO(is_favorite=True)
-            favorites = recipe_service.list_filtered(fav_dto)
-            self.stats_data["favorites"] = len(favorites)
-
-            # This week's recipes
-            week_ago = datetime.now() - timedelta(days=7)
-            week_count = sum(1 for r in all_recipes
-                           if r.created_at and r.created_at >= week_ago)
-            self.stats_data["this_week"] = week_count
-
-            # Average cooking time
-            cook_times = [r.total_time for r in all_recipes if r.total_time and r.total_time > 0]
-            if cook_times:
-                self.stats_data["avg_time"] = int(sum(cook_times) / len(cook_times))
-            else:
-                self.stats_data["avg_time"] = 0
-
-        except Exception as e:
-            DebugLogger.log(f"Error calculating statistics: {e}", "error")
-            self.stats_data = {
-                "total_recipes": 0,
-                "favorites": 0,
-                "this_week": 0,
-                "avg_time": 0
-            }
-
-    def _get_recipe_by_id(self, recipe_id: int) -> Optional[Recipe]:
-        """Get a recipe by ID."""
+        self._apply_snapshot(fetch_dashboard_snapshot())
+
+    def _apply_snapshot(self, snapshot: dict):
+        """Copy a snapshot from fetch_dashboard_snapshot() into the view's data containers."""
+        self.meal_plan_data = snapshot["meal_plan_data"]
+        self.meal_plan_recipes = snapshot["meal_plan_recipes"]
+        self.recent_recipes = snapshot["recent_recipes"]
+        self.shopping_summary = snapshot["shopping_summary"]
+        self.stats_data = snapshot["stats_data"]
+
+    def _on_startup_data_ready(self, snapshot: dict):
+        """Populate the dashboard with data fetched by the startup orchestrator."""
+        DebugLogger.log("Applying dashboard data from startup warm-up", "info")
+        StartupOrchestrator._get_instance().take_dashboard_snapshot()  # consumed here
+        self._awaiting_startup_data = False
+        self._apply_snapshot(snapshot)
+        self._rebuild_ui()
+
+    def _on_startup_finished(self):
+        """Fall back to a synchronous load if the warm-up produced no dashboard data."""
+        if self._awaiting_startup_data:
+            self._awaiting_startup_data = False
+            self._refresh_dashboard()
+
+    def _get_recipe_by_id(self, recipe_id: int) -> Optional[Recipe | RecipeSnapshotDTO]:
+        """Get a recipe by ID, preferring the copy prefetched with the snapshot."""
+        if recipe_id in self.meal_plan_recipes:
+            return self.meal_plan_recipes[recipe_id]
         try:
             with DatabaseSession() as session:
                 recipe_service = RecipeService(session)
-                return recipe_service.get_recipe(recipe_id)
+                return recipe_service.get_recipe_snapshot(recipe_id)
         except Exception as e:
             DebugLogger.log(f"Error fetching recipe {recipe_id}: {e}", "error")
             return None
@@ -422,7 +379,10 @@ class Dashboard(BaseView):
 
         # Reload data
         self._load_dashboard_data()
+        self._rebuild_ui()
 
+    def _rebuild_ui(self):
+        """Clear and rebuild the UI from the current data containers."""
         # Clear existing UI
         while self.content_layout.count():
             item = self.content_layout.takeAt(0)
@@ -436,4 +396,81 @@ class Dashboard(BaseView):
     def showEvent(self, event):
         """Refresh dashboard data when shown."""
         super().showEvent(event)
+        if self._awaiting_startup_data:
+            return  # first paint; data arrives via StartupOrchestrator.dashboard_data_ready
         self._refresh_data()
+
+
+# ── Data Loading ─────────────────────────────────────────────────────────────────────────────
+def fetch_dashboard_snapshot() -> dict:
+    """Run every query the dashboard needs and return the results.
+
+    Holds no Qt objects, so it is safe to call from the startup worker thread.
+
+    Returns:
+        dict: meal_plan_data, meal_plan_recipes, recent_recipes, shopping_summary and stats_data.
+    """
+    snapshot = {
+        "meal_plan_data": [],
+        "meal_plan_recipes": {},
+        "recent_recipes": [],
+        "shopping_summary": None,
+        "stats_data": {},
+    }
+    try:
+        with DatabaseSession() as session:
+            # Initialize services with session
+            recipe_service = RecipeService(session)
+            planner_service = PlannerService(session)
+            shopping_service = ShoppingService(session)
+
+            # Load meal plan
+            snapshot["meal_plan_data"] = planner_service.load_saved_meal_ids()
+            DebugLogger.log(f"Loaded {len(snapshot['meal_plan_data'])} meal IDs", "info")
+
+            # Prefetch the recipes shown in the meal plan preview
+            for recipe_id in snapshot["meal_plan_data"][:MEAL_PREVIEW_LIMIT]:
+                if recipe_id:
+                    snapshot["meal_plan_recipes"][recipe_id] = recipe_service.get_recipe_snapshot(recipe_id)
+
+            # Load recent recipes
+            filter_dto = RecipeFilterDTO(
+                sort_by="created_at",
+                sort_order="desc",
+                limit=6
+            )
+            snapshot["recent_recipes"] = recipe_service.list_filtered(filter_dto)
+            DebugLogger.log(f"Loaded {len(snapshot['recent_recipes'])} recent recipes", "info")
+
+            # Load shopping list summary
+            shopping_list = shopping_service.get_shopping_list()
+            if shopping_list:
+                snapshot["shopping_summary"] = {
+                    "total_items": shopping_list.total_items,
+                    "checked_items": shopping_list.checked_items,
+                    "categories": shopping_list.categories or {}
+                }
+
+            # Calculate statistics
+            snapshot["stats_data"] = _calculate_statistics(recipe_service)
+
+    except Exception as e:
+        DebugLogger.log(f"Error loading dashboard data: {e}", "error")
+        # Fall back to empty data
+        snapshot.update(meal_plan_data=[], meal_plan_recipes={}, recent_recipes=[],
+                        shopping_summary=None, stats_data={})
+
+    return snapshot
+
+def _calculate_statistics(recipe_service: RecipeService) -> dict:
+    """Return recipe statistics (aggregated in SQL and cached by the service)."""
+    try:
+        return recipe_service.get_stats().model_dump()
+    except Exception as e:
+        DebugLogger.log(f"Error calculating statistics: {e}", "error")
+        return {
+            "total_recipes": 0,
+            "favorites": 0,
+            "this_week": 0,
+            "avg_time": 0
+        }
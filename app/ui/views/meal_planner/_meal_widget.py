@@ -3,7 +3,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
 
 from _dev_tools import DebugLogger
-from app.core.dtos import MealSelectionCreateDTO, MealSelectionUpdateDTO
+from app.core.dtos import MealSelectionCreateDTO, MealSelectionResponseDTO, MealSelectionUpdateDTO
 from app.core.models import MealSelection
 from app.core.services import PlannerService, RecipeService
 from app.core.utils import (
@@ -33,8 +33,8 @@ class MealWidget(QWidget):
     def __init__(self, planner_service: PlannerService, parent=None):
         super().__init__(parent)
         self.planner_service = planner_service
-        self.recipe_service = RecipeService() # for loading recipe details
         self._meal_model: MealSelection | None = None
+        self._saved_fields: dict | None = None  # DTO fields as last loaded/saved, to skip no-op saves
         self.meal_slots = {}
         self.tooltip_filter = create_tooltip_event_filter()
 
@@ -121,7 +121,8 @@ class MealWidget(QWidget):
         # fetch recipe and update the slot UI, but block signals to avoid recursion
         slot = self.meal_slots.get(key)
         if slot is not None:
-            recipe = self.recipe_service.get_recipe(recipe_id)
+            with RecipeService() as recipe_service:
+                recipe = recipe_service.get_recipe_snapshot(recipe_id)
             slot.blockSignals(True)
             slot.set_recipe(recipe)
             slot.blockSignals(False)
@@ -184,6 +185,7 @@ class MealWidget(QWidget):
         if result:
             # Update local model
             setattr(self._meal_model, f"side_recipe_{slot_number}_id", None)
+            self._saved_fields = self._create_dto_fields()
 
             # Clear the card display
             slot = self.meal_slots.get(key)
@@ -217,15 +219,19 @@ class MealWidget(QWidget):
             return
 
         dto_fields = self._create_dto_fields()
+        if self._meal_model.id is not None and dto_fields == self._saved_fields:
+            return  # nothing changed since the last load/save
 
         if self._meal_model.id is None:
             create_dto = MealSelectionCreateDTO(**dto_fields)
             response_dto = self.planner_service.create_meal_selection(create_dto)
             if response_dto:
                 self._meal_model.id = response_dto.id
+                self._saved_fields = dto_fields
         else:
             update_dto = MealSelectionUpdateDTO(**dto_fields)
-            self.planner_service.update_meal_selection(self._meal_model.id, update_dto)
+            if self.planner_service.update_meal_selection(self._meal_model.id, update_dto):
+                self._saved_fields = dto_fields
 
     @error_boundary(fallback=None, logger_func=DebugLogger.log)
     def load_meal(self, meal_id: int):
@@ -253,6 +259,21 @@ class MealWidget(QWidget):
             )
             return
 
+        with RecipeService() as recipe_service:
+            self._apply_meal(response_dto, recipe_service.get_recipe_snapshot)
+
+    def load_prefetched(self, meal: MealSelectionResponseDTO, recipes: dict) -> None:
+        """
+        Populate the RecipeViewers from a meal loaded with the rest of the plan.
+
+        Args:
+            meal (MealSelectionResponseDTO): The meal selection to show.
+            recipes (dict): Prefetched recipes by ID (see PlannerService.load_saved_meal_plan).
+        """
+        self._apply_meal(meal, recipes.get)
+
+    def _apply_meal(self, response_dto: MealSelectionResponseDTO, get_recipe) -> None:
+        """Build the meal model from a response DTO and fill the slots via `get_recipe`."""
         self._meal_model = MealSelection(
             id=response_dto.id,
             meal_name=response_dto.meal_name,
@@ -263,12 +284,17 @@ class MealWidget(QWidget):
         )
 
         # Load Recipes
-        self._load_main_recipe()
-        self._load_side_recipes()
+        self._load_main_recipe(get_recipe)
+        self._load_side_recipes(get_recipe)
+        # snapshot after loading: the main recipe may have renamed a "Custom Meal"
+        self._saved_fields = {
+            **self._create_dto_fields(),
+            "meal_name": response_dto.meal_name,
+        }
 
-    def _load_main_recipe(self):
+    def _load_main_recipe(self, get_recipe):
         """Load main recipe into the main slot."""
-        main = self.recipe_service.get_recipe(self._meal_model.main_recipe_id)
+        main = get_recipe(self._meal_model.main_recipe_id)
         self.main_slot.set_recipe(main)
 
         # Update meal name to main recipe name and emit signal if meal name is still "Custom Meal"
@@ -276,9 +302,9 @@ class MealWidget(QWidget):
             self._meal_model.meal_name = main.recipe_name
             self.meal_name_changed.emit(main.recipe_name)
 
-    def _load_side_recipes(self):
+    def _load_side_recipes(self, get_recipe):
         """Load side recipes into their respective slots."""
         for idx in range(1, SIDE_SLOT_COUNT + 1):
             rid = getattr(self._meal_model, f"side_recipe_{idx}_id")
-            recipe = self.recipe_service.get_recipe(rid) if rid else None
+            recipe = get_recipe(rid) if rid else None
             self.meal_slots[f"side{idx}"].set_recipe(recipe)
@@ -14,6 +14,7 @@ from app.core.services import PlannerService
 from app.core.utils import error_boundary, safe_execute_with_fallback
 from app.style.icon import AppIcon, Icon
 from app.ui.components.composite.recipe_card import LARGE_SIZE
+from app.ui.services.startup_orchestrator import StartupOrchestrator
 from app.ui.utils import apply_object_name_pattern
 from app.ui.views.base import BaseView
 from ._meal_widget import MealWidget
@@ -37,7 +38,7 @@ class MealPlanner(BaseView):
     def __init__(self, parent=None, navigation_service=None):
         super().__init__(parent)
         # Initialize PlannerService
-        self.planner_service = PlannerService()
+        self.planner_service = self.own_service(PlannerService())
         self.navigation_service = navigation_service
 
         self._setup_widget_properties()
@@ -57,6 +58,18 @@ class MealPlanner(BaseView):
         from app.ui.utils import global_signals
         global_signals.recipe_deleted.connect(self._on_recipe_deleted)
 
+        # orphaned meals are pruned in the background at startup; reload if any were removed
+        startup = StartupOrchestrator._get_instance()
+        if startup.is_running():
+            startup.meal_plan_pruned.connect(self._on_meal_plan_pruned)
+
+    def _on_meal_plan_pruned(self, removed: int):
+        """Reload the tabs if startup pruning removed meals this page already shows."""
+        if removed:
+            for widget in self.tab_map.values():
+                widget._meal_model = None
+            self._refresh_meal_tabs()
+
     def _on_recipe_deleted(self, recipe_id: int):
         """Handle when a recipe is deleted elsewhere in the app."""
         DebugLogger.log(f"[MealPlanner] Recipe {recipe_id} was deleted, refreshing tabs", "info")
@@ -83,65 +96,14 @@ class MealPlanner(BaseView):
         self.tab_map.clear()
 
         # Reload from database - only meals that still exist
-        meal_ids = self.planner_service.load_saved_meal_ids()
-        DebugLogger.log(f"[MealPlanner] Reloading {len(meal_ids)} meals after recipe deletion", "info")
-
-        # Filter out any meal IDs that no longer exist in the database
-        valid_meal_ids = []
-        for meal_id in meal_ids:
-            if self.planner_service.get_meal_selection(meal_id):
-                valid_meal_ids.append(meal_id)
-            else:
-                DebugLogger.log(f"[MealPlanner] Meal {meal_id} no longer exists, skipping", "info")
-
-        for meal_id in valid_meal_ids:
-            self._add_meal_tab(meal_id=meal_id)
-
-        # If no meals remain, add an empty one
-        if not valid_meal_ids:
-            self._add_meal_tab()
-
-        # Update the saved meal plan to remove deleted meals
-        if len(valid_meal_ids) != len(meal_ids):
-            self.planner_service.saveMealPlan(valid_meal_ids)
+        DebugLogger.log("[MealPlanner] Reloading meals after recipe deletion", "info")
+        self._restore_meal_plan()
 
         # Restore tab selection (or go to first if out of range)
         max_valid_index = self.meal_tabs.count() - 2  # -1 for 0-index, -1 for '+' tab
         new_index = min(current_index, max(0, max_valid_index))
         self.meal_tabs.setCurrentIndex(new_index)
 
-    def _cleanup_orphaned_meals(self):
-        """Remove meal selections that reference deleted recipes."""
-        try:
-            from app.core.services import RecipeService
-            recipe_service = RecipeService()
-
-            meal_ids = self.planner_service.load_saved_meal_ids()
-            valid_ids = []
-
-            for meal_id in meal_ids:
-                meal = self.planner_service.get_meal_selection(meal_id)
-                if meal and meal.main_recipe_id:
-                    # Check if main recipe exists
-                    recipe = recipe_service.get_recipe(meal.main_recipe_id)
-                    if recipe:
-                        valid_ids.append(meal_id)
-                    else:
-                        # Main recipe was deleted, delete this meal selection
-                        DebugLogger.log(f"[MealPlanner] Removing orphaned meal {meal_id} (recipe {meal.main_recipe_id} deleted)", "info")
-                        self.planner_service.delete_meal_selection(meal_id)
-                elif meal and not meal.main_recipe_id:
-                    # Meal exists but has no main recipe (SET NULL happened)
-                    DebugLogger.log(f"[MealPlanner] Removing meal {meal_id} with no main recipe", "info")
-                    self.planner_service.delete_meal_selection(meal_id)
-
-            # Update saved meal plan if we removed any
-            if len(valid_ids) != len(meal_ids):
-                self.planner_service.saveMealPlan(valid_ids)
-
-        except Exception as e:
-            DebugLogger.log(f"[MealPlanner] Error cleaning up orphaned meals: {e}", "error")
-
     def _build_ui(self):
         """Build the main UI layout using consistent scroll pattern."""
         # Create meal tabs widget
@@ -174,30 +136,45 @@ class MealPlanner(BaseView):
         """Initialize UI by adding the '+' tab and loading saved meals."""
         self._new_meal_tab()  # add the "+" tab (used to add new meals)
 
-        def _load_saved_meals():
-            # Clean up any orphaned meals first
-            self._cleanup_orphaned_meals()
-
-            meal_ids = self.planner_service.load_saved_meal_ids()
-            DebugLogger.log(f"[MealPlanner] Restoring saved meal IDs: {meal_ids}", "info")
-
-            for meal_id in meal_ids:
-                self._add_meal_tab(meal_id=meal_id)
-
-            if not meal_ids:
-                self._add_meal_tab()
-
         # Use safe_execute_with_fallback to handle errors gracefully
         safe_execute_with_fallback(
-            _load_saved_meals,
+            self._restore_meal_plan,
             fallback=lambda: self._add_meal_tab(),  # fallback to empty tab
             error_context="meal_planner_initialization",
             logger_func=DebugLogger.log
         )
 
-    def _add_meal_tab(self, meal_id: int = None):
+    def _restore_meal_plan(self):
+        """Add a tab for every saved meal, loaded in bulk rather than one lookup per tab."""
+        plan = self.planner_service.load_saved_meal_plan()
+        DebugLogger.log(
+            f"[MealPlanner] Restoring saved meal IDs: {[meal.id for meal in plan.meals]}", "info"
+        )
+
+        for meal in plan.meals:
+            self._add_meal_tab(meal=meal, recipes=plan.recipes)
+
+        if not plan.meals:
+            self._add_meal_tab()
+
+        # Update the saved meal plan to remove meals that no longer exist
+        if plan.missing_meal_ids:
+            DebugLogger.log(f"[MealPlanner] Dropping missing meals {plan.missing_meal_ids}", "info")
+            self.planner_service.saveMealPlan([meal.id for meal in plan.meals])
+
+    def _add_meal_tab(self, meal_id: int = None, meal=None, recipes: dict = None):
+        """
+        Insert a meal tab before the '+' tab.
+
+        Args:
+            meal_id (int, optional): ID of a saved meal to load.
+            meal (MealSelectionResponseDTO, optional): Prefetched meal; takes precedence over `meal_id`.
+            recipes (dict, optional): Prefetched recipes by ID for `meal`.
+        """
         widget = MealWidget(self.planner_service)
-        if meal_id:
+        if meal is not None:
+            widget.load_prefetched(meal, recipes or {})
+        elif meal_id:
             widget.load_meal(meal_id)
 
         # Connect recipe selection signal
@@ -267,8 +244,8 @@ class MealPlanner(BaseView):
 
         # Navigate to RecipeBrowser in selection mode
         if self.navigation_service:
-            # Get the RecipeBrowser instance from navigation service
-            recipe_browser = self.navigation_service.page_instances.get("browse_recipes")
+            # Get the RecipeBrowser instance from navigation service (built on demand)
+            recipe_browser = self.navigation_service.get_page("browse_recipes")
             if recipe_browser:
                 # Set to selection mode and connect to finish handler
                 recipe_browser.selection_mode = True
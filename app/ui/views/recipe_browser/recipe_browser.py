@@ -36,7 +36,7 @@ class RecipeBrowser(BaseView):
         self.setObjectName("RecipeBrowser")
         self.card_size = card_size
         self._selection_mode = selection_mode  # if True, cards are clickable for selection
-        self.recipe_service = RecipeService()
+        self.recipe_service = self.own_service(RecipeService())
         self.recipes_loaded = False
         self.navigation_service = navigation_service
 
@@ -235,8 +235,9 @@ class RecipeBrowser(BaseView):
             return
 
         try:
-            service = RecipeService()
-            if service.delete_recipe(recipe_id):
+            with RecipeService() as service:
+                deleted = service.delete_recipe(recipe_id)
+            if deleted:
                 # Emit global signal BEFORE refreshing local view
                 from app.ui.utils import global_signals
                 global_signals.recipe_deleted.emit(recipe_id)
@@ -0,0 +1,221 @@
+"""app/ui/views/shopping_list/_shopping_model.py
+
+This module defines the ShoppingListModel, a two-level item model (categories -> items)
+backing the shopping list view.
+
+Toggling an item updates the model in place, emits `dataChanged` for that row and its
+category header only, and queues the database write on the ShoppingWriteQueue, so the
+cost of a toggle does not depend on the size of the list.
+"""
+
+# ── Imports ──
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt, Signal
+
+from app.core.dtos.shopping_dtos import ItemStatusWriteDTO
+from app.ui.services.shopping_write_queue import ShoppingWriteQueue
+
+# ── Roles ──
+ItemRole = Qt.UserRole + 1      # the ShoppingItem model object
+CountRole = Qt.UserRole + 2     # (checked, total) for category rows
+IsCategoryRole = Qt.UserRole + 3
+
+
+@dataclass
+class _ItemNode:
+    item: Any
+    have: bool
+    text: str
+    tooltip: Optional[str] = None  # built on the first ToolTipRole request
+
+
+@dataclass
+class _CategoryNode:
+    name: str
+    items: list[_ItemNode] = field(default_factory=list)
+    checked: int = 0
+
+
+class ShoppingListModel(QAbstractItemModel):
+    """Item model with category rows at the top level and shopping items beneath them.
+
+    Item indexes carry their category row + 1 as internal ID (0 marks a category),
+    so parent lookups need no per-node objects.
+    """
+
+    itemChecked = Signal(str, bool)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._categories: list[_CategoryNode] = []
+        self._breakdown_map: dict = {}
+
+    # ── Loading ──
+    def load(self, sections: list[tuple[str, list]], breakdown_map: dict) -> None:
+        """
+        Replace the model contents.
+
+        Args:
+            sections (list[tuple[str, list]]): (category name, ShoppingItem models) in display order.
+            breakdown_map (dict): Recipe breakdown by item key, used for tooltips.
+        """
+        queue = ShoppingWriteQueue._get_instance()
+        self.beginResetModel()
+        self._breakdown_map = breakdown_map or {}
+        self._categories = []
+        for name, items in sections:
+            category = _CategoryNode(name)
+            for item in items:
+                have = queue.have(item.id, item.have)
+                unit_display = f" {item.unit}" if item.unit else ""
+                text = f"{item.ingredient_name}: {item.formatted_quantity()}{unit_display}"
+                category.items.append(_ItemNode(item, have, text))
+                category.checked += have
+            self._categories.append(category)
+        self.endResetModel()
+
+    # ── Structure ──
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row >= len(self._categories):
+                return QModelIndex()
+            return self.createIndex(row, 0, 0)
+        if parent.internalId() != 0 or row >= len(self._categories[parent.row()].items):
+            return QModelIndex()
+        return self.createIndex(row, 0, parent.row() + 1)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._categories)
+        if parent.internalId() == 0:
+            return len(self._categories[parent.row()].items)
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.internalId() == 0:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    # ── Data ──
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        if index.internalId() == 0:
+            category = self._categories[index.row()]
+            if role == Qt.DisplayRole:
+                return category.name
+            if role == CountRole:
+                return category.checked, len(category.items)
+            if role == IsCategoryRole:
+                return True
+            return None
+
+        node = self._node(index)
+        if role == Qt.DisplayRole:
+            return node.text
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if node.have else Qt.Unchecked
+        if role == Qt.ToolTipRole:
+            return self._tooltip(node) or None
+        if role == ItemRole:
+            return node.item
+        if role == IsCategoryRole:
+            return False
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        """Set an item's check state, queueing the database write."""
+        if role != Qt.CheckStateRole or not index.isValid() or index.internalId() == 0:
+            return False
+        checked = value if isinstance(value, bool) else Qt.CheckState(value) == Qt.Checked
+        if not self._set_have(index.internalId() - 1, index.row(), checked):
+            return True
+
+        node = self._node(index)
+        ShoppingWriteQueue._get_instance().enqueue([self._status_write(node)])
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        category_index = self.parent(index)
+        self.dataChanged.emit(category_index, category_index, [CountRole])
+        self.itemChecked.emit(node.item.ingredient_name, checked)
+        return True
+
+    def setCategoryChecked(self, category_row: int, checked: bool) -> None:
+        """Check or uncheck every item in a category with one batched write."""
+        category = self._categories[category_row]
+        changed = [row for row in range(len(category.items)) if self._set_have(category_row, row, checked)]
+        if not changed:
+            return
+
+        ShoppingWriteQueue._get_instance().enqueue(
+            [self._status_write(category.items[row]) for row in changed], immediate=True
+        )
+        category_index = self.index(category_row, 0)
+        self.dataChanged.emit(
+            self.index(changed[0], 0, category_index),
+            self.index(changed[-1], 0, category_index),
+            [Qt.CheckStateRole]
+        )
+        self.dataChanged.emit(category_index, category_index, [CountRole])
+        for row in changed:
+            self.itemChecked.emit(category.items[row].item.ingredient_name, checked)
+
+    def checkedItems(self) -> list[str]:
+        """Return the names of all checked items."""
+        return [
+            node.item.ingredient_name
+            for category in self._categories
+            for node in category.items if node.have
+        ]
+
+    # ── Internal ──
+    def _node(self, index: QModelIndex) -> _ItemNode:
+        return self._categories[index.internalId() - 1].items[index.row()]
+
+    def _set_have(self, category_row: int, row: int, checked: bool) -> bool:
+        """Update an item's status in memory; returns False if it was unchanged."""
+        category = self._categories[category_row]
+        node = category.items[row]
+        if node.have == checked:
+            return False
+        node.have = checked
+        category.checked += 1 if checked else -1
+        return True
+
+    def _tooltip(self, node: _ItemNode) -> str:
+        if node.tooltip is None:
+            item = node.item
+            parts = self._breakdown_map.get(item.key(), []) if item.source == "recipe" else []
+            if parts:
+                header = f"Used in {len(parts)} recipe(s):"
+                recipe_lines = [f"• {qty} {unit} - {name}" for name, qty, unit in parts]
+                node.tooltip = f"{header}\n" + "\n".join(recipe_lines)
+            else:
+                node.tooltip = ""
+        return node.tooltip
+
+    @staticmethod
+    def _status_write(node: _ItemNode) -> ItemStatusWriteDTO:
+        item = node.item
+        is_recipe = item.source == "recipe"
+        return ItemStatusWriteDTO(
+            item_id=item.id,
+            have=node.have,
+            state_key=item.state_key if is_recipe else None,
+            quantity=item.quantity,
+            unit=item.unit or "",
+        )
@@ -0,0 +1,140 @@
+"""app/ui/views/shopping_list/_shopping_view.py
+
+This module defines the ShoppingListView and its ShoppingItemDelegate. The view shows a
+ShoppingListModel as a tree of collapsible categories, and the delegate paints each
+row's checkbox and label, so the list creates no widgets per item.
+"""
+
+# ── Imports ──
+from PySide6.QtCore import QEvent, QModelIndex, QSize, Qt
+from PySide6.QtGui import QFont, QPalette
+from PySide6.QtWidgets import (QAbstractItemView, QStyle, QStyledItemDelegate, QStyleOptionButton,
+                               QStyleOptionViewItem, QTreeView)
+
+from ._shopping_model import CountRole, IsCategoryRole, ShoppingListModel
+
+# ── Constants ──
+ITEM_ROW_HEIGHT = 40
+CATEGORY_ROW_HEIGHT = 56
+CATEGORY_FONT_SCALE = 4 / 3      # category labels were 32px over 24px items
+CHECKBOX_SIZE = 20
+CHECKBOX_SPACING = 12
+
+
+class ShoppingItemDelegate(QStyledItemDelegate):
+    """Paints category headers and checkbox + label item rows."""
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        height = CATEGORY_ROW_HEIGHT if index.data(IsCategoryRole) else ITEM_ROW_HEIGHT
+        return QSize(option.rect.width(), height)
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex):
+        painter.save()
+        if index.data(IsCategoryRole):
+            self._paint_category(painter, option, index)
+        else:
+            self._paint_item(painter, option, index)
+        painter.restore()
+
+    def _paint_category(self, painter, option, index):
+        font = QFont(option.font)
+        if font.pixelSize() > 0:
+            font.setPixelSize(round(font.pixelSize() * CATEGORY_FONT_SCALE))
+        else:
+            font.setPointSizeF(font.pointSizeF() * CATEGORY_FONT_SCALE)
+        checked, total = index.data(CountRole)
+
+        painter.setFont(font)
+        painter.setPen(option.palette.color(QPalette.Text))
+        painter.drawText(
+            option.rect.adjusted(4, 0, 0, 0),
+            Qt.AlignVCenter | Qt.AlignLeft,
+            f"{index.data(Qt.DisplayRole)}  ({checked}/{total})"
+        )
+
+    def _paint_item(self, painter, option, index):
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        rect = option.rect
+
+        box = QStyleOptionButton()
+        box.rect = rect.adjusted(0, (rect.height() - CHECKBOX_SIZE) // 2, 0, 0)
+        box.rect.setSize(QSize(CHECKBOX_SIZE, CHECKBOX_SIZE))
+        box.state = QStyle.State_Enabled | (QStyle.State_On if checked else QStyle.State_Off)
+        if option.state & QStyle.State_MouseOver:
+            box.state |= QStyle.State_MouseOver
+        style = option.widget.style() if option.widget else None
+        if style is not None:
+            style.drawPrimitive(QStyle.PE_IndicatorCheckBox, box, painter, option.widget)
+
+        font = QFont(option.font)
+        font.setStrikeOut(checked)
+        painter.setFont(font)
+        painter.setPen(option.palette.color(QPalette.Text))
+        painter.drawText(
+            rect.adjusted(CHECKBOX_SIZE + CHECKBOX_SPACING, 0, 0, 0),
+            Qt.AlignVCenter | Qt.AlignLeft,
+            index.data(Qt.DisplayRole)
+        )
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        """Toggle an item on click or Space/Select; category rows are left to the view."""
+        if index.data(IsCategoryRole):
+            return False
+        toggle = (
+            (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton)
+            or (event.type() == QEvent.KeyPress and event.key() in (Qt.Key_Space, Qt.Key_Select))
+        )
+        if not toggle:
+            # swallow the double-click so it does not toggle twice
+            return event.type() == QEvent.MouseButtonDblClick
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        return model.setData(index, not checked, Qt.CheckStateRole)
+
+
+class ShoppingListView(QTreeView):
+    """Tree view of a ShoppingListModel that grows to fit its rows.
+
+    The page scrolls as a whole, so the view sizes itself to its visible rows instead
+    of scrolling internally; its height only changes on load, expand and collapse.
+    """
+
+    def __init__(self, model: ShoppingListModel, parent=None):
+        super().__init__(parent)
+        self.setObjectName("ShoppingListView")
+        self.setModel(model)
+        self.setItemDelegate(ShoppingItemDelegate(self))
+        self.setHeaderHidden(True)
+        self.setUniformRowHeights(False)
+        self.setExpandsOnDoubleClick(False)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setMouseTracking(True)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        self.clicked.connect(self._on_clicked)
+        self.expanded.connect(self._fit_height)
+        self.collapsed.connect(self._fit_height)
+        model.modelReset.connect(self._on_model_reset)
+
+    def setCategoryChecked(self, category_row: int, checked: bool) -> None:
+        """Check or uncheck every item in a category (one batched write)."""
+        self.model().setCategoryChecked(category_row, checked)
+
+    def _on_model_reset(self):
+        self.expandAll()
+        self._fit_height()
+
+    def _on_clicked(self, index: QModelIndex):
+        if index.data(IsCategoryRole):
+            self.setExpanded(index, not self.isExpanded(index))
+
+    def _fit_height(self, *_):
+        model = self.model()
+        height = 0
+        for row in range(model.rowCount()):
+            height += CATEGORY_ROW_HEIGHT
+            category_index = model.index(row, 0)
+            if self.isExpanded(category_index):
+                height += ITEM_ROW_HEIGHT * model.rowCount(category_index)
+        self.setFixedHeight(height + 2 * self.frameWidth())
@@ -14,12 +14,13 @@ from PySide6.QtWidgets import QSizePolicy
 from _dev_tools import DebugLogger
 from app.core.services import ShoppingService
 from app.ui.components.layout.card import ActionCard, Card
+from app.ui.services.shopping_write_queue import ShoppingWriteQueue
 from app.ui.utils import create_two_column_layout
 from app.ui.views.base import BaseView
 
 from ._add_item_form import AddItemForm
-from ._collapsible_category import CollapsibleCategory
-from ._shopping_item import ShoppingItem
+from ._shopping_model import ShoppingListModel
+from ._shopping_view import ShoppingListView
 
 
 class ShoppingList(BaseView):
@@ -84,6 +85,12 @@ class ShoppingList(BaseView):
         # Ensure the card can expand its height based on content
         list_container.expandHeight(False)  # Don't force expansion, let content determine
 
+        # one model/view for every category; loads reset the model instead of rebuilding widgets
+        self.list_model = ShoppingListModel(self)
+        self.list_view = ShoppingListView(self.list_model)
+        self.list_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        list_container.addWidget(self.list_view)
+
         return list_container
 
     def _create_entry_card(self) -> ActionCard:
@@ -116,14 +123,14 @@ class ShoppingList(BaseView):
 
             # add manual item via service with DTO
             from app.core.dtos.shopping_dtos import ManualItemCreateDTO
-            svc = ShoppingService()
             dto = ManualItemCreateDTO(
                 ingredient_name=name,
                 quantity=qty,
                 unit=unit,
                 category=category
             )
-            svc.add_manual_item(dto)
+            with ShoppingService() as svc:
+                svc.add_manual_item(dto)
             self.add_item_form.le_item_name.clear()
             self.add_item_form.le_item_qty.clear()
             self.add_item_form.cb_item_unit.clearSelection()
@@ -135,7 +142,7 @@ class ShoppingList(BaseView):
 
     def _render_category_columns(self, grouped: dict, manual_items: list) -> None:
         """
-        Renders all category sections in a single column using CollapsibleCategory widgets.
+        Loads all category sections into the shopping list model, manual entries last.
 
         Args:
             grouped (dict): Dict of {category: [ShoppingItem]}
@@ -145,29 +152,7 @@ class ShoppingList(BaseView):
         if manual_items:
             all_sections.append(("Manual Entries", manual_items))
 
-        for category, items in all_sections:
-            category_widget = self._build_category_section(category, items)
-
-            # Ensure category widgets can expand properly
-            category_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-
-            self.list_container.addWidget(category_widget)
-
-    def _build_category_section(self, title: str, items: list) -> CollapsibleCategory:
-        """Creates a CollapsibleCategory widget and populates it with ShoppingItem widgets."""
-        # Start with categories expanded by default
-        category_widget = CollapsibleCategory(title, start_expanded=True)
-
-        # Ensure we have a shopping service
-        shopping_svc = getattr(self, 'shopping_svc', None)
-        # Ensure we have a breakdown map
-        breakdown_map = getattr(self, '_breakdown_map', {})
-
-        for item in items:
-            item_widget = ShoppingItem(item, shopping_svc, breakdown_map)
-            category_widget.addShoppingItem(item_widget)
-
-        return category_widget
+        self.list_model.load(all_sections, getattr(self, '_breakdown_map', {}))
 
     def loadShoppingList(self, recipe_ids: list[int]):
         """
@@ -179,18 +164,19 @@ class ShoppingList(BaseView):
         self.active_recipe_ids = recipe_ids  # store active recipe IDs
         DebugLogger.log(f"ShoppingList.loadShoppingList: recipe_ids={recipe_ids}", "debug")
 
-        # Clear current shopping container content
-        self.list_container.clear()
+        # land queued checkbox toggles first; regeneration restores them from shopping states
+        ShoppingWriteQueue._get_instance().flush()
 
         # generate/update shopping list in database
-        shopping_svc = ShoppingService()
+        # replaces (and closes) the previous service, whose items were just cleared
+        shopping_svc = self.own_service(ShoppingService())
         self.shopping_svc = shopping_svc
         shopping_svc.generate_shopping_list(recipe_ids)
         # fetch all shopping items (models) for display
         ingredients = shopping_svc.shopping_repo.get_all_shopping_items()
         DebugLogger.log(f"ShoppingList.load_shopping_list: fetched {len(ingredients)} items", "debug")
-        # get raw breakdown mapping for tooltips
-        self._breakdown_map = shopping_svc.shopping_repo.get_ingredient_breakdown(recipe_ids)
+        # breakdown mapping for tooltips, cached by the aggregation above
+        self._breakdown_map = shopping_svc.get_breakdown_map(recipe_ids)
 
         # Initialize empty breakdown map if None
         if self._breakdown_map is None:
@@ -207,11 +193,4 @@ class ShoppingList(BaseView):
                 category = item.category or "Other"
                 grouped[category].append(item)
 
-        if hasattr(self, 'scroll_area'):
-            self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
         self._render_category_columns(grouped, manual_items) # render the list
-
-        # Force the scroll area to update its size after loading content
-        if hasattr(self, 'scroll_area'):
-            self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -18,9 +18,6 @@ qframelesswindow.utils.win32_utils.isSystemBorderAccentEnabled = lambda: False
 from dotenv import load_dotenv
 
 from _dev_tools import DebugLogger, startup_timer
-from app.style.theme_controller import Mode, Theme
-from app.ui.main_window.main_window import MainWindow
-from app.ui.services.navigation_service import NavigationService
 
 if "--reset" in sys.argv:
         pass
@@ -58,9 +55,32 @@ else:
     DebugLogger.log("Starting MealGenie application...\n", "info")
 
 
+    # the window stack is imported only on the GUI path; views and services load lazily
+    from app.style.theme_controller import Mode, Theme
+    from app.ui.main_window.main_window import MainWindow
+    from app.ui.services.navigation_service import NavigationService
+    from app.ui.services.startup_orchestrator import StartupOrchestrator
+
     # ── Custom Color Map ──
     Theme.setCustomColorMap("app/style/theme/material-theme.json", Mode.DARK)
 
+    # ── Background Warm-up ──
+    # DB warm-up, meal plan pruning, the first dashboard query and image prewarm run on a worker thread;
+    # views built meanwhile (the dashboard) receive their data through signals.
+    startup = StartupOrchestrator._get_instance()
+    app.aboutToQuit.connect(startup.wait)
+    startup.start()
+
+    # ── Shopping Write Queue ──
+    # checkbox toggles are written behind; flush what is still queued before exit
+    from app.ui.services.shopping_write_queue import ShoppingWriteQueue
+    app.aboutToQuit.connect(ShoppingWriteQueue._get_instance().shutdown)
+
+    # ── Session Leak Report ──
+    # sessions still open at shutdown that no page claimed are logged with their origin
+    from app.core.services.session_manager import report_open_sessions
+    app.aboutToQuit.connect(report_open_sessions)
+
     navigation_service_factory = NavigationService.create
 
     main_window = MainWindow(
@@ -78,9 +98,10 @@ else:
     main_window.title_bar.update_maximize_icon(False)
 
     # ── Simple QSS Inspector ──
-    # Uncomment the lines below to enable the simple terminal-based QSS inspector
-    from _dev_tools.qss_inspector import enable_qss_inspector
-    inspector = enable_qss_inspector(app, main_window)
+    # Pass --qss-inspector (or set MEALGENIE_QSS_INSPECTOR=1) to enable the terminal-based QSS inspector
+    if "--qss-inspector" in sys.argv or os.environ.get("MEALGENIE_QSS_INSPECTOR") == "1":
+        from _dev_tools.qss_inspector import enable_qss_inspector
+        inspector = enable_qss_inspector(app, main_window)
 
     QApplication.processEvents()  # make sure all pending events are flushed
     startup_timer.StartupTimer.summary("MealGenie startup") # log total startup time
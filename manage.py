@@ -184,5 +184,161 @@ def db_status():
         typer.echo("Make sure the database is running and migrations are applied.", err=True)
         raise typer.Exit(code=1)
 
+@db_app.command("analyze")
+def analyze_db(
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Also print each statement's SQL"),
+):
+    """
+    Run ANALYZE and print the query plan of each repository query.
+
+    Queries that read a whole table are listed at the end; substring searches and
+    unfiltered listings scan by design, anything new in that list is an index regression.
+    """
+    try:
+        from _scripts.query_plans import explain_repository_queries, run_analyze
+    except ImportError as e:
+        typer.echo(f"Error importing query plan module: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        run_analyze()
+        plans = explain_repository_queries()
+    except Exception as e:
+        typer.echo(f"Database connection error: {e}", err=True)
+        typer.echo("Make sure the database is running and migrations are applied.", err=True)
+        raise typer.Exit(code=1)
+
+    scanning = []
+    for plan in plans:
+        typer.echo(f"\n{plan.label}")
+        if plan.error:
+            typer.echo(f"  ! {plan.error}")
+        for statement, lines in plan.statements:
+            if verbose:
+                typer.echo("  " + " ".join(statement.split()))
+            for line in lines:
+                typer.echo(f"    {line}")
+        if plan.scans:
+            scanning.append(plan.label)
+
+    typer.echo(f"\n{len(plans)} repository queries explained")
+    if scanning:
+        typer.echo(f"Full table scans in: {', '.join(scanning)}")
+
+@db_app.command("merge-ingredients")
+def merge_ingredients(
+    threshold: float = typer.Option(0.9, min=0.0, max=1.0, help="Minimum name similarity (0-1) to treat ingredients as duplicates"),
+    apply: bool = typer.Option(False, "--apply", help="Merge the groups (default is a dry run that only lists them)"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
+):
+    """
+    Find near-duplicate ingredients (plurals, case, typos) and merge them into one.
+
+    Within each group of same-category ingredients, the most used one is kept and
+    every recipe link is rewritten to it in a single transaction. A recipe that
+    links two of them keeps one link with the quantities added; links whose units
+    do not add up are listed before anything is applied.
+    """
+    try:
+        from app.core.database.db import DatabaseSession
+        from app.core.services.ingredient_service import IngredientService
+    except ImportError as e:
+        typer.echo(f"Error importing ingredient service: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        with DatabaseSession() as session:
+            service = IngredientService(session)
+            groups = service.find_duplicate_groups(threshold)
+            if not groups:
+                typer.echo(f"No duplicate ingredients at similarity >= {threshold}")
+                return
+
+            mapping = {}
+            for group in groups:
+                canonical = group.canonical
+                typer.echo(f"\n{canonical.ingredient_name} [{canonical.ingredient_category}] (id {canonical.id})")
+                for duplicate in group.duplicates:
+                    typer.echo(f"  <- {duplicate.ingredient_name} (id {duplicate.id})")
+                    mapping[duplicate.id] = canonical.id
+
+            typer.echo(f"\n{len(mapping)} ingredients in {len(groups)} groups")
+            conflicts = service.find_merge_conflicts(mapping)
+            if conflicts:
+                typer.echo(f"\n{len(conflicts)} recipe links will be dropped (units do not add to the kept link):")
+                for conflict in conflicts:
+                    typer.echo(
+                        f"  {conflict.recipe_name}: {conflict.quantity:g} {conflict.unit or ''} "
+                        f"{conflict.ingredient_name} (keeps {conflict.kept_quantity or ''} "
+                        f"{conflict.kept_unit or ''} {conflict.kept_ingredient_name})"
+                    )
+            if not apply:
+                typer.echo("Dry run; re-run with --apply to merge")
+                return
+            if not yes and not typer.confirm("Merge these ingredients?"):
+                typer.echo("Merge cancelled.")
+                return
+
+            result = service.merge_ingredients(mapping)
+    except Exception as e:
+        typer.echo(f"Error merging ingredients: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(
+        f"Merged {result.merged} ingredients: {result.links_rewritten} recipe links rewritten, "
+        f"{result.links_combined} combined into an existing link, {result.links_dropped} dropped"
+    )
+
+@app.command("importtime")
+def import_time(
+    module: str = typer.Option(
+        "app.ui.main_window.main_window",
+        "--module", "-m",
+        help="Module to import (defaults to the window stack main.py loads before showing)"
+    ),
+    top: int = typer.Option(25, help="Number of slowest imports to show"),
+    sort_by: str = typer.Option("cumulative", "--sort", help="Sort by 'cumulative' or 'self' time"),
+):
+    """
+    Audit cold-start import cost using Python's -X importtime report.
+    """
+    if sort_by not in ("cumulative", "self"):
+        typer.echo("--sort must be 'cumulative' or 'self'", err=True)
+        raise typer.Exit(code=1)
+
+    here = Path(__file__).parent.resolve()
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    typer.echo(f"Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd, cwd=here, capture_output=True, text=True)
+
+    # each report line: "import time: <self us> | <cumulative us> | <indented module name>"
+    rows = []
+    errors = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            errors.append(line)
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(parts[0]), int(parts[1]), depth, name.strip()))
+
+    if result.returncode != 0:
+        typer.echo("\n".join(errors), err=True)
+        typer.echo(f"Importing {module} failed (exit code {result.returncode})", err=True)
+        raise typer.Exit(code=result.returncode)
+
+    root_depth = min((depth for _, _, depth, _ in rows), default=0)
+    total_us = sum(cumulative for _, cumulative, depth, _ in rows if depth == root_depth)
+    key = 1 if sort_by == "cumulative" else 0
+    rows.sort(key=lambda row: row[key], reverse=True)
+
+    typer.echo(f"\n{len(rows)} modules imported in {total_us / 1000:.1f}ms\n")
+    typer.echo(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for self_us, cumulative_us, _, name in rows[:top]:
+        typer.echo(f"{self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}  {name}")
+
 if __name__ == "__main__":
     app()